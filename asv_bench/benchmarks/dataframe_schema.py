@@ -1,4 +1,5 @@
 # Airspeed Velocity Benchmarks for pandera
+import numpy as np
 import pandas as pd
 
 from pandera import (
@@ -93,3 +94,29 @@ class Decorators:
         @check_output(self.out_schema)
         def transform_first_arg(self):
             return Decorators.transformer(self.df)
+
+
+def _check_row(row):
+    return row["a"] in {0, 1, 2} or row["b"] != "x"
+
+
+class ElementWiseDataFrameCheck:
+    """
+    Benchmarking element-wise dataframe checks on 1M rows.
+    """
+
+    def setup(self):
+        self.df = pd.DataFrame(
+            {
+                "a": np.arange(1_000_000),
+                "b": np.random.choice(["x", "y"], 1_000_000),
+            }
+        )
+        self.check = Check(_check_row, element_wise=True)
+
+    def time_element_wise_check(self):
+        self.check(self.df)
+
+    def time_dataframe_apply(self):
+        # reference: applying the check function to pd.Series rows
+        self.df.apply(_check_row, axis=1)
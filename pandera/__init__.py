@@ -56,6 +56,7 @@ from .model_components import Field, check, dataframe_check
 from .schema_components import Column, Index, MultiIndex
 from .schema_inference import infer_schema
 from .schemas import DataFrameSchema, SeriesSchema
+from .uniqueness import ApproximateUnique
 from .version import __version__
 
 if platform.system() != "Windows":
@@ -154,6 +155,8 @@ __all__ = [
     # schemas
     "DataFrameSchema",
     "SeriesSchema",
+    # uniqueness
+    "ApproximateUnique",
     # version
     "__version__",
 ]
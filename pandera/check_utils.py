@@ -1,10 +1,12 @@
 """Utility functions for validation."""
 
 from functools import lru_cache
-from typing import NamedTuple, Optional, Tuple, Union
+from typing import Any, NamedTuple, Optional, Tuple, Union
 
 import pandas as pd
 
+from . import derived_arrays
+
 SupportedTypes = NamedTuple(
     "SupportedTypes",
     (
@@ -92,22 +94,44 @@ def is_supported_check_obj(obj):
     return is_table(obj) or is_field(obj)
 
 
+def all_passed(check_obj, check_output) -> bool:
+    """Verifies whether all elements of a boolean check output passed.
+
+    Only pandas Series outputs with the same length as the checked object are
+    considered. The check is a single reduction of the numpy buffer of the
+    output, without any index alignment.
+    """
+    return (
+        isinstance(check_output, pd.Series)
+        and isinstance(check_obj, (pd.Series, pd.DataFrame))
+        and check_output.dtype == bool
+        and len(check_output) == len(check_obj)
+        and bool(check_output.to_numpy().all())
+    )
+
+
 def prepare_series_check_output(
     check_obj: Union[pd.Series, pd.DataFrame],
     check_output: pd.Series,
     ignore_na: bool = True,
     n_failure_cases: Optional[int] = None,
+    failure_case_budget: Any = None,
 ) -> Tuple[pd.Series, pd.Series]:
     """Prepare the check output and failure cases for a Series check output.
 
     check_obj can be a dataframe, since a check function can potentially return
     a Series resulting from applying some check function that outputs a Series.
+
+    If a :class:`~pandera.error_handlers.FailureCaseBudget` is specified, the
+    failure cases of pandas objects are a uniform sample within the budget.
     """
+    if all_passed(check_obj, check_output):
+        return check_output, check_obj.iloc[:0]
     if ignore_na:
         isna = (
             check_obj.isna().all(axis="columns")
             if isinstance(check_obj, pd.DataFrame)
-            else check_obj.isna()
+            else derived_arrays.isna(check_obj)
         )
         try:
             check_output = check_output | isna
@@ -115,7 +139,12 @@ def prepare_series_check_output(
             # convert check_output to numpy for modin compatibility
             check_output = check_output.to_numpy() | isna
 
-    failure_cases = check_obj[~check_output]
+    if failure_case_budget is not None and isinstance(
+        check_obj, (pd.Series, pd.DataFrame)
+    ):
+        failure_cases = failure_case_budget.sample(check_obj, ~check_output)
+    else:
+        failure_cases = check_obj[~check_output]
     if not failure_cases.empty and n_failure_cases is not None:
         # NOTE: this is a hack to support pyspark.pandas and modin, since you
         # can't use groupby on a dataframe with another dataframe
@@ -19,10 +19,14 @@ from typing import (
     no_type_check,
 )
 
+import numpy as np
 import pandas as pd
 
 from . import check_utils, errors
 from . import strategies as st
+from .config import CONFIG
+from .error_handlers import get_failure_case_budget
+from .fingerprints import invalidate_fingerprints
 
 CheckResult = namedtuple(
     "CheckResult",
@@ -101,6 +105,10 @@ class _CheckMeta(type):  # pragma: no cover
 class _CheckBase(metaclass=_CheckMeta):
     """Check base class."""
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        invalidate_fingerprints(self)
+
     def __init__(
         self,
         check_fn: Union[
@@ -138,7 +146,10 @@ class _CheckBase(metaclass=_CheckMeta):
 
             If element_wise is True, fn is applied to each row in
             the dataframe with the signature ``Callable[[pd.Series], bool]``
-            where the series input is a row in the dataframe.
+            where the series input is a row in the dataframe. For speed, fn is
+            first called with the whole dataframe, and then with light-weight
+            rows that support indexing and attribute access by column name,
+            before falling back to ``DataFrame.apply``.
         :param groups: The dict input to the `fn` callable will be constrained
             to the groups specified by `groups`.
         :param groupby: If a string or list of strings is provided, these
@@ -269,6 +280,9 @@ class _CheckBase(metaclass=_CheckMeta):
         self.failure_cases = None
 
         self._statistics = None
+        # the strategy used to apply the element-wise check function, by
+        # dtype of the checked object.
+        self._element_wise_strategies: Dict[Any, str] = {}
 
     @property
     def statistics(self) -> Dict[str, Any]:
@@ -351,6 +365,64 @@ class _CheckBase(metaclass=_CheckMeta):
         groupby_obj = dataframe.groupby(self.groupby)
         return self._format_groupby_input(groupby_obj, self.groups)
 
+    def _apply_element_wise(
+        self,
+        check_fn: Callable,
+        check_obj: Union[SeriesCheckObj, DataFrameCheckObj],
+    ):
+        """Apply an element-wise check function.
+
+        The strategies in :data:`_ELEMENT_WISE_STRATEGIES` are tried in
+        order, and the one that worked is cached per dtype of the checked
+        object, so that later calls start with it.
+        """
+        is_table = check_utils.is_table(check_obj)
+        if not is_table and not check_utils.is_field(check_obj):
+            return check_fn(check_obj)
+        if not isinstance(check_obj, (pd.Series, pd.DataFrame)):
+            # other dataframe libraries, e.g. pyspark.pandas, would need to
+            # collect the data.
+            return _apply_element_wise(check_fn, check_obj)
+
+        try:
+            key = (
+                (tuple(check_obj.columns), tuple(check_obj.dtypes))
+                if is_table
+                else check_obj.dtype
+            )
+            cached_strategy = self._element_wise_strategies.get(key)
+        except TypeError:
+            # unhashable column labels or dtypes
+            key, cached_strategy = None, None
+
+        strategies = [
+            strategy
+            for strategy in _ELEMENT_WISE_STRATEGIES
+            if not (
+                strategy == "vectorized"
+                and not (
+                    CONFIG.vectorize_element_wise_dataframes
+                    if is_table
+                    else CONFIG.vectorize_element_wise
+                )
+            )
+            and not (strategy == "rows" and not is_table)
+        ]
+        if cached_strategy in strategies:
+            strategies = strategies[strategies.index(cached_strategy) :]
+
+        for strategy in strategies:
+            check_output = _ELEMENT_WISE_STRATEGIES[strategy](
+                check_fn, check_obj
+            )
+            if check_output is not None:
+                if key is not None:
+                    self._element_wise_strategies[key] = strategy
+                return check_output
+        raise AssertionError(  # pragma: no cover
+            "the last element-wise strategy must return the check output"
+        )
+
     def __call__(
         self,
         df_or_series: Union[pd.DataFrame, pd.Series],
@@ -395,17 +467,18 @@ class _CheckBase(metaclass=_CheckMeta):
         check_fn = partial(self._check_fn, **self._check_kwargs)
 
         if self.element_wise:
-            check_output = (
-                check_obj.apply(check_fn, axis=1)  # type: ignore
-                if check_utils.is_table(check_obj)
-                else check_obj.map(check_fn)  # type: ignore
-                if check_utils.is_field(check_obj)
-                else check_fn(check_obj)
-            )
+            check_output = self._apply_element_wise(check_fn, check_obj)
         else:
             # vectorized check function case
             check_output = check_fn(check_obj)
 
+        if check_utils.all_passed(check_obj, check_output):
+            # passing checks don't need index alignment checks, null handling
+            # or failure cases.
+            return CheckResult(
+                check_output, True, check_obj, check_obj.iloc[:0]
+            )
+
         # failure cases only apply when the check function returns a boolean
         # series that matches the shape and index of the check_obj
         if (
@@ -413,7 +486,10 @@ class _CheckBase(metaclass=_CheckMeta):
             or isinstance(check_output, bool)
             or not check_utils.is_supported_check_obj(check_output)
             or check_obj.shape[0] != check_output.shape[0]
-            or (check_obj.index != check_output.index).all()
+            or (
+                check_obj.index is not check_output.index
+                and (check_obj.index != check_output.index).all()
+            )
         ):
             failure_cases = None
         elif check_utils.is_field(check_output):
@@ -425,6 +501,7 @@ class _CheckBase(metaclass=_CheckMeta):
                 check_output,
                 ignore_na=self.ignore_na,
                 n_failure_cases=self.n_failure_cases,
+                failure_case_budget=get_failure_case_budget(),
             )
         elif check_utils.is_table(check_output):
             (
@@ -473,11 +550,11 @@ class _CheckBase(metaclass=_CheckMeta):
         are_all_other_check_attributes_equal = {
             k: v
             for k, v in self.__dict__.items()
-            if k not in ["_check_fn", "strategy"]
+            if k not in ["_check_fn", "strategy", "_element_wise_strategies"]
         } == {
             k: v
             for k, v in other.__dict__.items()
-            if k not in ["_check_fn", "strategy"]
+            if k not in ["_check_fn", "strategy", "_element_wise_strategies"]
         }
 
         return (
@@ -507,6 +584,135 @@ class _CheckBase(metaclass=_CheckMeta):
         )
 
 
+def _row_type(columns: List[Any]) -> Type[tuple]:
+    """Create the type of the rows passed to element-wise dataframe checks.
+
+    Rows are named tuples that support the common ``pd.Series`` row access
+    patterns: ``row[column]``, ``row.column``, ``row.get(column)``,
+    ``column in row``, ``len(row)`` and iteration over the values, while
+    operations that behave differently for tuples, like ``row == value``,
+    raise a ``TypeError``. Columns
+    whose names aren't valid identifiers or clash with ``pd.Series``
+    attributes, e.g. ``name``, can only be accessed with ``row[column]``.
+    """
+    positions = {column: i for i, column in enumerate(columns)}
+    # namedtuple renames invalid field names to _{position}
+    field_names = [
+        column
+        if isinstance(column, str) and not hasattr(pd.Series, column)
+        else ""
+        for column in columns
+    ]
+    getitem = tuple.__getitem__
+
+    class _Row(namedtuple("_Row", field_names, rename=True)):  # type: ignore
+        __slots__ = ()
+
+        def __getitem__(self, key):
+            return getitem(self, positions[key])
+
+        def __contains__(self, key) -> bool:
+            return key in positions
+
+        def get(self, key, default=None):
+            """Get the value of a column, or default if it doesn't exist."""
+            position = positions.get(key)
+            return default if position is None else getitem(self, position)
+
+        def _unsupported(self, *args):
+            # tuple comparison and concatenation differ from the element-wise
+            # ``pd.Series`` operations, so the check falls back to apply
+            raise TypeError("unsupported row operation")
+
+        __eq__ = __ne__ = __lt__ = __le__ = __gt__ = __ge__ = _unsupported
+        __add__ = __radd__ = __mul__ = __rmul__ = _unsupported
+
+    return _Row
+
+
+def _vectorized_element_wise(check_fn: Callable, check_obj):
+    """Call an element-wise check function once with the whole data.
+
+    Series checks are called with the numpy array of the series, and
+    dataframe checks with the dataframe if
+    ``CONFIG.vectorize_element_wise_dataframes`` is enabled.
+
+    :returns: boolean Series, or None if the function raised or didn't
+        return a boolean array matching the data.
+    """
+    try:
+        if check_utils.is_table(check_obj):
+            output = check_fn(check_obj)
+            if (
+                check_utils.is_field(output)
+                and output.dtype == bool
+                and output.index.equals(check_obj.index)
+            ):
+                return output
+        else:
+            values = check_obj.to_numpy()
+            output = check_fn(values)
+            if (
+                isinstance(output, np.ndarray)
+                and output.dtype == bool
+                and output.shape == values.shape
+            ):
+                return pd.Series(
+                    output, index=check_obj.index, name=check_obj.name
+                )
+    except Exception:  # pylint: disable=broad-except
+        pass
+    return None
+
+
+def _row_element_wise(check_fn: Callable, check_obj: pd.DataFrame):
+    """Call an element-wise dataframe check function with named tuple rows.
+
+    This is much faster than creating a ``pd.Series`` for each row with
+    ``DataFrame.apply``.
+
+    :returns: Series of check results, or None if the function raised, e.g.
+        because it uses ``pd.Series`` methods that rows don't support, or the
+        column labels aren't unique.
+    """
+    if check_obj.columns.empty or not check_obj.columns.is_unique:
+        return None
+    row_type = _row_type(list(check_obj.columns))
+    new_row = tuple.__new__
+    try:
+        output = [
+            check_fn(new_row(row_type, values))
+            for values in zip(
+                *(
+                    check_obj.iloc[:, i].tolist()
+                    for i in range(check_obj.shape[1])
+                )
+            )
+        ]
+    except Exception:  # pylint: disable=broad-except
+        return None
+    return pd.Series(
+        output, index=check_obj.index, dtype=None if output else bool
+    )
+
+
+def _apply_element_wise(check_fn: Callable, check_obj):
+    """Apply an element-wise check function to each element or row."""
+    return (
+        check_obj.apply(check_fn, axis=1)
+        if check_utils.is_table(check_obj)
+        else check_obj.map(check_fn)
+    )
+
+
+# strategies used to apply element-wise checks, in the order they're tried.
+_ELEMENT_WISE_STRATEGIES = {
+    "vectorized": _vectorized_element_wise,
+    "rows": _row_element_wise,
+    "apply": _apply_element_wise,
+}
+
+
 def _check_kwargs(
     kwargs: Dict[str, Any],
     default_name: str,
@@ -0,0 +1,64 @@
+"""Pandera configuration."""
+
+import os
+from dataclasses import dataclass
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    """Read a boolean flag from an environment variable."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() in {"1", "true", "yes"}
+
+
+@dataclass
+class PanderaConfig:
+    """Pandera configuration.
+
+    The global configuration is available as ``pandera.config.CONFIG`` and
+    its defaults can be set with environment variables.
+
+    :param copy_on_write: if True, validating with ``inplace=False`` makes a
+        shallow copy of the data instead of a deep copy, so columns that
+        aren't modified by validation share their data with the original
+        object. Columns that are coerced or dropped with ``strict="filter"``
+        are replaced in the validated object and never modify the original
+        one, although pandas may still copy other columns that are stored in
+        the same block. Set with the ``PANDERA_COPY_ON_WRITE`` environment
+        variable.
+
+        .. note::
+            When pandas copy-on-write is enabled, shallow copies are always
+            made, since pandas defers copying data until it's modified. When
+            it's disabled, modifying values of the validated object in-place
+            also modifies the values of the original object.
+
+    :param vectorize_element_wise: if True, ``element_wise`` checks of
+        series first call their check function once with the whole array of
+        the series. If the function raises an exception or doesn't return a
+        boolean array of the same length, it's called for each element
+        instead. Set with the ``PANDERA_VECTORIZE_ELEMENT_WISE`` environment
+        variable.
+    :param vectorize_element_wise_dataframes: if True, ``element_wise``
+        checks of dataframes first call their check function once with the
+        whole dataframe, and use its output if it's a boolean series with
+        the index of the dataframe. Only enable it if the element-wise
+        dataframe checks don't use reductions like ``row.max()``, which
+        reduce the columns of a dataframe rather than the values of a row.
+        Set with the ``PANDERA_VECTORIZE_ELEMENT_WISE_DATAFRAMES``
+        environment variable.
+    """
+
+    copy_on_write: bool = False
+    vectorize_element_wise: bool = True
+    vectorize_element_wise_dataframes: bool = False
+
+
+CONFIG = PanderaConfig(
+    copy_on_write=_env_flag("PANDERA_COPY_ON_WRITE", False),
+    vectorize_element_wise=_env_flag("PANDERA_VECTORIZE_ELEMENT_WISE", True),
+    vectorize_element_wise_dataframes=_env_flag(
+        "PANDERA_VECTORIZE_ELEMENT_WISE_DATAFRAMES", False
+    ),
+)
@@ -24,6 +24,7 @@ import wrapt
 from pydantic import validate_arguments
 
 from . import errors, schemas
+from .error_formatters import lazy_message
 from .inspection_utils import (
     is_classmethod_from_meta,
     is_decorated_classmethod,
@@ -94,7 +95,12 @@ def _handle_schema_error(
     func_name = fn.__name__
     if isinstance(fn, types.MethodType):
         func_name = fn.__self__.__class__.__name__ + "." + func_name
-    msg = f"error in {decorator_name} decorator of function '{func_name}': {schema_error}"
+    msg = lazy_message(
+        "error in {} decorator of function '{}': {}",
+        decorator_name,
+        func_name,
+        schema_error,
+    )
     raise errors.SchemaError(
         schema,
         arg_df,
@@ -596,8 +602,9 @@ def check_types(
             if (
                 arg_value.pandera.schema is None
                 # don't re-validate a dataframe that contains the same exact
-                # schema
-                or arg_value.pandera.schema != schema
+                # schema, unless the schema can't be fingerprinted
+                or schema.fingerprint is None
+                or arg_value.pandera.schema_fingerprint != schema.fingerprint
             ):
                 try:
                     arg_value = schema.validate(
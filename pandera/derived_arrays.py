@@ -0,0 +1,184 @@
+"""Arrays derived from a series, shared by the validations of a column.
+
+The validation of a column computes the same arrays derived from its values
+several times, e.g. the null mask is computed by the ``nullable`` check and
+by each failing check with ``ignore_na=True``. Within
+:func:`derived_arrays_scope`, :func:`derived_arrays` returns a
+:class:`DerivedArrays` cache of these arrays for each validated series, so
+that each array is computed once per validation.
+"""
+
+import contextlib
+import contextvars
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _same_values(series: pd.Series, other: pd.Series) -> bool:
+    """Whether two series are views of the same values and index.
+
+    Selecting a column of a dataframe may return a new series each time, so
+    series are compared by the buffers of their values.
+    """
+    if series is other:
+        return True
+    if (
+        series.index is not other.index
+        or len(series) != len(other)
+        or series.dtype != other.dtype
+    ):
+        return False
+    if not isinstance(series.dtype, np.dtype):
+        return series.array is other.array
+    values, other_values = series.to_numpy(), other.to_numpy()
+    return (
+        values.__array_interface__["data"][0]
+        == other_values.__array_interface__["data"][0]
+        and values.strides == other_values.strides
+    )
+
+
+class DerivedArrays:
+    """Lazily computed arrays derived from the values of a series.
+
+    Each array is computed on first access and cached until the end of the
+    validation scope. The cached arrays must not be modified.
+    """
+
+    def __init__(self, series: pd.Series) -> None:
+        self.series = series
+        self._arrays: Dict[str, Any] = {}
+        #: number of accesses to arrays that were already computed.
+        self.hits = 0
+        #: number of arrays computed.
+        self.misses = 0
+
+    def _get(self, name: str, compute: Callable[[], Any]) -> Any:
+        try:
+            value = self._arrays[name]
+        except KeyError:
+            self.misses += 1
+            value = self._arrays[name] = compute()
+            return value
+        self.hits += 1
+        return value
+
+    def values(self) -> np.ndarray:
+        """Numpy array of the values."""
+        return self._get("values", self.series.to_numpy)
+
+    def isna(self) -> pd.Series:
+        """Boolean series of the null values."""
+        return self._get("isna", self.series.isna)
+
+    def null_mask(self) -> np.ndarray:
+        """Boolean numpy array of the null values."""
+        return self._get(
+            "null_mask",
+            lambda: self.isna().to_numpy(dtype=bool, na_value=False),
+        )
+
+    def n_nulls(self) -> int:
+        """Number of null values."""
+
+        def compute():
+            dtype = self.series.dtype
+            if isinstance(dtype, np.dtype) and dtype.kind in "biu":
+                # numpy booleans and integers can't be null
+                return 0
+            return int(self.null_mask().sum())
+
+        return self._get("n_nulls", compute)
+
+    def non_null_values(self) -> np.ndarray:
+        """Numpy array of the non-null values."""
+
+        def compute():
+            values = self.values()
+            if not self.n_nulls():
+                return values
+            return values[~self.null_mask()]
+
+        return self._get("non_null_values", compute)
+
+    def factorized(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Codes and unique values from :func:`pandas.factorize`.
+
+        The code of null values is -1.
+        """
+
+        def compute():
+            codes, uniques = pd.factorize(self.series)
+            return codes, np.asarray(uniques)
+
+        return self._get("factorized", compute)
+
+    def min_max(self) -> Optional[Tuple[Any, Any]]:
+        """Minimum and maximum of the non-null values of a numeric series.
+
+        :returns: None if the series isn't numeric or only has null values.
+        """
+
+        def compute():
+            if (
+                not isinstance(self.series.dtype, np.dtype)
+                or self.series.dtype.kind not in "biuf"
+            ):
+                return None
+            values = self.non_null_values()
+            if not len(values):
+                return None
+            return values.min(), values.max()
+
+        return self._get("min_max", compute)
+
+
+_DERIVED_ARRAYS: contextvars.ContextVar[
+    Optional[List[DerivedArrays]]
+] = contextvars.ContextVar("_DERIVED_ARRAYS", default=None)
+
+
+@contextlib.contextmanager
+def derived_arrays_scope() -> Iterator[List[DerivedArrays]]:
+    """Share the arrays derived from series within the context.
+
+    Scopes are entered for the validation of each column, so that the
+    cached arrays are released when the validation of the column ends.
+    """
+    cache: List[DerivedArrays] = []
+    token = _DERIVED_ARRAYS.set(cache)
+    try:
+        yield cache
+    finally:
+        _DERIVED_ARRAYS.reset(token)
+
+
+def derived_arrays(obj: Any) -> Optional[DerivedArrays]:
+    """Get the derived arrays of a series in the current scope.
+
+    :param obj: object to validate.
+    :returns: the derived arrays of ``obj``, or None outside of a
+        :func:`derived_arrays_scope` or if ``obj`` isn't a pandas Series.
+    """
+    cache = _DERIVED_ARRAYS.get()
+    if (
+        cache is None
+        or type(obj) is not pd.Series  # pylint: disable=unidiomatic-typecheck
+    ):
+        return None
+    for arrays in cache:
+        if _same_values(obj, arrays.series):
+            return arrays
+    arrays = DerivedArrays(obj)
+    cache.append(arrays)
+    return arrays
+
+
+def isna(obj: Any) -> Any:
+    """Null mask of an object, shared within a :func:`derived_arrays_scope`."""
+    arrays = derived_arrays(obj)
+    if arrays is None:
+        return obj.isna()
+    return arrays.isna()
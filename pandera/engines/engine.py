@@ -4,13 +4,15 @@
 import functools
 import inspect
 from abc import ABCMeta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Hashable,
     List,
+    NamedTuple,
     Optional,
     Set,
     Tuple,
@@ -46,16 +48,76 @@ else:
     Dispatch = Callable[[Any], DataType]
 
 
+#: maximum number of data types memoized by each engine.
+DTYPE_CACHE_SIZE = 1024
+
+
+class DtypeCacheInfo(NamedTuple):
+    """Statistics of the data types memoized by an engine."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+@dataclass
+class _DtypeCache:
+    """Data types resolved by an engine, keyed by
+    :meth:`Engine._dtype_cache_key`."""
+
+    dtypes: Dict[Hashable, DataType] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+
+
 @dataclass
 class _DtypeRegistry:
     dispatch: Dispatch
     equivalents: Dict[Any, DataType]
+    cache: _DtypeCache = field(default_factory=_DtypeCache)
+
+
+def _memoize_dtype(resolve: Callable[[Any, Any], DataType]) -> Callable:
+    """Memoize the data types resolved by the ``dtype`` method of an engine.
+
+    Only inputs with a key from :meth:`Engine._dtype_cache_key` are
+    memoized, and errors aren't.
+    """
+
+    @functools.wraps(resolve)
+    def dtype(engine: "Engine", data_type: Any) -> DataType:
+        key = engine._dtype_cache_key(data_type)
+        if key is None:
+            return resolve(engine, data_type)
+        cache = engine._registry[engine].cache
+        try:
+            pandera_dtype = cache.dtypes[key]
+        except TypeError:
+            # unhashable input
+            return resolve(engine, data_type)
+        except KeyError:
+            pandera_dtype = resolve(engine, data_type)
+            cache.misses += 1
+            if len(cache.dtypes) >= DTYPE_CACHE_SIZE:
+                # evict the oldest data type
+                del cache.dtypes[next(iter(cache.dtypes))]
+            cache.dtypes[key] = pandera_dtype
+            return pandera_dtype
+        cache.hits += 1
+        return pandera_dtype
+
+    return dtype
 
 
 class Engine(ABCMeta):
     """Base Engine metaclass.
 
     Keep a registry of concrete Engines.
+
+    The data types resolved by the ``dtype`` classmethod of concrete
+    Engines are memoized for the inputs that have a key from
+    :meth:`_dtype_cache_key`, until new data types are registered.
     """
 
     _registry: Dict["Engine", _DtypeRegistry] = {}
@@ -70,6 +132,10 @@ class Engine(ABCMeta):
             namespace["_base_pandera_dtypes"] = (base_pandera_dtypes,)
 
         namespace["_registered_dtypes"] = set()
+        if isinstance(namespace.get("dtype"), classmethod):
+            namespace["dtype"] = classmethod(
+                _memoize_dtype(namespace["dtype"].__func__)
+            )
         engine = super().__new__(cls, name, bases, namespace, **kwargs)
 
         @functools.singledispatch
@@ -174,6 +240,8 @@ class Engine(ABCMeta):
                 cls._register_from_parametrized_dtype(pandera_dtype_cls)
 
             cls._registered_dtypes.add(pandera_dtype_cls)
+            # registered data types may change how inputs are resolved
+            cls._registry[cls].cache.dtypes.clear()
             return pandera_dtype_cls
 
         if pandera_dtype_cls:
@@ -218,6 +286,37 @@ class Engine(ABCMeta):
                 f"Data type '{data_type}' not understood by {cls.__name__}."
             ) from None
 
+    def _dtype_cache_key(cls, data_type: Any) -> Optional[Hashable]:
+        """Key of the memoized data type of an input.
+
+        :returns: None if the data type of the input isn't memoized. Only
+            strings and classes are memoized by default. Inputs are keyed
+            with their type, since e.g. numpy dtypes compare equal to
+            strings.
+        """
+        if isinstance(data_type, (str, type)):
+            return type(data_type), data_type
+        return None
+
+    def dtype_cache_info(cls) -> DtypeCacheInfo:
+        """Statistics of the data types memoized by the engine.
+
+        :example:
+
+        >>> from pandera.engines import pandas_engine
+        >>>
+        >>> info = pandas_engine.Engine.dtype_cache_info()
+        >>> info.maxsize
+        1024
+        """
+        cache = cls._registry[cls].cache
+        return DtypeCacheInfo(
+            hits=cache.hits,
+            misses=cache.misses,
+            maxsize=DTYPE_CACHE_SIZE,
+            currsize=len(cache.dtypes),
+        )
+
     def get_registered_dtypes(  # pylint:disable=W1401
         cls,
     ) -> List[Type[DataType]]:
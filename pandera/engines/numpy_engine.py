@@ -6,7 +6,7 @@ import dataclasses
 import datetime
 import inspect
 import warnings
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Union
 
 import numpy as np
 
@@ -101,6 +101,12 @@ class Engine(  # pylint:disable=too-few-public-methods
             except TypeError:
                 return DataType(data_type)
 
+    @classmethod
+    def _dtype_cache_key(cls, data_type: Any) -> Optional[Hashable]:
+        if isinstance(data_type, np.dtype):
+            return type(data_type), data_type
+        return engine.Engine._dtype_cache_key(cls, data_type)
+
 
 ###############################################################################
 # boolean
@@ -12,7 +12,17 @@ import datetime
 import decimal
 import inspect
 import warnings
-from typing import Any, Callable, Dict, Iterable, List, Optional, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
@@ -42,6 +52,18 @@ def pandas_version():
 PANDAS_1_2_0_PLUS = pandas_version().release >= (1, 2, 0)
 PANDAS_1_3_0_PLUS = pandas_version().release >= (1, 3, 0)
 
+
+def pandas_copy_on_write() -> bool:
+    """Whether pandas copy-on-write mode is enabled."""
+    if pandas_version().release >= (3, 0, 0):
+        return True
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except (AttributeError, KeyError):
+        # pandas < 1.5 doesn't have a copy-on-write mode
+        return False
+
+
 try:
     from typing import Literal  # type: ignore
 except ImportError:
@@ -184,6 +206,16 @@ class Engine(  # pylint:disable=too-few-public-methods
 
             return engine.Engine.dtype(cls, np_or_pd_dtype)
 
+    @classmethod
+    def _dtype_cache_key(cls, data_type: Any) -> Optional[Hashable]:
+        # categorical dtypes with the same categories in a different order
+        # compare equal
+        if isinstance(
+            data_type, (np.dtype, pd.api.extensions.ExtensionDtype)
+        ) and not isinstance(data_type, pd.CategoricalDtype):
+            return type(data_type), data_type
+        return engine.Engine._dtype_cache_key(cls, data_type)
+
     @classmethod
     def numpy_dtype(cls, pandera_dtype: dtypes.DataType) -> np.dtype:
         """Convert a Pandera :class:`~pandera.dtypes.DataType
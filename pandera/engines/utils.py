@@ -1,6 +1,6 @@
 """Engine module utilities."""
 
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -9,10 +9,57 @@ from .. import check_utils
 from .type_aliases import PandasObject
 
 
+def _uncoercible_candidates(
+    series: pd.Series, data_type: Any
+) -> Optional[np.ndarray]:
+    """Find the values of a series that may not be coercible to a data type
+    with vectorized operations.
+
+    The values that aren't candidates are expected to be coercible, e.g.
+    values that :func:`pandas.to_numeric` parses for numeric data types.
+
+    :returns: boolean array of the candidates, or None if the data type
+        has no vectorized test.
+    """
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    from pandera.engines import pandas_engine
+
+    if isinstance(data_type, pandas_engine.Category):
+        candidates = ~series.isin(data_type.categories)
+    elif isinstance(data_type, pandas_engine.BOOL):
+        candidates = ~series.isin([True, False])
+    elif isinstance(
+        data_type, pandas_engine._BaseDateTime  # pylint: disable=W0212
+    ):
+        candidates = pd.to_datetime(
+            series, **{**data_type.to_datetime_kwargs, "errors": "coerce"}
+        ).isna()
+    else:
+        dtype = getattr(data_type, "type", None)
+        np_dtype = getattr(dtype, "numpy_dtype", dtype)
+        if not isinstance(np_dtype, np.dtype) or np_dtype.kind not in "iuf":
+            return None
+        numeric = pd.to_numeric(series, errors="coerce")
+        candidates = numeric.isna()
+        if np_dtype.kind in "iu":
+            info = np.iinfo(np_dtype)
+            # non-integral values or values out of the range of the data type
+            candidates |= (
+                (numeric % 1 != 0)
+                | (numeric < info.min)
+                | (numeric > info.max)
+            )
+    return candidates.to_numpy(dtype=bool, na_value=True)
+
+
 def numpy_pandas_coercible(series: pd.Series, type_: Any) -> pd.Series:
     """Checks whether a series is coercible with respect to a type.
 
-    Bisects the series until all the failure cases are found.
+    For numeric, datetime, boolean and categorical data types, the values
+    that may not be coercible are found with vectorized operations, e.g.
+    :func:`pandas.to_numeric`, and only these values are coerced one at a
+    time. If the other values still can't be coerced, or for other data
+    types, all the values are coerced one at a time.
 
     NOTE: this does not account for pyspark.pandas .astype behavior, which
     defaults to converting uncastable values to NA values.
@@ -29,6 +76,23 @@ def numpy_pandas_coercible(series: pd.Series, type_: Any) -> pd.Series:
         except Exception:  # pylint:disable=broad-except
             return False
 
+    if isinstance(series, pd.Series):
+        try:
+            candidates = _uncoercible_candidates(series, data_type)
+        except Exception:  # pylint:disable=broad-except
+            candidates = None
+        if candidates is not None:
+            coercible = np.ones(len(series), dtype=bool)
+            coercible[candidates] = series[candidates].map(_coercible)
+            try:
+                data_type.coerce(series[coercible])
+            except Exception:  # pylint:disable=broad-except
+                pass
+            else:
+                return pd.Series(
+                    coercible, index=series.index, name=series.name
+                )
+
     return series.map(_coercible)
 
 
@@ -1,12 +1,25 @@
 """Make schema error messages human-friendly."""
 
-from typing import Union
+import functools
+from typing import Any, Callable, Union
 
 import pandas as pd
 
 from . import check_utils
 
 
+def lazy_message(template: str, *args: Any) -> Callable[[], str]:
+    """Defer formatting an error message until it's displayed.
+
+    :param template: :meth:`str.format` template of the message.
+    :param args: values of the template fields, e.g. failure cases, which are
+        only converted to strings when the message is rendered.
+    :returns: zero-argument callable that renders the message, to pass as
+        the message of a :class:`~pandera.errors.SchemaError`.
+    """
+    return functools.partial(template.format, *args)
+
+
 def format_generic_error_message(
     parent_schema,
     check,
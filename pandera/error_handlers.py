@@ -1,8 +1,153 @@
 """Handle schema errors."""
 
-from typing import Dict, List, Union
+import contextlib
+import contextvars
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Union
 
-from .errors import SchemaError
+import numpy as np
+import pandas as pd
+
+from .errors import CollectedErrors, SchemaError
+
+
+class FailureCaseBudget:
+    """Maximum number of failure cases collected by a validation.
+
+    The failure cases kept across all the checks of a validation are a
+    uniform random sample of all the failure cases, i.e. a reservoir
+    sample. Each check first keeps a uniform sample of its own failure
+    cases, so that the failure cases of checks that fail on many rows
+    aren't all materialized, and the samples of the checks are merged when
+    the failure cases of a ``SchemaErrors`` are materialized.
+
+    With ``max_failure_cases=0``, only the number of failure cases of each
+    check is recorded, see :attr:`pandera.errors.SchemaErrors.failure_counts`.
+    """
+
+    def __init__(
+        self, max_failure_cases: int, random_state: Optional[int] = None
+    ) -> None:
+        """Initialize FailureCaseBudget.
+
+        :param max_failure_cases: maximum number of failure cases.
+        :param random_state: random seed of the sampling of failure cases.
+        """
+        if max_failure_cases < 0:
+            raise ValueError(
+                "max_failure_cases must be non-negative, found "
+                f"{max_failure_cases}"
+            )
+        self.max_failure_cases = max_failure_cases
+        self._rng = np.random.default_rng(random_state)
+        self._lock = threading.Lock()
+
+    def sample(
+        self,
+        obj: Union[pd.Series, pd.DataFrame],
+        failed: Union[pd.Series, np.ndarray],
+    ) -> Union[pd.Series, pd.DataFrame]:
+        """Sample the failed rows of a Series or DataFrame.
+
+        :param obj: checked object.
+        :param failed: boolean mask of the failed rows of ``obj``.
+        :returns: uniform sample of at most ``max_failure_cases`` failed
+            rows, in the order of ``obj``.
+        """
+        if isinstance(failed, pd.Series):
+            failed = failed.to_numpy(dtype=bool, na_value=False)
+        positions = np.flatnonzero(failed)
+        if len(positions) > self.max_failure_cases:
+            with self._lock:
+                positions = np.sort(
+                    self._rng.choice(
+                        positions, self.max_failure_cases, replace=False
+                    )
+                )
+        return obj.iloc[positions]
+
+    def reservoir(
+        self, counts: Sequence[int], sample_sizes: Sequence[int]
+    ) -> List[np.ndarray]:
+        """Merge the samples of failure cases of several checks.
+
+        :param counts: number of failure cases of each check.
+        :param sample_sizes: number of failure cases in the uniform sample of
+            the failure cases of each check, which is at least
+            ``min(count, max_failure_cases)``.
+        :returns: sorted positions of the failure cases to keep in the
+            sample of each check, so that the kept failure cases are a
+            uniform sample of at most ``max_failure_cases`` of all the
+            failure cases.
+        """
+        max_failure_cases = self.max_failure_cases
+        # (check, position in sample) of the failure cases in the reservoir
+        checks = np.empty(0, dtype=np.intp)
+        positions = np.empty(0, dtype=np.intp)
+        n_seen = 0
+        with self._lock:
+            for i, (count, sample_size) in enumerate(
+                zip(counts, sample_sizes)
+            ):
+                count = max(count, sample_size)
+                size = min(n_seen + count, max_failure_cases)
+                # number of failure cases of this check in a uniform sample
+                # of all the failure cases seen so far.
+                n_new = (
+                    min(count, size)
+                    if n_seen == 0
+                    else int(self._rng.hypergeometric(count, n_seen, size))
+                    if size
+                    else 0
+                )
+                n_kept = size - n_new
+                if n_kept < len(checks):
+                    kept = self._rng.choice(len(checks), n_kept, replace=False)
+                    checks, positions = checks[kept], positions[kept]
+                new = self._rng.choice(sample_size, n_new, replace=False)
+                checks = np.concatenate(
+                    [checks, np.full(n_new, i, dtype=np.intp)]
+                )
+                positions = np.concatenate([positions, new])
+                n_seen += count
+        return [
+            np.sort(positions[checks == i]) for i in range(len(sample_sizes))
+        ]
+
+
+_FAILURE_CASE_BUDGET: contextvars.ContextVar[
+    Optional[FailureCaseBudget]
+] = contextvars.ContextVar("_FAILURE_CASE_BUDGET", default=None)
+
+
+def get_failure_case_budget() -> Optional[FailureCaseBudget]:
+    """Get the failure case budget of the current validation, if any."""
+    return _FAILURE_CASE_BUDGET.get()
+
+
+@contextlib.contextmanager
+def failure_case_budget(
+    max_failure_cases: Optional[int], random_state: Optional[int] = None
+) -> Iterator[Optional[FailureCaseBudget]]:
+    """Apply a failure case budget to the validations within the context.
+
+    Validations of nested schemas, e.g. of the columns of a dataframe, share
+    the budget of the outermost validation.
+
+    :param max_failure_cases: maximum number of failure cases, or None for
+        no budget.
+    :param random_state: random seed of the sampling of failure cases.
+    """
+    budget = _FAILURE_CASE_BUDGET.get()
+    if budget is not None or max_failure_cases is None:
+        yield budget
+        return
+    budget = FailureCaseBudget(max_failure_cases, random_state)
+    token = _FAILURE_CASE_BUDGET.set(budget)
+    try:
+        yield budget
+    finally:
+        _FAILURE_CASE_BUDGET.reset(token)
 
 
 class SchemaErrorHandler:
@@ -15,7 +160,9 @@ class SchemaErrorHandler:
             SchemaError objects. Otherwise raise a SchemaError immediately.
         """
         self._lazy = lazy
-        self._collected_errors = []  # type: ignore
+        self._collected_errors = CollectedErrors(
+            budget=get_failure_case_budget()
+        )
 
     def collect_error(
         self,
@@ -46,5 +193,10 @@ class SchemaErrorHandler:
 
     @property
     def collected_errors(self) -> List[Dict[str, Union[SchemaError, str]]]:
-        """Retrieve SchemaError objects collected during lazy validation."""
+        """Retrieve SchemaError objects collected during lazy validation.
+
+        Their failure cases are accumulated in the ``failure_cases``
+        attribute of the list, see
+        :class:`~pandera.errors.FailureCaseAccumulator`.
+        """
         return self._collected_errors
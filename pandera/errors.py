@@ -2,8 +2,9 @@
 
 import warnings
 from collections import defaultdict, namedtuple
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 ErrorData = namedtuple(
@@ -23,23 +24,60 @@ class ReducedPickleExceptionBase(Exception):
 
     Derived classes define attributes to be transformed to
     string via `TO_STRING_KEYS`.
+
+    The message of the exception can be a zero-argument callable that
+    renders it, so that messages of exceptions that are caught and
+    discarded aren't rendered. It's rendered once on first access of
+    ``args``, ``str()`` or ``repr()``.
     """
 
     TO_STRING_KEYS: List[str]
 
+    _render_message: Optional[Callable[[], str]] = None
+
+    def __init__(self, *args):
+        if len(args) == 1 and callable(args[0]):
+            super().__init__()
+            self._render_message = args[0]
+        else:
+            super().__init__(*args)
+
+    @property  # type: ignore[override]
+    def args(self):
+        """Arguments of the exception, rendering the message if needed."""
+        if self._render_message is not None:
+            render_message, self._render_message = self._render_message, None
+            BaseException.args.__set__(self, (render_message(),))
+        return BaseException.args.__get__(self)
+
+    @args.setter
+    def args(self, value):
+        self._render_message = None
+        BaseException.args.__set__(self, value)
+
+    def __str__(self):
+        _ = self.args  # render the message
+        return super().__str__()
+
+    def __repr__(self):
+        _ = self.args  # render the message
+        return super().__repr__()
+
     def __reduce__(self):
         """Exception.__reduce__ is incompatible. Override with custom layout.
 
         Each attribute in `TO_STRING_KEYS` is replaced by its string
         representation.
         """
+        args = self.args  # renders the message
         state = {
             key: str(val)
             if key in self.TO_STRING_KEYS and val is not None
             else val
             for key, val in self.__dict__.items()
+            if key != "_render_message"
         }
-        state["args"] = self.args  # message may not be in __dict__
+        state["args"] = args  # message may not be in __dict__
         return (
             self.__class__.__new__,  # object creation function
             (self.__class__,),  # arguments to said function
@@ -80,7 +118,11 @@ class SchemaDefinitionError(Exception):
 
 
 class SchemaError(ReducedPickleExceptionBase):
-    """Raised when object does not pass schema validation constraints."""
+    """Raised when object does not pass schema validation constraints.
+
+    ``message`` can be a zero-argument callable that renders the message,
+    e.g. to format failure cases only if the message is displayed.
+    """
 
     TO_STRING_KEYS = [
         "schema",
@@ -99,6 +141,8 @@ class SchemaError(ReducedPickleExceptionBase):
         check=None,
         check_index=None,
         check_output=None,
+        failure_count=None,
+        n_checked=None,
     ):
         super().__init__(message)
         self.schema = schema
@@ -107,6 +151,412 @@ class SchemaError(ReducedPickleExceptionBase):
         self.check = check
         self.check_index = check_index
         self.check_output = check_output
+        # number of failure cases, if ``failure_cases`` is a sample of them,
+        # and number of checked values.
+        self.failure_count = failure_count
+        self.n_checked = n_checked
+
+
+# groups the chunks of failure cases whose column is a field of the failure
+# cases when deduplicating them.
+_COLUMN_FIELD = object()
+
+
+def _check_identifier(check: Any) -> Any:
+    """Identify a check in the failure cases of schema errors."""
+    if check is None or isinstance(check, str):
+        return check
+    if check.error is not None:
+        return check.error
+    if check.name is not None:
+        return check.name
+    return str(check)
+
+
+def _scalar_column(values: List[Any], lengths: np.ndarray) -> np.ndarray:
+    """Repeat one value per chunk of failure cases into a column.
+
+    The data type is the one that concatenating columns of the values
+    assigned to each chunk would have.
+    """
+    objects = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        objects[i] = value
+    column = np.repeat(objects, lengths)
+    types = {type(value) for value in values}
+    if types and all(
+        issubclass(type_, (int, np.integer))
+        and not issubclass(type_, (bool, np.bool_))
+        for type_ in types
+    ):
+        return column.astype(np.int64)
+    if types and all(
+        issubclass(type_, (int, float, np.integer, np.floating))
+        and not issubclass(type_, (bool, np.bool_))
+        for type_ in types
+    ):
+        return column.astype(np.float64)
+    return column
+
+
+def _concat_fields(fields: List[pd.Series]) -> Union[np.ndarray, pd.Series]:
+    """Concatenate the values of columns of failure cases."""
+    dtypes = {field.dtype for field in fields}
+    if len(dtypes) == 1 and isinstance(next(iter(dtypes)), np.dtype):
+        return np.concatenate([field.to_numpy() for field in fields])
+    return pd.concat(fields, ignore_index=True)
+
+
+class FailureCaseAccumulator:
+    """Append-only columnar buffers of the failure cases of schema errors.
+
+    The failure cases of each collected :class:`SchemaError` are appended as
+    references to their ``failure_case`` and ``index`` values, and the
+    ``schema_context``, ``column``, ``check`` and ``check_number`` of each
+    error are stored once rather than repeated for each failure case. The
+    failure cases are materialized into one DataFrame by :meth:`to_frame`.
+
+    With a :class:`~pandera.error_handlers.FailureCaseBudget`, the
+    materialized failure cases are a uniform sample of the failure cases of
+    all the errors.
+    """
+
+    COLUMNS = [
+        "schema_context",
+        "column",
+        "check",
+        "check_number",
+        "failure_case",
+        "index",
+    ]
+
+    COUNT_COLUMNS = [
+        "schema_context",
+        "column",
+        "check",
+        "check_number",
+        "n_failure_cases",
+        "n_checked",
+    ]
+
+    def __init__(self, budget: Any = None) -> None:
+        self.budget = budget
+        # one row of COUNT_COLUMNS per error
+        self._counts: List[Tuple[Any, ...]] = []
+        self._lengths: List[int] = []
+        self._schema_contexts: List[str] = []
+        self._checks: List[Any] = []
+        self._check_numbers: List[Any] = []
+        # one value per error, or the values of each failure case if the
+        # failure cases have a "column" column.
+        self._columns: List[Any] = []
+        self._column_fields: Dict[int, pd.Series] = {}
+        self._failure_cases: List[pd.Series] = []
+        self._index: List[pd.Series] = []
+        self._failure_counts: List[int] = []
+        # failure cases of pyspark.pandas and modin dataframes
+        self._frames: List[Any] = []
+        self._frame: Optional[pd.DataFrame] = None
+
+    def __len__(self) -> int:
+        return sum(self._lengths) + sum(len(frame) for frame in self._frames)
+
+    def append(self, reason_code: str, schema_error: SchemaError) -> None:
+        """Append the failure cases of a schema error.
+
+        :param reason_code: string representing reason for error.
+        :param schema_error: ``SchemaError`` object.
+        """
+        failure_cases = schema_error.failure_cases
+        if failure_cases is None:
+            return
+        self._frame = None
+        if "column" in failure_cases:
+            column = failure_cases["column"]
+        else:
+            column = (
+                schema_error.schema.name
+                if reason_code == "schema_component_check"
+                else None
+            )
+        schema_context = schema_error.schema.__class__.__name__
+        check = _check_identifier(schema_error.check)
+        failure_count = (
+            len(failure_cases)
+            if schema_error.failure_count is None
+            else max(schema_error.failure_count, len(failure_cases))
+        )
+        self._counts.append(
+            (
+                schema_context,
+                None if isinstance(column, pd.Series) else column,
+                check,
+                schema_error.check_index,
+                failure_count,
+                schema_error.n_checked,
+            )
+        )
+
+        if not isinstance(failure_cases, pd.DataFrame):
+            self._frames.append(
+                failure_cases.assign(
+                    schema_context=schema_context,
+                    check=check,
+                    check_number=schema_error.check_index,
+                    # if the column key is a tuple (for MultiIndex column
+                    # names), explicitly wrap `column` in a list of the
+                    # same length as the number of failure cases.
+                    column=(
+                        [column] * failure_cases.shape[0]
+                        if isinstance(column, tuple)
+                        else column
+                    ),
+                )[self.COLUMNS]
+            )
+            return
+
+        if isinstance(column, pd.Series):
+            self._column_fields[len(self._lengths)] = column
+            column = None
+        self._lengths.append(len(failure_cases))
+        self._failure_counts.append(failure_count)
+        self._schema_contexts.append(schema_context)
+        self._checks.append(check)
+        self._check_numbers.append(schema_error.check_index)
+        self._columns.append(column)
+        self._failure_cases.append(failure_cases["failure_case"])
+        self._index.append(failure_cases["index"])
+
+    def _order(self) -> List[int]:
+        """Order the chunks of failure cases by descending schema context.
+
+        The schema context is the same for all the failure cases of a chunk,
+        so the chunks are sorted rather than the failure cases.
+        """
+        return sorted(
+            range(len(self._lengths)),
+            key=self._schema_contexts.__getitem__,
+            reverse=True,
+        )
+
+    def _column(
+        self, order: List[int], lengths: np.ndarray
+    ) -> Union[np.ndarray, pd.Series]:
+        column = _scalar_column([self._columns[i] for i in order], lengths)
+        if not self._column_fields:
+            return column
+        fields = []
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        for position, i in enumerate(order):
+            fields.append(
+                self._column_fields[i].reset_index(drop=True)
+                if i in self._column_fields
+                else pd.Series(
+                    column[offsets[position] : offsets[position + 1]]
+                )
+            )
+        return pd.concat(fields, ignore_index=True)
+
+    def _duplicated(
+        self, frame: pd.DataFrame, order: List[int], lengths: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """Find the duplicated failure cases of the ordered chunks.
+
+        Failure cases can only be duplicates of failure cases with the same
+        schema context, column, check and check number, so only chunks with
+        the same values or with duplicated index values are compared.
+
+        :returns: boolean array marking the duplicates, or None if there are
+            no duplicates.
+        """
+        groups: Dict[Any, List[int]] = defaultdict(list)
+        try:
+            for position, i in enumerate(order):
+                groups[
+                    self._schema_contexts[i],
+                    _COLUMN_FIELD
+                    if i in self._column_fields
+                    else self._columns[i],
+                    self._checks[i],
+                    self._check_numbers[i],
+                ].append(position)
+        except TypeError:
+            duplicated = frame.duplicated().to_numpy()
+            return duplicated if duplicated.any() else None
+
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        duplicated = None
+        for positions in groups.values():
+            if len(positions) == 1 and order[positions[0]] not in (
+                self._column_fields
+            ):
+                try:
+                    if self._index[order[positions[0]]].is_unique:
+                        continue
+                except TypeError:
+                    pass
+            rows = np.concatenate(
+                [
+                    np.arange(offsets[position], offsets[position + 1])
+                    for position in positions
+                ]
+            )
+            group_duplicated = frame.iloc[rows].duplicated().to_numpy()
+            if group_duplicated.any():
+                if duplicated is None:
+                    duplicated = np.zeros(len(frame), dtype=bool)
+                duplicated[rows] = group_duplicated
+        return duplicated
+
+    def counts(self) -> pd.DataFrame:
+        """Count the failure cases of each error.
+
+        :returns: DataFrame with the ``schema_context``, ``column``,
+            ``check`` and ``check_number`` of each error, its number of
+            failure cases, the number of checked values if known, and the
+            fraction of checked values that failed.
+        """
+        counts = pd.DataFrame.from_records(
+            self._counts, columns=self.COUNT_COLUMNS
+        )
+        return counts.assign(
+            failure_fraction=counts.n_failure_cases
+            / counts.n_checked.astype(float)
+        )
+
+    def _sampled(self) -> "FailureCaseAccumulator":
+        """Sample the failure cases within the budget."""
+        takes = self.budget.reservoir(self._failure_counts, self._lengths)
+        sampled = FailureCaseAccumulator()
+        for i, take in enumerate(takes):
+            if i in self._column_fields:
+                sampled._column_fields[
+                    len(sampled._lengths)
+                ] = self._column_fields[i].iloc[take]
+            sampled._lengths.append(len(take))
+            sampled._schema_contexts.append(self._schema_contexts[i])
+            sampled._checks.append(self._checks[i])
+            sampled._check_numbers.append(self._check_numbers[i])
+            sampled._columns.append(self._columns[i])
+            sampled._failure_cases.append(self._failure_cases[i].iloc[take])
+            sampled._index.append(self._index[i].iloc[take])
+        return sampled
+
+    def _pandas_frame(self) -> pd.DataFrame:
+        """Materialize the failure cases of pandas dataframes.
+
+        The failure cases are sorted by descending schema context and
+        deduplicated, and their index is their position in the order in
+        which they were appended.
+        """
+        if self.budget is not None:
+            return self._sampled()._pandas_frame()
+        order = self._order()
+        lengths = np.asarray([self._lengths[i] for i in order], dtype=np.intp)
+        frame = pd.DataFrame(
+            {
+                "schema_context": _scalar_column(
+                    [self._schema_contexts[i] for i in order], lengths
+                ),
+                "column": self._column(order, lengths),
+                "check": _scalar_column(
+                    [self._checks[i] for i in order], lengths
+                ),
+                "check_number": _scalar_column(
+                    [self._check_numbers[i] for i in order], lengths
+                ),
+                "failure_case": _concat_fields(
+                    [self._failure_cases[i] for i in order]
+                ),
+                "index": _concat_fields([self._index[i] for i in order]),
+            }
+        )
+        if order != sorted(order):
+            offsets = np.concatenate([[0], np.cumsum(self._lengths)])
+            frame.index = np.concatenate(
+                [np.arange(offsets[i], offsets[i + 1]) for i in order]
+            )
+        duplicated = self._duplicated(frame, order, lengths)
+        if duplicated is not None:
+            frame = frame[~duplicated]
+        return frame
+
+    def to_frame(self) -> pd.DataFrame:
+        """Materialize the failure cases into a DataFrame.
+
+        The DataFrame is cached until more failure cases are appended.
+        """
+        if self._frame is not None:
+            return self._frame
+        if not self._frames:
+            if not self._lengths:
+                # same error as concatenating no failure cases
+                raise ValueError("No objects to concatenate")
+            self._frame = self._pandas_frame()
+            return self._frame
+
+        frames = self._frames
+        if self._lengths:
+            frames = [self._pandas_frame()] + frames
+
+        # NOTE: this is a hack to support pyspark.pandas and modin
+        concat_fn = pd.concat
+        if any(
+            type(x).__module__.startswith("pyspark.pandas") for x in frames
+        ):
+            # pylint: disable=import-outside-toplevel
+            import pyspark.pandas as ps
+
+            concat_fn = ps.concat
+            frames = [
+                x if isinstance(x, ps.DataFrame) else ps.DataFrame(x)
+                for x in frames
+            ]
+        elif any(
+            type(x).__module__.startswith("modin.pandas") for x in frames
+        ):
+            # pylint: disable=import-outside-toplevel
+            import modin.pandas as mpd
+
+            concat_fn = mpd.concat
+            frames = [
+                x if isinstance(x, mpd.DataFrame) else mpd.DataFrame(x)
+                for x in frames
+            ]
+
+        self._frame = (
+            concat_fn(frames)
+            .reset_index(drop=True)
+            .sort_values("schema_context", ascending=False)
+            .drop_duplicates()
+        )
+        return self._frame
+
+
+class CollectedErrors(list):
+    """List of the schema error dicts collected during lazy validation.
+
+    The failure cases of the errors are accumulated in :attr:`failure_cases`
+    as they're collected.
+    """
+
+    def __init__(self, *args, budget: Any = None) -> None:
+        super().__init__(*args)
+        self.failure_cases = FailureCaseAccumulator(budget)
+        for schema_error_dict in self:
+            self.failure_cases.append(
+                schema_error_dict["reason_code"], schema_error_dict["error"]
+            )
+
+    def __reduce__(self):
+        # the accumulated failure cases are materialized before pickling
+        return list, (list(self),)
+
+    def append(self, schema_error_dict: Dict[str, Any]) -> None:
+        super().append(schema_error_dict)
+        self.failure_cases.append(
+            schema_error_dict["reason_code"], schema_error_dict["error"]
+        )
 
 
 class BaseStrategyOnlyError(Exception):
@@ -144,18 +594,87 @@ class SchemaErrors(ReducedPickleExceptionBase):
         schema,
         schema_errors: List[Dict[str, Any]],
         data: Union[pd.Series, pd.DataFrame],
-        include_failure_cases: bool,
+        include_failure_cases: bool = True,
     ):
-        error_counts, failure_cases = self._parse_schema_errors(schema_errors)
+        if not isinstance(schema_errors, CollectedErrors):
+            schema_errors = CollectedErrors(schema_errors)
+        error_counts = self._count_errors(schema_errors)
         self.schema = schema
-        super().__init__(self._message(error_counts, failure_cases, include_failure_cases))
+        self._failure_cases = None
+        self._failure_case_accumulator: Optional[
+            FailureCaseAccumulator
+        ] = schema_errors.failure_cases
+        # the summary of the failure cases is rendered on first access
+        super().__init__(self._render_summary)
         self.schema_errors = schema_errors
         self.error_counts = error_counts
-        self.failure_cases = failure_cases
         self.data = data
         self.include_failure_cases = include_failure_cases
 
-    def _message(self, error_counts, schema_errors, include_failure_cases):
+    @property
+    def failure_cases(self):
+        """DataFrame of the failure cases of all the schema errors.
+
+        It's materialized from the accumulated failure cases on first access.
+        """
+        if self._failure_cases is None and (
+            self._failure_case_accumulator is not None
+        ):
+            self._failure_cases = self._failure_case_accumulator.to_frame()
+            self._failure_case_accumulator = None
+        return self._failure_cases
+
+    @failure_cases.setter
+    def failure_cases(self, failure_cases) -> None:
+        self._failure_cases = failure_cases
+        self._failure_case_accumulator = None
+
+    def __reduce__(self):
+        new, args, state = super().__reduce__()
+        failure_cases = self.failure_cases
+        state.pop("_failure_case_accumulator", None)
+        state.pop("_failure_cases", None)
+        state["failure_cases"] = (
+            None if failure_cases is None else str(failure_cases)
+        )
+        return new, args, state
+
+    @property
+    def failure_counts(self) -> Optional[pd.DataFrame]:
+        """DataFrame of the number of failure cases of each schema error.
+
+        Unlike :attr:`failure_cases`, the counts include all the failure
+        cases when the schema limits the number of collected failure cases
+        with ``max_failure_cases``. ``failure_fraction`` is the fraction of
+        the checked values that failed, if the number of checked values is
+        known. It's None for unpickled errors.
+        """
+        accumulator = getattr(self.schema_errors, "failure_cases", None)
+        if not isinstance(accumulator, FailureCaseAccumulator):
+            return None
+        return accumulator.counts()
+
+    def _render_summary(self) -> str:
+        accumulator = getattr(self.schema_errors, "failure_cases", None)
+        return self._message(
+            self.error_counts,
+            self.failure_cases,
+            self.include_failure_cases,
+            failure_counts=(
+                accumulator.counts()
+                if isinstance(accumulator, FailureCaseAccumulator)
+                and accumulator.budget is not None
+                else None
+            ),
+        )
+
+    def _message(
+        self,
+        error_counts,
+        schema_errors,
+        include_failure_cases,
+        failure_counts=None,
+    ):
         """Format error message."""
         msg = (
             f"Schema {self.schema.name}: A total of "
@@ -179,119 +698,60 @@ class SchemaErrors(ReducedPickleExceptionBase):
                 ["schema_context", "column", "check"]
             ).failure_case.unique()
 
-        agg_schema_errors = (
-            schema_errors.fillna({"column": "<NA>"})
-            .pipe(agg_failure_cases)
-            .rename("failure_cases")
-            .to_frame()
-            .assign(n_failure_cases=lambda df: df.failure_cases.map(len))
-        )
-        index_labels = [
-            agg_schema_errors.index.names.index(name)
-            for name in ["schema_context", "column"]
-        ]
-        agg_schema_errors = agg_schema_errors.sort_index(
-            level=index_labels,
-            ascending=[False, True],
-        )
-        msg += "\nSchema Error Summary"
-        msg += "\n--------------------\n"
-        with pd.option_context("display.max_colwidth", 100):
-            if include_failure_cases:
-                msg += agg_schema_errors.to_string()
-            else:
-                msg += agg_schema_errors.n_failure_cases.to_string()
+        # with max_failure_cases=0, only the failure counts are collected
+        if failure_counts is None or len(schema_errors):
+            agg_schema_errors = (
+                schema_errors.fillna({"column": "<NA>"})
+                .pipe(agg_failure_cases)
+                .rename("failure_cases")
+                .to_frame()
+                .assign(n_failure_cases=lambda df: df.failure_cases.map(len))
+            )
+            index_labels = [
+                agg_schema_errors.index.names.index(name)
+                for name in ["schema_context", "column"]
+            ]
+            agg_schema_errors = agg_schema_errors.sort_index(
+                level=index_labels,
+                ascending=[False, True],
+            )
+            msg += "\nSchema Error Summary"
+            msg += "\n--------------------\n"
+            with pd.option_context("display.max_colwidth", 100):
+                if include_failure_cases:
+                    msg += agg_schema_errors.to_string()
+                else:
+                    msg += agg_schema_errors.n_failure_cases.to_string()
+            if failure_counts is not None:
+                msg += "\n"
+        if failure_counts is not None:
+            # failure cases are sampled, so count all of them separately
+            msg += "\nFailure Counts"
+            msg += "\n--------------\n"
+            msg += (
+                failure_counts.fillna({"column": "<NA>"})
+                .set_index(["schema_context", "column", "check"])[
+                    ["n_failure_cases", "failure_fraction"]
+                ]
+                .to_string()
+            )
         msg += SCHEMA_ERRORS_SUFFIX
         return msg
 
     @staticmethod
-    def _parse_schema_errors(schema_errors: List[Dict[str, Any]]):
-        """Parse schema error dicts to produce data for error message."""
+    def _count_errors(schema_errors: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Count the schema errors by reason code."""
         error_counts = defaultdict(int)  # type: ignore
-        check_failure_cases = []
-
-        column_order = [
-            "schema_context",
-            "column",
-            "check",
-            "check_number",
-            "failure_case",
-            "index",
-        ]
-
         for schema_error_dict in schema_errors:
-            reason_code = schema_error_dict["reason_code"]
-            err = schema_error_dict["error"]
-
-            error_counts[reason_code] += 1
-            check_identifier = (
-                None
-                if err.check is None
-                else err.check
-                if isinstance(err.check, str)
-                else err.check.error
-                if err.check.error is not None
-                else err.check.name
-                if err.check.name is not None
-                else str(err.check)
-            )
-
-            if err.failure_cases is not None:
-                if "column" in err.failure_cases:
-                    column = err.failure_cases["column"]
-                else:
-                    column = (
-                        err.schema.name
-                        if reason_code == "schema_component_check"
-                        else None
-                    )
-
-                failure_cases = err.failure_cases.assign(
-                    schema_context=err.schema.__class__.__name__,
-                    check=check_identifier,
-                    check_number=err.check_index,
-                    # if the column key is a tuple (for MultiIndex column
-                    # names), explicitly wrap `column` in a list of the
-                    # same length as the number of failure cases.
-                    column=(
-                        [column] * err.failure_cases.shape[0]
-                        if isinstance(column, tuple)
-                        else column
-                    ),
-                )
-                check_failure_cases.append(failure_cases[column_order])
-
-        # NOTE: this is a hack to support pyspark.pandas and modin
-        concat_fn = pd.concat
-        if any(
-            type(x).__module__.startswith("pyspark.pandas")
-            for x in check_failure_cases
-        ):
-            # pylint: disable=import-outside-toplevel
-            import pyspark.pandas as ps
-
-            concat_fn = ps.concat
-            check_failure_cases = [
-                x if isinstance(x, ps.DataFrame) else ps.DataFrame(x)
-                for x in check_failure_cases
-            ]
-        elif any(
-            type(x).__module__.startswith("modin.pandas")
-            for x in check_failure_cases
-        ):
-            # pylint: disable=import-outside-toplevel
-            import modin.pandas as mpd
+            error_counts[schema_error_dict["reason_code"]] += 1
+        return error_counts
 
-            concat_fn = mpd.concat
-            check_failure_cases = [
-                x if isinstance(x, mpd.DataFrame) else mpd.DataFrame(x)
-                for x in check_failure_cases
-            ]
-
-        failure_cases = (
-            concat_fn(check_failure_cases)
-            .reset_index(drop=True)
-            .sort_values("schema_context", ascending=False)
-            .drop_duplicates()
+    @classmethod
+    def _parse_schema_errors(cls, schema_errors: List[Dict[str, Any]]):
+        """Parse schema error dicts to produce data for error message."""
+        if not isinstance(schema_errors, CollectedErrors):
+            schema_errors = CollectedErrors(schema_errors)
+        return (
+            cls._count_errors(schema_errors),
+            schema_errors.failure_cases.to_frame(),
         )
-        return error_counts, failure_cases
@@ -0,0 +1,275 @@
+"""Validation events emitted to registered handlers.
+
+Handlers registered with :func:`register_event_handler` are called with a
+:class:`ValidationEvent` when:
+
+- a schema starts and ends validating an object (``validation_start`` and
+  ``validation_end``),
+- a column or index starts and ends being validated within a dataframe
+  (``component_start`` and ``component_end``),
+- a check is evaluated (``check_result``),
+- a data type can't be coerced (``coercion_failure``).
+
+Events are put in a bounded buffer and handlers are called in a background
+thread, so that validation never waits for handlers, e.g. to write to a file.
+If the buffer is full, events are dropped and counted in
+:func:`dropped_events`. Use :func:`flush_events` to wait until the buffered
+events are handled. See :mod:`pandera.exporters` for built-in handlers.
+
+Events are emitted in the thread or process in which the data is
+validated, so the shards of ``n_shards`` validation, which are validated in
+other processes, don't emit component and check events.
+"""
+
+import atexit
+import functools
+import queue
+import threading
+import time
+import warnings
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+from .instrumentation import check_name, component_name
+
+EVENT_KINDS = (
+    "validation_start",
+    "validation_end",
+    "component_start",
+    "component_end",
+    "check_result",
+    "coercion_failure",
+)
+
+# maximum number of events waiting to be handled.
+EVENT_BUFFER_SIZE = 10_000
+
+
+@dataclass(frozen=True)
+class ValidationEvent:
+    """An event of the validation of data.
+
+    :param kind: one of :data:`EVENT_KINDS`.
+    :param schema: name of the schema that validates the data, or its type
+        if it doesn't have a name.
+    :param component: the schema component, e.g. ``Column('a')``.
+    :param column: name of the column or index of component events, and of
+        the check, nullability, dtype and coercion events of columns.
+    :param check: name of the check of ``check_result`` events.
+    :param timestamp: time of the event from :func:`time.time`.
+    :param duration: duration in seconds of ``validation_end``,
+        ``component_end`` and ``check_result`` events.
+    :param passed: whether the validation, component or check passed.
+    :param failures: number of failure cases of failed checks and coercions.
+    """
+
+    kind: str
+    schema: Optional[str]
+    component: Optional[str] = None
+    column: Optional[str] = None
+    check: Optional[str] = None
+    timestamp: float = 0.0
+    duration: Optional[float] = None
+    passed: Optional[bool] = None
+    failures: Optional[int] = None
+
+
+EventHandler = Callable[[ValidationEvent], Any]
+
+_HANDLERS: List[EventHandler] = []
+
+# name of the schema of the validation in the current context.
+_VALIDATED_SCHEMA: ContextVar[Optional[str]] = ContextVar(
+    "pandera_validated_schema", default=None
+)
+
+
+class _EventDispatcher:
+    """Calls the event handlers with the buffered events in a thread."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.events: "queue.Queue[ValidationEvent]" = queue.Queue(maxsize)
+        self.dropped = 0
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def put(self, event: ValidationEvent) -> None:
+        if self._thread is None:
+            self._start()
+        try:
+            self.events.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="pandera-events", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while True:
+            event = self.events.get()
+            try:
+                for handler in list(_HANDLERS):
+                    try:
+                        handler(event)
+                    except Exception as exc:  # pylint: disable=broad-except
+                        warnings.warn(
+                            f"pandera event handler {handler!r} raised "
+                            f"{exc!r}",
+                            RuntimeWarning,
+                        )
+            finally:
+                self.events.task_done()
+
+    def flush(self) -> None:
+        if self._thread is not None:
+            self.events.join()
+
+
+_DISPATCHER = _EventDispatcher(EVENT_BUFFER_SIZE)
+
+
+def register_event_handler(handler: EventHandler) -> EventHandler:
+    """Register a function that is called with each validation event.
+
+    Can be used as a decorator.
+
+    :param handler: function called with a :class:`ValidationEvent`. It's
+        called in a background thread, and exceptions it raises are reported
+        with a ``RuntimeWarning``.
+    :returns: the handler.
+    """
+    _HANDLERS.append(handler)
+    return handler
+
+
+def unregister_event_handler(handler: EventHandler) -> None:
+    """Stop calling a registered event handler.
+
+    Events that are already buffered may still be passed to the handler.
+    """
+    _HANDLERS.remove(handler)
+
+
+def flush_events() -> None:
+    """Wait until all the events emitted so far are handled."""
+    _DISPATCHER.flush()
+
+
+def dropped_events() -> int:
+    """Number of events dropped because the event buffer was full."""
+    return _DISPATCHER.dropped
+
+
+def _column(component: Any) -> Optional[str]:
+    """Get the column or index name of a schema component."""
+    if component is None or hasattr(component, "columns"):
+        return None
+    name = getattr(component, "name", None)
+    return None if name is None else str(name)
+
+
+def emit(
+    kind: str,
+    component: Any = None,
+    check: Any = None,
+    duration: Optional[float] = None,
+    passed: Optional[bool] = None,
+    failures: Optional[int] = None,
+) -> None:
+    """Emit a validation event if event handlers are registered.
+
+    :param kind: one of :data:`EVENT_KINDS`.
+    :param component: schema or schema component of the event.
+    :param check: check of ``check_result`` events.
+    """
+    if not _HANDLERS:
+        return
+    schema = _VALIDATED_SCHEMA.get()
+    _DISPATCHER.put(
+        ValidationEvent(
+            kind=kind,
+            schema=schema
+            if schema is not None or component is None
+            else component_name(component),
+            component=None if component is None else component_name(component),
+            column=_column(component),
+            check=None if check is None else check_name(check),
+            timestamp=time.time(),
+            duration=duration,
+            passed=passed,
+            failures=failures,
+        )
+    )
+
+
+def handlers_registered() -> bool:
+    """Whether any event handlers are registered."""
+    return bool(_HANDLERS)
+
+
+def emits_validation_events(validate_fn):
+    """Decorator that emits validation start and end events.
+
+    Nested validations, e.g. of the levels of a MultiIndex within a
+    dataframe, don't emit validation events.
+    """
+
+    @functools.wraps(validate_fn)
+    def _wrapper(schema, *args, **kwargs):
+        if not _HANDLERS or _VALIDATED_SCHEMA.get() is not None:
+            return validate_fn(schema, *args, **kwargs)
+        token = _VALIDATED_SCHEMA.set(
+            type(schema).__name__ if schema.name is None else str(schema.name)
+        )
+        try:
+            emit("validation_start", schema)
+            start = time.perf_counter()
+            try:
+                result = validate_fn(schema, *args, **kwargs)
+            except Exception:
+                emit(
+                    "validation_end",
+                    schema,
+                    duration=time.perf_counter() - start,
+                    passed=False,
+                )
+                raise
+            emit(
+                "validation_end",
+                schema,
+                duration=time.perf_counter() - start,
+                passed=True,
+            )
+            return result
+        finally:
+            _VALIDATED_SCHEMA.reset(token)
+
+    return _wrapper
+
+
+class component_events:  # pylint: disable=invalid-name
+    """Context manager that emits component start and end events."""
+
+    __slots__ = ("component", "start")
+
+    def __init__(self, component: Any) -> None:
+        self.component = component
+
+    def __enter__(self) -> None:
+        emit("component_start", self.component)
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        emit(
+            "component_end",
+            self.component,
+            duration=time.perf_counter() - self.start,
+            passed=exc_type is None,
+        )
@@ -0,0 +1,306 @@
+"""Built-in handlers of validation events.
+
+:class:`PrometheusWriter` aggregates events into metrics in the Prometheus
+text exposition format, and :class:`JSONLinesSpanLogger` logs them as JSON
+lines. Register them with :func:`~pandera.events.register_event_handler`,
+e.g. ``register_event_handler(PrometheusWriter("pandera.prom"))``.
+"""
+
+import json
+import math
+import os
+import tempfile
+import threading
+from collections import defaultdict
+from dataclasses import asdict
+from typing import IO, Dict, Iterable, List, Optional, Tuple, Union
+
+from .events import ValidationEvent
+
+# upper bounds in seconds of the buckets of latency histograms.
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    60.0,
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+_METRICS = {
+    "pandera_validations_total": (
+        "counter",
+        "Number of validations.",
+    ),
+    "pandera_validation_duration_seconds": (
+        "histogram",
+        "Duration of validations.",
+    ),
+    "pandera_component_duration_seconds": (
+        "histogram",
+        "Duration of the validation of columns and indexes.",
+    ),
+    "pandera_checks_total": (
+        "counter",
+        "Number of evaluated checks.",
+    ),
+    "pandera_check_duration_seconds": (
+        "histogram",
+        "Duration of checks.",
+    ),
+    "pandera_check_failure_cases_total": (
+        "counter",
+        "Number of failure cases of checks.",
+    ),
+    "pandera_coercion_failures_total": (
+        "counter",
+        "Number of failed data type coercions.",
+    ),
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    formatted = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in labels
+    )
+    return f"{{{formatted}}}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value))
+
+
+class _Histogram:
+    __slots__ = ("bucket_counts", "sum", "count")
+
+    def __init__(self, n_buckets: int) -> None:
+        self.bucket_counts = [0] * n_buckets
+        self.sum = 0.0
+        self.count = 0
+
+
+class PrometheusWriter:
+    """Aggregates validation events into Prometheus metrics.
+
+    Metrics are labeled by the name of the validated schema, the column and
+    the check:
+
+    - ``pandera_validations_total`` and ``pandera_checks_total``: counters
+      of validations and checks, labeled by ``status``, i.e. ``passed`` or
+      ``failed``.
+    - ``pandera_validation_duration_seconds``,
+      ``pandera_component_duration_seconds`` and
+      ``pandera_check_duration_seconds``: latency histograms.
+    - ``pandera_check_failure_cases_total``: counter of failure cases.
+    - ``pandera_coercion_failures_total``: counter of failed coercions.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, os.PathLike]] = None,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize PrometheusWriter.
+
+        :param path: if specified, the metrics are written to this file after
+            each validation, e.g. for the node exporter textfile collector.
+            The file is replaced atomically.
+        :param buckets: upper bounds in seconds of the buckets of latency
+            histograms.
+        """
+        self.path = path
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, Labels], float] = defaultdict(float)
+        self._histograms: Dict[Tuple[str, Labels], _Histogram] = {}
+
+    def _inc(self, name: str, labels: Labels, value: float = 1) -> None:
+        self._counters[name, labels] += value
+
+    def _observe(self, name: str, labels: Labels, value: float) -> None:
+        histogram = self._histograms.get((name, labels))
+        if histogram is None:
+            histogram = self._histograms[name, labels] = _Histogram(
+                len(self.buckets)
+            )
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                histogram.bucket_counts[i] += 1
+        histogram.sum += value
+        histogram.count += 1
+
+    def __call__(self, event: ValidationEvent) -> None:
+        schema = ("schema", event.schema or "")
+        column = ("column", event.column or "")
+        check = ("check", event.check or "")
+        status = ("status", "passed" if event.passed else "failed")
+        with self._lock:
+            if event.kind == "validation_end":
+                self._inc("pandera_validations_total", (schema, status))
+                self._observe(
+                    "pandera_validation_duration_seconds",
+                    (schema,),
+                    event.duration or 0.0,
+                )
+            elif event.kind == "component_end":
+                self._observe(
+                    "pandera_component_duration_seconds",
+                    (schema, column),
+                    event.duration or 0.0,
+                )
+            elif event.kind == "check_result":
+                self._inc(
+                    "pandera_checks_total", (schema, column, check, status)
+                )
+                self._observe(
+                    "pandera_check_duration_seconds",
+                    (schema, column, check),
+                    event.duration or 0.0,
+                )
+                if event.failures:
+                    self._inc(
+                        "pandera_check_failure_cases_total",
+                        (schema, column, check),
+                        event.failures,
+                    )
+            elif event.kind == "coercion_failure":
+                self._inc("pandera_coercion_failures_total", (schema, column))
+        if self.path is not None and event.kind == "validation_end":
+            self.write()
+
+    def render(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            for name, (metric_type, help_text) in _METRICS.items():
+                if metric_type == "counter":
+                    samples = [
+                        (labels, value)
+                        for (metric, labels), value in self._counters.items()
+                        if metric == name
+                    ]
+                    if not samples:
+                        continue
+                    lines.append(f"# HELP {name} {help_text}")
+                    lines.append(f"# TYPE {name} counter")
+                    for labels, value in sorted(samples):
+                        lines.append(
+                            f"{name}{_format_labels(labels)} "
+                            f"{_format_value(value)}"
+                        )
+                    continue
+
+                histograms = sorted(
+                    (labels, histogram)
+                    for (metric, labels), histogram in self._histograms.items()
+                    if metric == name
+                )
+                if not histograms:
+                    continue
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for labels, histogram in histograms:
+                    bounds = list(self.buckets) + [math.inf]
+                    counts = histogram.bucket_counts + [histogram.count]
+                    for bound, count in zip(bounds, counts):
+                        bucket_labels = labels + (
+                            ("le", _format_value(bound)),
+                        )
+                        lines.append(
+                            f"{name}_bucket{_format_labels(bucket_labels)} "
+                            f"{count}"
+                        )
+                    lines.append(
+                        f"{name}_sum{_format_labels(labels)} "
+                        f"{_format_value(histogram.sum)}"
+                    )
+                    lines.append(
+                        f"{name}_count{_format_labels(labels)} "
+                        f"{histogram.count}"
+                    )
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def write(self, path: Optional[Union[str, os.PathLike]] = None) -> None:
+        """Write the metrics to a file, replacing it atomically.
+
+        :param path: the file, by default the ``path`` of the writer.
+        """
+        path = self.path if path is None else path
+        if path is None:
+            raise ValueError("path must be specified")
+        directory = os.path.dirname(os.path.abspath(path))
+        with tempfile.NamedTemporaryFile(
+            "w", dir=directory, delete=False, suffix=".tmp"
+        ) as file:
+            file.write(self.render())
+        os.replace(file.name, path)
+
+
+class JSONLinesSpanLogger:
+    """Logs validation events as JSON lines.
+
+    Each line is a JSON object with the fields of a
+    :class:`~pandera.events.ValidationEvent`. Events with a duration, i.e.
+    the spans of validations, components and checks, also have a ``start``
+    field with the time at which the span started.
+    """
+
+    SPAN_KINDS = (
+        "validation_end",
+        "component_end",
+        "check_result",
+        "coercion_failure",
+    )
+
+    def __init__(
+        self,
+        file: Union[str, os.PathLike, IO[str]],
+        kinds: Optional[Iterable[str]] = SPAN_KINDS,
+    ) -> None:
+        """Initialize JSONLinesSpanLogger.
+
+        :param file: path of the file to which lines are appended, or a text
+            file object.
+        :param kinds: kinds of the events that are logged, by default the
+            events that end a span. If None, all events are logged.
+        """
+        self.kinds = None if kinds is None else frozenset(kinds)
+        self._owns_file = isinstance(file, (str, os.PathLike))
+        self.file: IO[str] = (
+            open(
+                file, "a", encoding="utf-8"
+            )  # pylint: disable=consider-using-with
+            if isinstance(file, (str, os.PathLike))
+            else file
+        )
+        self._lock = threading.Lock()
+
+    def __call__(self, event: ValidationEvent) -> None:
+        if self.kinds is not None and event.kind not in self.kinds:
+            return
+        record = asdict(event)
+        if event.duration is not None:
+            record["start"] = event.timestamp - event.duration
+        line = json.dumps(record, default=str)
+        with self._lock:
+            self.file.write(line + "\n")
+            self.file.flush()
+
+    def close(self) -> None:
+        """Close the file if it was opened by the logger."""
+        if self._owns_file:
+            self.file.close()
@@ -0,0 +1,321 @@
+"""Fingerprints of schema definitions and of the content of data.
+
+Fingerprints are hexadecimal digests: schemas with the same definition have
+the same :func:`schema_fingerprint` and data with the same content have the
+same :func:`content_fingerprint`.
+"""
+
+import contextlib
+import datetime
+import decimal
+import fractions
+import functools
+import hashlib
+import re
+import types
+import weakref
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+# attributes of schemas and checks that are derived from their definition
+# or cache evaluation strategies, which are not part of their fingerprint.
+_DERIVED_ATTRS = frozenset(
+    ["_validation_plans", "_element_wise_strategies", "_fingerprint"]
+)
+
+# types of objects without attributes whose representation identifies them.
+_REPR_TYPES = (
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    datetime.tzinfo,
+    decimal.Decimal,
+    fractions.Fraction,
+    range,
+    slice,
+    np.generic,
+    np.dtype,
+    pd.Period,
+    pd.Interval,
+    type(pd.NA),
+    type(pd.NaT),
+)
+
+# types of the values of object columns whose string representation, which
+# pandas hashes, identifies them.
+_STR_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    complex,
+    decimal.Decimal,
+    np.number,
+    np.bool_,
+    type(None),
+    type(pd.NA),
+    type(pd.NaT),
+)
+
+
+class _NotFingerprintable(Exception):
+    """Raised for parts of schema definitions that can't be fingerprinted
+    faithfully."""
+
+
+def _token(
+    value: Any, memo: Optional[set] = None, parts: Optional[list] = None
+) -> str:
+    """Get a string that identifies the structure of a schema definition.
+
+    Objects with attributes that are part of the definition are appended to
+    ``parts``, if given.
+    """
+    if isinstance(value, (str, bytes, int, float, complex, bool, type(None))):
+        return repr(value)
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+
+    memo = set() if memo is None else memo
+    if id(value) in memo:
+        return "<cycle>"
+    memo = memo | {id(value)}
+    token = functools.partial(_token, memo=memo, parts=parts)
+
+    if isinstance(value, dict):
+        items = ",".join(f"{token(k)}:{token(v)}" for k, v in value.items())
+        return f"{{{items}}}"
+    if isinstance(value, (list, tuple)):
+        return f"{type(value).__name__}({','.join(map(token, value))})"
+    if isinstance(value, (set, frozenset)):
+        return f"set({','.join(sorted(map(token, value)))})"
+    if isinstance(value, functools.partial):
+        return (
+            f"partial({token(value.func)},{token(value.args)},"
+            f"{token(value.keywords)})"
+        )
+    if isinstance(value, types.MethodType):
+        return f"method({token(value.__func__)},{token(value.__self__)})"
+    if isinstance(value, types.CodeType):
+        return (
+            f"code({value.co_code.hex()},{token(value.co_consts)},"
+            f"{token(value.co_names)})"
+        )
+    if isinstance(value, types.FunctionType):
+        closure = tuple(cell.cell_contents for cell in value.__closure__ or ())
+        return (
+            f"function({value.__module__}.{value.__qualname__},"
+            f"{token(value.__code__)},{token(value.__defaults__)},"
+            f"{token(value.__kwdefaults__)},{token(closure)})"
+        )
+    if isinstance(value, (types.BuiltinFunctionType, types.ModuleType)):
+        return f"{getattr(value, '__module__', None)}.{value.__name__}"
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return f"ndarray({token(value.shape)},{token(value.tolist())})"
+        data = hashlib.blake2b(np.ascontiguousarray(value).view(np.uint8))
+        return f"ndarray({value.dtype.str},{value.shape},{data.hexdigest()})"
+    if isinstance(value, (pd.Series, pd.DataFrame, pd.Index)):
+        content = content_fingerprint(
+            value.to_series() if isinstance(value, pd.Index) else value
+        )
+        if content is None:
+            raise _NotFingerprintable(value)
+        return f"{token(type(value))}({content})"
+    if isinstance(value, re.Pattern):
+        return f"re({value.pattern!r},{value.flags})"
+    attrs = getattr(value, "__dict__", None)
+    if attrs is not None:
+        if parts is not None:
+            parts.append(value)
+        attrs = {k: v for k, v in attrs.items() if k not in _DERIVED_ATTRS}
+        return f"{token(type(value))}{token(attrs)}"
+    if (
+        isinstance(value, _REPR_TYPES)
+        or type(value).__repr__ is object.__repr__
+    ):
+        # the default representation includes the id of the object
+        return f"{token(type(value))}({value!r})"
+    # other representations may be abbreviated, e.g. of large arrays
+    raise _NotFingerprintable(value)
+
+
+def schema_fingerprint(
+    schema: Any, *, parts: Optional[list] = None
+) -> Optional[str]:
+    """Get a fingerprint of the definition of a schema.
+
+    Schemas with the same fingerprint validate data in the same way. The
+    fingerprint of check functions includes their bytecode, constants,
+    default arguments and the values of the variables of their closures,
+    but not the global variables that they reference. Arrays and pandas
+    objects are fingerprinted by their content.
+
+    :param schema: schema or schema component.
+    :param parts: if given, the schema components, checks and other objects
+        with attributes that are part of the definition are appended to it.
+    :returns: hexadecimal digest, or None if the definition references
+        objects that can't be identified by their representation.
+    """
+    try:
+        token = _token(schema, parts=parts)
+    except _NotFingerprintable:
+        return None
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+
+def _update_digest(digest, values: Union[pd.Series, pd.Index]) -> None:
+    """Add the values of a series or index to a content digest."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # the values are hashed without their categories
+        digest.update(repr(values.dtype.ordered).encode())
+        _update_digest(digest, values.dtype.categories)
+    if isinstance(values, pd.RangeIndex):
+        digest.update(repr(values).encode())
+    elif isinstance(values.dtype, np.dtype) and values.dtype.kind in "biufcmM":
+        # hash the buffer of numpy arrays directly
+        digest.update(np.ascontiguousarray(values.to_numpy()).view(np.uint8))
+    else:
+        if values.dtype == object:
+            # objects are hashed by their string representation
+            codes, value_types = pd.factorize(values.map(type))
+            if not all(issubclass(t, _STR_TYPES) for t in value_types):
+                raise TypeError("values can't be hashed faithfully")
+            digest.update(repr([_token(t) for t in value_types]).encode())
+            digest.update(np.asarray(codes, dtype=np.int64))
+        digest.update(
+            pd.util.hash_pandas_object(values, index=False).to_numpy()
+        )
+
+
+def content_fingerprint(obj: Union[pd.DataFrame, pd.Series]) -> Optional[str]:
+    """Get a fingerprint of the content of a pandas object.
+
+    The fingerprint combines the labels and data types of the columns with
+    the bytes of the columns with numpy data types and the 64-bit hashes of
+    the values of other columns and of the index computed with
+    :func:`pandas.util.hash_pandas_object`. Values of object columns are
+    hashed by their string representation, so the type of each value is
+    also part of the fingerprint, and the categories of categorical columns
+    are hashed with their values.
+
+    :param obj: the pandas object.
+    :returns: hexadecimal digest, or None if the object isn't a dataframe or
+        series or its values can't be hashed, e.g. objects other than
+        strings, bytes and numbers, whose string representation may not
+        identify them.
+    """
+    if isinstance(obj, pd.DataFrame):
+        columns = [obj.iloc[:, i] for i in range(obj.shape[1])]
+        header = (list(obj.columns), obj.columns.names)
+    elif isinstance(obj, pd.Series):
+        columns, header = [obj], obj.name
+    else:
+        return None
+    # sha256 is hardware-accelerated on most CPUs
+    digest = hashlib.sha256()
+    digest.update(
+        repr(
+            (
+                type(obj).__name__,
+                obj.shape,
+                header,
+                obj.index.names,
+                str(obj.index.dtype),
+                [str(column.dtype) for column in columns],
+            )
+        ).encode()
+    )
+    try:
+        _update_digest(digest, obj.index)
+        for column in columns:
+            _update_digest(digest, column)
+    except TypeError:
+        # e.g. unhashable values like lists
+        return None
+    return digest.hexdigest()[:32]
+
+
+# for each object that is part of the definition of fingerprinted schemas,
+# weak references to these schemas by id, so that setting an attribute of
+# a schema component or check only invalidates the memoized fingerprints of
+# the schemas that it's part of.
+_DEPENDENTS: Dict[int, Dict[int, weakref.ref]] = {}
+
+
+# set while modifying new copies of schemas within validation, which aren't
+# referenced by other schemas.
+_MODIFYING_COPIES: ContextVar[bool] = ContextVar(
+    "pandera_modifying_copies", default=False
+)
+
+
+def invalidate_fingerprints(obj: Any) -> None:
+    """Invalidate the memoized fingerprints of an object and of the schemas
+    that it's part of.
+
+    Called when an attribute of a schema, schema component or check is set.
+    Objects referenced by schemas, like the ``columns`` dictionary or the
+    ``checks`` list, shouldn't be modified in-place, or this function must
+    be called on the schema afterwards.
+    """
+    obj.__dict__.pop("_fingerprint", None)
+    if _MODIFYING_COPIES.get():
+        return
+    for ref in list(_DEPENDENTS.get(id(obj), {}).values()):
+        dependent = ref()
+        if dependent is not None:
+            dependent.__dict__.pop("_fingerprint", None)
+
+
+@contextlib.contextmanager
+def modifying_copies():
+    """Context manager within which modifying schemas doesn't invalidate the
+    memoized fingerprints of other schemas.
+
+    Used when validation modifies new copies of schemas, which can't be
+    referenced by schemas that were already fingerprinted.
+    """
+    token = _MODIFYING_COPIES.set(True)
+    try:
+        yield
+    finally:
+        _MODIFYING_COPIES.reset(token)
+
+
+def _add_dependent(part: Any, schema: Any) -> None:
+    """Record that an object is part of the definition of a schema."""
+    dependents = _DEPENDENTS.get(id(part))
+    if dependents is None:
+        try:
+            weakref.finalize(part, _DEPENDENTS.pop, id(part), None)
+        except TypeError:
+            # objects that can't be weakly referenced aren't schema
+            # components or checks
+            return
+        dependents = _DEPENDENTS[id(part)] = {}
+    dependents[id(schema)] = weakref.ref(schema)
+
+
+def memoized_fingerprint(schema: Any) -> Optional[str]:
+    """Get the fingerprint of a schema, memoized on the schema.
+
+    :param schema: schema or schema component.
+    :returns: hexadecimal digest, see :func:`schema_fingerprint`.
+    """
+    memo = schema.__dict__.get("_fingerprint")
+    # the memo is copied with the schema, but copies aren't recorded as
+    # dependents of their components
+    if memo is not None and memo[0] == id(schema):
+        return memo[1]
+    parts: List[Any] = []
+    fingerprint = schema_fingerprint(schema, parts=parts)
+    for part in parts:
+        if part is not schema:
+            _add_dependent(part, schema)
+    # set in __dict__ so that the memo doesn't invalidate fingerprints
+    schema.__dict__["_fingerprint"] = (id(schema), fingerprint)
+    return fingerprint
@@ -0,0 +1,237 @@
+"""Fused evaluation of built-in checks on a series.
+
+Built-in :class:`~pandera.checks.Check` methods with registered statistics,
+e.g. ``Check.ge(0)`` or ``Check.isin([1, 2, 3])``, are evaluated together
+on the numpy values of a numeric series: the null mask is computed once, and
+the comparisons write into one reusable boolean buffer instead of creating a
+``pd.Series`` for each check. Only checks that fail are evaluated again by
+calling the check, which computes their check output and failure cases.
+
+Comparison checks whose bounds contain the minimum and maximum of the series
+pass without comparing each value, and ``isin`` checks with many values
+compare the unique values of the series. The null mask, the minimum and
+maximum and the unique values are shared by the checks of a column, see
+:mod:`pandera.derived_arrays`.
+"""
+
+import math
+import operator
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .checks import Check, CheckResult
+from .derived_arrays import DerivedArrays, derived_arrays
+
+# writes the check output of the values of a series into a boolean buffer
+Kernel = Callable[[DerivedArrays, np.ndarray], Any]
+# whether a check passes for all the values between a minimum and a maximum
+BoundsKernel = Callable[[Any, Any], bool]
+
+
+def _is_number(value: Any) -> bool:
+    if isinstance(value, (float, np.floating)):
+        return not math.isnan(value)
+    return isinstance(value, (int, np.integer, np.bool_))
+
+
+def _comparison_kernel(ufunc: np.ufunc, stat: str):
+    def kernel(statistics: Dict[str, Any]) -> Optional[Kernel]:
+        value = statistics[stat]
+        if not _is_number(value):
+            return None
+        return lambda arrays, out: ufunc(arrays.values(), value, out=out)
+
+    return kernel
+
+
+def _includes(statistics: Dict[str, Any], bound: str) -> bool:
+    # statistics of arguments that aren't passed are None, and bounds are
+    # included by default.
+    include = statistics[f"include_{bound}"]
+    return include is None or bool(include)
+
+
+def _in_range_kernel(statistics: Dict[str, Any]) -> Optional[Kernel]:
+    min_value, max_value = statistics["min_value"], statistics["max_value"]
+    if not _is_number(min_value) or not _is_number(max_value):
+        return None
+    left = np.greater_equal if _includes(statistics, "min") else np.greater
+    right = np.less_equal if _includes(statistics, "max") else np.less
+
+    def kernel(arrays, out):
+        values = arrays.values()
+        left(values, min_value, out=out)
+        out &= right(values, max_value)
+
+    return kernel
+
+
+# above this number of values, isin checks use the pandas hash table
+# instead of comparing the data with each value.
+_MAX_ISIN_COMPARISONS = 64
+
+
+def _isin_kernel(stat: str, invert: bool):
+    def kernel(statistics: Dict[str, Any]) -> Optional[Kernel]:
+        values_set = statistics[stat]
+        if values_set is None or not all(map(_is_number, values_set)):
+            return None
+        test_values = list(values_set)
+
+        def isin(arrays, out):
+            if len(test_values) > _MAX_ISIN_COMPARISONS:
+                # look up the unique values of the series, which are shared
+                # by the isin checks of the series, and the code of null
+                # values selects the last value, i.e. False.
+                codes, uniques = arrays.factorized()
+                uniques_isin = np.append(
+                    pd.Series(uniques, copy=False).isin(test_values), False
+                )
+                np.take(uniques_isin, codes, out=out)
+            else:
+                values = arrays.values()
+                out[:] = False
+                equal = np.empty_like(out)
+                for value in test_values:
+                    out |= np.equal(values, value, out=equal)
+            if invert:
+                np.logical_not(out, out=out)
+
+        return isin
+
+    return kernel
+
+
+# built-in check methods that can be fused, by check name. Each kernel
+# factory returns None if the check statistics aren't numbers.
+_KERNELS: Dict[str, Callable[[Dict[str, Any]], Optional[Kernel]]] = {
+    "equal_to": _comparison_kernel(np.equal, "value"),
+    "not_equal_to": _comparison_kernel(np.not_equal, "value"),
+    "greater_than": _comparison_kernel(np.greater, "min_value"),
+    "greater_than_or_equal_to": _comparison_kernel(
+        np.greater_equal, "min_value"
+    ),
+    "less_than": _comparison_kernel(np.less, "max_value"),
+    "less_than_or_equal_to": _comparison_kernel(np.less_equal, "max_value"),
+    "in_range": _in_range_kernel,
+    "isin": _isin_kernel("allowed_values", invert=False),
+    "notin": _isin_kernel("forbidden_values", invert=True),
+}
+
+
+def _in_range_bounds(statistics: Dict[str, Any]) -> BoundsKernel:
+    min_value, max_value = statistics["min_value"], statistics["max_value"]
+    left = operator.ge if _includes(statistics, "min") else operator.gt
+    right = operator.le if _includes(statistics, "max") else operator.lt
+    return lambda low, high: left(low, min_value) and right(high, max_value)
+
+
+# comparison checks that pass if they pass for the minimum and maximum of
+# the values, by check name. They're only used if the check can be fused,
+# i.e. its statistics are numbers.
+_BOUNDS_KERNELS: Dict[str, Callable[[Dict[str, Any]], BoundsKernel]] = {
+    "equal_to": lambda stats: lambda low, high: low == stats["value"] == high,
+    "not_equal_to": lambda stats: lambda low, high: not (
+        low <= stats["value"] <= high
+    ),
+    "greater_than": lambda stats: lambda low, _: low > stats["min_value"],
+    "greater_than_or_equal_to": lambda stats: lambda low, _: (
+        low >= stats["min_value"]
+    ),
+    "less_than": lambda stats: lambda _, high: high < stats["max_value"],
+    "less_than_or_equal_to": lambda stats: lambda _, high: (
+        high <= stats["max_value"]
+    ),
+    "in_range": _in_range_bounds,
+}
+
+
+def _check_kernel(check: Any) -> Optional[Kernel]:
+    """Get the fused kernel of a check, or None if it can't be fused."""
+    if (
+        type(check) is not Check  # pylint: disable=unidiomatic-typecheck
+        or check.name not in _KERNELS
+        or not check.statistics
+        or check.element_wise
+        or check.groupby is not None
+        or check.groups is not None
+        # only the built-in check functions are known to match the kernels
+        or not getattr(check._check_fn, "__qualname__", "").startswith(
+            f"Check.{check.name}."
+        )
+    ):
+        return None
+    try:
+        return _KERNELS[check.name](check.statistics)
+    except (KeyError, TypeError):
+        return None
+
+
+def _passes_bounds(check: Any, arrays: DerivedArrays) -> bool:
+    """Whether a check passes for all the values between their bounds."""
+    if check.name not in _BOUNDS_KERNELS or (
+        not check.ignore_na and arrays.n_nulls()
+    ):
+        return False
+    min_max = arrays.min_max()
+    if min_max is None:
+        return False
+    try:
+        with np.errstate(all="ignore"):
+            return bool(
+                _BOUNDS_KERNELS[check.name](check.statistics)(*min_max)
+            )
+    except (KeyError, TypeError, ValueError, OverflowError):
+        return False
+
+
+def fused_check_results(
+    checks: List[Any], series: pd.Series
+) -> Dict[int, CheckResult]:
+    """Evaluate the built-in checks of a numeric series together.
+
+    :param checks: checks of the series schema.
+    :param series: the series to validate.
+    :returns: results of the fused checks that passed, by check index. The
+        check output of these results is a scalar True. Checks that failed or
+        can't be fused aren't included.
+    """
+    if (
+        type(series) is not pd.Series  # pylint: disable=unidiomatic-typecheck
+        or not isinstance(series.dtype, np.dtype)
+        or series.dtype.kind not in "biuf"
+    ):
+        return {}
+    kernels = {
+        check_index: kernel
+        for check_index, kernel in (
+            (check_index, _check_kernel(check))
+            for check_index, check in enumerate(checks)
+        )
+        if kernel is not None
+    }
+    if not kernels:
+        return {}
+
+    arrays = derived_arrays(series) or DerivedArrays(series)
+    out: Optional[np.ndarray] = None
+    results = {}
+    for check_index, kernel in kernels.items():
+        check = checks[check_index]
+        if _passes_bounds(check, arrays):
+            results[check_index] = CheckResult(True, True, series, None)
+            continue
+        if out is None:
+            out = np.empty(len(series), dtype=bool)
+        try:
+            with np.errstate(all="ignore"):
+                kernel(arrays, out)
+        except (TypeError, ValueError, OverflowError):
+            continue
+        if check.ignore_na and arrays.n_nulls():
+            out |= arrays.null_mask()
+        if out.all():
+            results[check_index] = CheckResult(True, True, series, None)
+    return results
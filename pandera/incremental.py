@@ -0,0 +1,229 @@
+"""Incremental validation of dataframes that grow by appending rows.
+
+Each call of :meth:`~pandera.DataFrameSchema.validate_incremental` only
+validates the rows appended since the previous call, e.g. micro-batches
+appended to a rolling buffer. Validations that depend on the whole
+dataframe are carried forward in an :class:`IncrementalState`:
+
+- the ``unique`` constraints of the schema, its columns and its index are
+  checked against the hashes of the values of the previous rows, see
+  :class:`~pandera.uniqueness.DuplicateTracker`.
+- row-wise checks, i.e. the built-in checks listed in
+  :data:`~pandera.sharding.ROW_WISE_CHECKS` and ``element_wise`` checks,
+  are evaluated on the new rows only.
+- other checks, e.g. checks of aggregates like the mean of a column,
+  ``groupby`` checks and hypotheses, are evaluated on the whole dataframe.
+"""
+
+import copy
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from . import errors
+from .error_handlers import SchemaErrorHandler
+from .hypotheses import Hypothesis
+from .schemas import (
+    _SKIPPED_CHECKS,
+    DataFrameSchema,
+    _check_error,
+    _handle_check_results,
+    convert_uniquesettings,
+)
+from .sharding import ROW_WISE_CHECKS, _check_components
+from .uniqueness import DuplicateTracker, _approximate_unique
+
+
+class IncrementalState:
+    """State of the incremental validation of a dataframe.
+
+    A new state is used for each dataframe that grows by appending rows.
+    The state is only updated when the new rows pass validation, so that
+    invalid rows can be fixed and validated again.
+    """
+
+    def __init__(self) -> None:
+        #: number of rows that were validated, i.e. the watermark of the
+        #: incremental validation.
+        self.n_rows = 0
+        #: fingerprint of the schema that validated the rows.
+        self.schema_fingerprint: Optional[str] = None
+        self._last_label: Any = None
+        self._trackers: Dict[Any, DuplicateTracker] = {}
+
+    def __repr__(self) -> str:
+        return f"<IncrementalState n_rows={self.n_rows}>"
+
+
+def _is_row_wise(check) -> bool:
+    """Whether a check is evaluated independently for each row."""
+    if isinstance(check, Hypothesis) or check.groupby is not None:
+        return False
+    return check.element_wise or (
+        check.statistics is not None and check.name in ROW_WISE_CHECKS
+    )
+
+
+def _same_label(label: Any, other: Any) -> bool:
+    try:
+        # pylint: disable=comparison-with-itself
+        return bool(
+            label is other
+            or label == other
+            or (label != label and other != other)
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+def _whole_frame_checks(
+    schema: DataFrameSchema, columns: pd.Index
+) -> List[Tuple[str, Any, Any, int, Any]]:
+    """Find the checks of a schema that need the whole dataframe.
+
+    :returns: list of ``(kind, key, schema_component, check_index, check)``
+        tuples, see :func:`pandera.sharding._check_components`.
+    """
+    return [
+        (kind, key, component, check_index, check)
+        for kind, key, component in _check_components(schema, columns)
+        for check_index, check in enumerate(component.checks)
+        if not _is_row_wise(check)
+    ]
+
+
+def validate_incremental(
+    schema: DataFrameSchema,
+    check_obj: pd.DataFrame,
+    state: IncrementalState,
+    lazy: bool = False,
+    n_jobs: Optional[int] = None,
+) -> pd.DataFrame:
+    """Validate the rows appended to a dataframe since the last validation.
+
+    :param schema: dataframe schema to validate with.
+    :param check_obj: dataframe whose first ``state.n_rows`` rows were
+        validated by previous calls with the same state.
+    :param state: state of the incremental validation, which is updated if
+        the new rows pass validation.
+    :param lazy: if True, lazily evaluates the new rows against all
+        validation checks and raises a ``SchemaErrors``. Otherwise, raise
+        ``SchemaError`` as soon as one occurs.
+    :param n_jobs: number of threads used to validate the new rows.
+    :returns: the validated dataframe. If validation doesn't modify the new
+        rows, e.g. by coercing their data types, ``check_obj`` itself is
+        returned, otherwise the previous rows are concatenated with the
+        validated new rows.
+    :raises ValueError: if the state was created by another schema, or if
+        the previously validated rows were removed or reordered.
+    """
+    if not isinstance(check_obj, pd.DataFrame):
+        raise TypeError(f"expected pd.DataFrame, got {type(check_obj)}")
+    if state.schema_fingerprint not in (None, schema.fingerprint):
+        raise ValueError(
+            "the incremental validation state was created by another schema"
+        )
+    n_rows = state.n_rows
+    if len(check_obj) < n_rows or (
+        n_rows
+        and not _same_label(check_obj.index[n_rows - 1], state._last_label)
+    ):
+        raise ValueError(
+            f"the {n_rows} previously validated rows were removed or "
+            "reordered. Use a new IncrementalState to validate the whole "
+            "dataframe."
+        )
+    chunk_schema, components = schema._chunk_schema(index_unique=False)
+    trackers = {
+        key: copy.copy(tracker) for key, tracker in state._trackers.items()
+    }
+    if schema.index is not None and getattr(schema.index, "unique", False):
+        trackers.setdefault(
+            None,
+            DuplicateTracker(
+                convert_uniquesettings(schema.index._report_duplicates),
+                approximate=_approximate_unique(schema.index.unique),
+            ),
+        )
+
+    whole_frame_checks = (
+        _whole_frame_checks(schema, check_obj.columns)
+        if check_obj.columns.is_unique
+        else []
+    )
+    new_rows = check_obj.iloc[n_rows:]
+    error_handler = SchemaErrorHandler(lazy)
+    token = _SKIPPED_CHECKS.set(
+        frozenset(
+            (type(component), component.name, check_index, id(check))
+            for _, _, component, check_index, check in whole_frame_checks
+        )
+    )
+    try:
+        validated_rows = chunk_schema._validate(
+            new_rows, lazy=lazy, inplace=False, n_jobs=n_jobs
+        )
+    except errors.SchemaErrors as err:
+        validated_rows = err.data
+        for schema_error_dict in err.schema_errors:
+            error_handler.collect_error(
+                schema_error_dict["reason_code"], schema_error_dict["error"]
+            )
+    finally:
+        _SKIPPED_CHECKS.reset(token)
+
+    schema._collect_chunk_duplicates(
+        chunk_schema, components, validated_rows, trackers, error_handler
+    )
+
+    if validated_rows.columns.equals(new_rows.columns) and (
+        validated_rows.dtypes.equals(new_rows.dtypes)
+    ):
+        validated = check_obj
+    else:
+        # the previous rows were coerced when they were validated, so they
+        # can be cast to the data types of the validated rows.
+        previous_rows = check_obj.iloc[:n_rows][validated_rows.columns]
+        validated = pd.concat(
+            [
+                previous_rows.astype(validated_rows.dtypes.to_dict()),
+                validated_rows,
+            ]
+        )
+
+    for kind, key, component, check_index, check in whole_frame_checks:
+        if kind == "dataframe":
+            obj, check_args = validated, []
+            reason_code = "dataframe_check"
+        elif kind == "column":
+            obj, check_args = validated, [key]
+            reason_code = "schema_component_check"
+        else:
+            obj = validated.index.to_series().reset_index(drop=True)
+            check_args = []
+            reason_code = "schema_component_check"
+        try:
+            _handle_check_results(
+                component, check_index, check, obj, *check_args
+            )
+        except errors.SchemaError as err:
+            error_handler.collect_error(reason_code, err)
+        except Exception as err:  # pylint: disable=broad-except
+            if kind == "dataframe":
+                raise
+            error_handler.collect_error(
+                reason_code,
+                _check_error(component, obj, check, check_index, err),
+                original_exc=err,
+            )
+
+    if error_handler.collected_errors:
+        raise errors.SchemaErrors(
+            schema, error_handler.collected_errors, validated
+        )
+
+    state.n_rows = len(validated)
+    state.schema_fingerprint = schema.fingerprint
+    state._last_label = validated.index[-1] if len(validated) else None
+    state._trackers = trackers
+    return validated
@@ -0,0 +1,243 @@
+"""Instrumentation of the phases of validation.
+
+Validation is divided into phases, e.g. checking the columns of a dataframe
+(``strictness``), coercing data types (``coercion``), checking data types
+(``dtype``), nullability (``nullable``), uniqueness (``unique``) and each
+:class:`~pandera.checks.Check` (``check``). Phases are only recorded within
+:func:`record_validation`, otherwise entering a phase is a no-op.
+
+:example:
+
+>>> import pandas as pd
+>>> import pandera as pa
+>>> from pandera.instrumentation import record_validation
+>>>
+>>> schema = pa.DataFrameSchema({"a": pa.Column(int, pa.Check.ge(0))})
+>>> with record_validation() as recorder:
+...     _ = schema.validate(pd.DataFrame({"a": [1, 2, 3]}))
+>>> print(recorder.to_frame()[["component", "phase", "check", "rows"]])
+         component       phase                        check  rows
+0  DataFrameSchema  strictness                         None     3
+1      Column('a')    nullable                         None     3
+2      Column('a')       dtype                         None     3
+3      Column('a')       check                 fused_checks     3
+4      Column('a')       check  greater_than_or_equal_to(0)     3
+
+Built-in checks of numeric columns are evaluated together in the
+``fused_checks`` phase, see :mod:`pandera.fusion`, and the phases of the
+checks that passed only include reporting their results.
+
+Phases are recorded in the thread or process in which they're validated, so
+``n_jobs`` threads are recorded, but the shards of ``n_shards`` validation
+are validated in other processes and aren't.
+"""
+
+import contextlib
+import time
+import tracemalloc
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+PHASES = ("strictness", "coercion", "dtype", "nullable", "unique", "check")
+
+
+@dataclass(frozen=True)
+class PhaseRecord:
+    """Measurements of a validation phase of a schema or schema component.
+
+    :param component: the schema or schema component, e.g. ``Column('a')``.
+    :param phase: one of :data:`PHASES`.
+    :param check: the name of the check of ``check`` phases.
+    :param check_index: the index of the check in the checks of the
+        component, for ``check`` phases.
+    :param start: start time of the phase from :func:`time.perf_counter`.
+    :param duration: wall time of the phase in seconds.
+    :param rows: number of rows of the validated object.
+    :param nbytes: number of bytes of the validated object, not including
+        the index and the objects referenced by object arrays.
+    :param raised: whether the phase raised an exception, e.g. a
+        ``SchemaError`` because the data is invalid.
+    :param peak_memory: peak size in bytes of the memory blocks allocated
+        during the phase, if memory is traced. See
+        :func:`record_validation`.
+    """
+
+    component: str
+    phase: str
+    check: Optional[str]
+    check_index: Optional[int]
+    start: float
+    duration: float
+    rows: Optional[int]
+    nbytes: Optional[int]
+    raised: bool
+    peak_memory: Optional[int] = None
+
+
+class ValidationRecorder:
+    """Records the phases of validations within :func:`record_validation`."""
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.trace_memory = trace_memory
+        self.records: List[PhaseRecord] = []
+
+    def record(self, record: PhaseRecord) -> None:
+        """Record a validation phase."""
+        # list.append is atomic, so phases can be recorded from threads.
+        self.records.append(record)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Get the recorded phases as a dataframe with one row per phase."""
+        return pd.DataFrame(
+            [asdict(record) for record in self.records],
+            columns=list(PhaseRecord.__dataclass_fields__),
+        )
+
+
+_RECORDERS: ContextVar[Tuple[ValidationRecorder, ...]] = ContextVar(
+    "pandera_validation_recorders", default=()
+)
+
+
+@contextlib.contextmanager
+def record_validation(
+    trace_memory: bool = False,
+) -> Iterator[ValidationRecorder]:
+    """Record the phases of the validations within the context.
+
+    :param trace_memory: if True and :mod:`tracemalloc` is tracing, record
+        the peak memory of each phase. This resets the peak of
+        ``tracemalloc`` and requires python 3.9 or later. The peak memory of
+        phases that are validated concurrently with ``n_jobs`` includes the
+        memory allocated by other threads.
+    :yields: :class:`ValidationRecorder` with the recorded phases.
+    """
+    recorder = ValidationRecorder(trace_memory)
+    token = _RECORDERS.set(_RECORDERS.get() + (recorder,))
+    try:
+        yield recorder
+    finally:
+        _RECORDERS.reset(token)
+
+
+def component_name(component: Any) -> str:
+    """Get the name of a schema or schema component in phase records."""
+    name = getattr(component, "name", None)
+    if name is None:
+        return type(component).__name__
+    return f"{type(component).__name__}({name!r})"
+
+
+def _size(component: Any, obj: Any) -> Tuple[Optional[int], Optional[int]]:
+    """Get the number of rows and bytes of a validated pandas object."""
+    if (
+        isinstance(obj, pd.DataFrame)
+        # columns are validated with the dataframe that contains them
+        and not hasattr(component, "columns")
+        and getattr(component, "name", None) in obj
+    ):
+        obj = obj[component.name]
+    if isinstance(obj, pd.DataFrame):
+        return len(obj), int(obj.memory_usage(index=False).sum())
+    if isinstance(obj, pd.Series):
+        return len(obj), int(obj.memory_usage(index=False))
+    if isinstance(obj, pd.Index):
+        return len(obj), int(obj.memory_usage())
+    return None, None
+
+
+def check_name(check: Any) -> Optional[str]:
+    """Get the name of a check in phase records."""
+    if isinstance(check, str):
+        return check
+    return getattr(check, "error", None) or getattr(check, "name", None)
+
+
+class _Phase:
+    """Context manager that records a validation phase."""
+
+    __slots__ = (
+        "recorders",
+        "component",
+        "phase",
+        "obj",
+        "check",
+        "start",
+        "start_memory",
+    )
+
+    def __init__(self, recorders, component, phase, obj, check) -> None:
+        self.recorders = recorders
+        self.component = component
+        self.phase = phase
+        self.obj = obj
+        self.check = check
+
+    def __enter__(self) -> None:
+        self.start_memory = None
+        if (
+            any(recorder.trace_memory for recorder in self.recorders)
+            and tracemalloc.is_tracing()
+            and hasattr(tracemalloc, "reset_peak")
+        ):
+            tracemalloc.reset_peak()
+            self.start_memory = tracemalloc.get_traced_memory()[0]
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        duration = time.perf_counter() - self.start
+        peak_memory = None
+        if self.start_memory is not None:
+            peak_memory = max(
+                tracemalloc.get_traced_memory()[1] - self.start_memory, 0
+            )
+        rows, nbytes = _size(self.component, self.obj)
+        check, check_index = self.check or (None, None)
+        record = PhaseRecord(
+            component=component_name(self.component),
+            phase=self.phase,
+            check=check,
+            check_index=check_index,
+            start=self.start,
+            duration=duration,
+            rows=rows,
+            nbytes=nbytes,
+            raised=exc_type is not None,
+            peak_memory=peak_memory,
+        )
+        for recorder in self.recorders:
+            recorder.record(record)
+
+
+_NO_PHASE = contextlib.nullcontext()
+
+
+def validation_phase(
+    component: Any,
+    phase: str,
+    obj: Any = None,
+    check: Any = None,
+    check_index: Optional[int] = None,
+):
+    """Context manager that records a validation phase if it's recorded.
+
+    :param component: schema or schema component that is validated.
+    :param phase: one of :data:`PHASES`.
+    :param obj: the validated object.
+    :param check: the check of ``check`` phases, or the name of the
+        checks.
+    :param check_index: the index of the check of ``check`` phases.
+    """
+    recorders = _RECORDERS.get()
+    if not recorders:
+        return _NO_PHASE
+    return _Phase(
+        recorders,
+        component,
+        phase,
+        obj,
+        None if check is None else (check_name(check), check_index),
+    )
@@ -228,6 +228,7 @@ class SchemaModel(metaclass=_MetaSchema):
                 "title": cls.__config__.title,
                 "description": cls.__config__.description or cls.__doc__,
                 "unique_column_names": cls.__config__.unique_column_names,
+                "max_failure_cases": cls.__config__.max_failure_cases,
             }
         cls.__schema__ = DataFrameSchema(
             columns,
@@ -257,12 +258,22 @@ class SchemaModel(metaclass=_MetaSchema):
         random_state: Optional[int] = None,
         lazy: bool = False,
         inplace: bool = False,
+        n_jobs: Optional[int] = None,
+        n_shards: Optional[int] = None,
     ) -> DataFrameBase[TSchemaModel]:
         """%(validate_doc)s"""
         return cast(
             DataFrameBase[TSchemaModel],
             cls.to_schema().validate(
-                check_obj, head, tail, sample, random_state, lazy, inplace
+                check_obj,
+                head,
+                tail,
+                sample,
+                random_state,
+                lazy,
+                inplace,
+                n_jobs,
+                n_shards,
             ),
         )
 
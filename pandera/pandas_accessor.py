@@ -16,6 +16,7 @@ class PanderaAccessor:
         """Initialize the pandera accessor."""
         self._pandas_obj = pandas_obj
         self._schema: Optional[Schemas] = None
+        self._schema_fingerprint: Optional[str] = None
 
     @staticmethod
     def check_schema_type(schema: Schemas):
@@ -26,6 +27,7 @@ class PanderaAccessor:
         """Add a schema to the pandas object."""
         self.check_schema_type(schema)
         self._schema = schema
+        self._schema_fingerprint = None
         return self._pandas_obj
 
     @property
@@ -33,6 +35,13 @@ class PanderaAccessor:
         """Access schema metadata."""
         return self._schema
 
+    @property
+    def schema_fingerprint(self) -> Optional[str]:
+        """Fingerprint of the schema, stored when it's first accessed."""
+        if self._schema_fingerprint is None and self._schema is not None:
+            self._schema_fingerprint = self._schema.fingerprint
+        return self._schema_fingerprint
+
 
 @pd.api.extensions.register_dataframe_accessor("pandera")
 class PanderaDataFrameAccessor(PanderaAccessor):
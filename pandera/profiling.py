@@ -0,0 +1,172 @@
+"""Profile the validation of data with a schema."""
+
+import tracemalloc
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from . import errors
+from .instrumentation import check_name, component_name, record_validation
+
+# validation phases of the errors of built-in validations, by their check.
+_ERROR_PHASES = {
+    "column_in_schema": "strictness",
+    "column_in_dataframe": "strictness",
+    "column_ordered": "strictness",
+    "dataframe_column_labels_unique": "strictness",
+    "not_nullable": "nullable",
+    "field_uniqueness": "unique",
+    "multiple_fields_uniqueness": "unique",
+}
+
+PROFILE_COLUMNS = [
+    "component",
+    "phase",
+    "check",
+    "check_index",
+    "time",
+    "calls",
+    "rows",
+    "failures",
+    "peak_memory",
+    "time_share",
+]
+
+
+def _error_key(
+    error: errors.SchemaError,
+) -> Optional[Tuple[str, str, Optional[str], Optional[int]]]:
+    """Get the profile row of a schema error."""
+    component = component_name(error.schema)
+    failure_cases = error.failure_cases
+    if (
+        hasattr(error.schema, "indexes")
+        and isinstance(failure_cases, pd.DataFrame)
+        and "column" in failure_cases
+        and failure_cases["column"].nunique() == 1
+        and failure_cases["column"].iloc[0] in error.schema.columns
+    ):
+        # MultiIndex levels are validated as the columns of a dataframe, and
+        # their errors are re-raised with the MultiIndex.
+        component = component_name(
+            error.schema.columns[failure_cases["column"].iloc[0]]
+        )
+    check = error.check
+    if isinstance(check, str):
+        phase = _ERROR_PHASES.get(check)
+        if phase is None and check.startswith("dtype("):
+            phase = "dtype"
+        elif phase is None and check.startswith("coerce_dtype("):
+            phase = "coercion"
+        if phase is None:
+            return None
+        return component, phase, None, None
+    return (
+        component,
+        "check",
+        check_name(check),
+        error.check_index,
+    )
+
+
+def _n_failures(error: errors.SchemaError) -> int:
+    failure_cases = error.failure_cases
+    n_failure_cases = (
+        len(failure_cases)
+        if isinstance(failure_cases, (pd.Series, pd.DataFrame))
+        else 1
+    )
+    # failure cases may be truncated by max_failure_cases or n_failure_cases
+    if error.failure_count is None:
+        return n_failure_cases
+    return max(error.failure_count, n_failure_cases)
+
+
+def profile_validation(
+    schema: Any,
+    check_obj: Any,
+    trace_memory: bool = True,
+    **validate_kwargs,
+) -> pd.DataFrame:
+    """Validate data lazily and report the time spent by each validation.
+
+    :param schema: schema or schema component that validates the data.
+    :param check_obj: data to validate.
+    :param trace_memory: if True, trace the peak memory of each validation
+        with :mod:`tracemalloc`, which slows down validation.
+    :param validate_kwargs: keyword arguments of ``schema.validate``.
+    :returns: dataframe with one row per validation phase of each schema
+        component and check, sorted by decreasing time, with the columns:
+
+        - ``component``, ``phase``, ``check`` and ``check_index``: the
+          validation, see :class:`~pandera.instrumentation.PhaseRecord`.
+        - ``time``: total wall time in seconds.
+        - ``calls``: number of times it was evaluated, e.g. for each column
+          matched by a regex column.
+        - ``rows``: total number of rows it evaluated.
+        - ``failures``: number of failure cases.
+        - ``peak_memory``: maximum of the peak memory in bytes of its calls,
+          or NaN if memory isn't traced.
+        - ``time_share``: share of the total time of all validations.
+    """
+    start_tracing = trace_memory and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+    schema_errors = []
+    try:
+        with record_validation(trace_memory=trace_memory) as recorder:
+            try:
+                schema.validate(check_obj, lazy=True, **validate_kwargs)
+            except errors.SchemaErrors as exc:
+                schema_errors = [
+                    error_dict["error"] for error_dict in exc.schema_errors
+                ]
+            except errors.SchemaError as exc:
+                schema_errors = [exc]
+    finally:
+        if start_tracing:
+            tracemalloc.stop()
+
+    records = recorder.to_frame()
+    keys = ["component", "phase", "check", "check_index"]
+    report = (
+        records.astype({"check_index": "Int64"})
+        # keep records without checks in the groups
+        .fillna({"check": ""})
+        .groupby(keys, sort=False, dropna=False)
+        .agg(
+            time=("duration", "sum"),
+            calls=("duration", "size"),
+            rows=("rows", "sum"),
+            peak_memory=("peak_memory", "max"),
+        )
+        .reset_index()
+    )
+    report["check"] = [check or None for check in report["check"]]
+
+    failures: Dict[Tuple, int] = {}
+    for error in schema_errors:
+        key = _error_key(error)
+        if key is not None:
+            failures[key] = failures.get(key, 0) + _n_failures(error)
+    report["failures"] = [
+        failures.get(
+            (
+                row.component,
+                row.phase,
+                row.check,
+                None if pd.isna(row.check_index) else row.check_index,
+            ),
+            0,
+        )
+        for row in report.itertuples()
+    ]
+    total_time = report["time"].sum()
+    report["time_share"] = (
+        report["time"] / total_time if total_time > 0 else 0.0
+    )
+    return (
+        report[PROFILE_COLUMNS]
+        .sort_values("time", ascending=False, kind="stable")
+        .reset_index(drop=True)
+    )
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import warnings
-from copy import copy, deepcopy
+from copy import copy
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
@@ -10,14 +10,17 @@ import pandas as pd
 
 from . import check_utils, errors
 from . import strategies as st
-from .dtypes import UniqueSettings
+from .dtypes import DataType, UniqueSettings
 from .error_handlers import SchemaErrorHandler
+from .fingerprints import modifying_copies
 from .schemas import (
     CheckList,
     DataFrameSchema,
     PandasDtypeInputTypes,
     SeriesSchemaBase,
     StrictType,
+    _copy_check_obj,
+    _schema_definition,
 )
 
 
@@ -181,7 +184,7 @@ class Column(SeriesSchemaBase):
         :returns: validated DataFrame.
         """
         if not inplace:
-            check_obj = check_obj.copy()
+            check_obj = _copy_check_obj(check_obj)
 
         if self._name is None:
             raise errors.SchemaError(
@@ -192,8 +195,64 @@ class Column(SeriesSchemaBase):
                 "method.",
             )
 
+        column_keys_to_check = (
+            self.get_regex_columns(check_obj.columns)
+            if self._regex
+            else [self._name]
+        )
+
+        return self._validate_column_keys(
+            check_obj,
+            column_keys_to_check,
+            head,
+            tail,
+            sample,
+            random_state,
+            lazy,
+            inplace,
+        )
+
+    def _validate_column_keys(
+        self,
+        check_obj: pd.DataFrame,
+        column_keys: Union[pd.Index, List[Any]],
+        head: Optional[int] = None,
+        tail: Optional[int] = None,
+        sample: Optional[int] = None,
+        random_state: Optional[int] = None,
+        lazy: bool = False,
+        inplace: bool = False,
+        coerce: Optional[bool] = None,
+        dtype: Optional[DataType] = None,
+    ) -> pd.DataFrame:
+        """Validate the columns of a DataFrame matched by this Column.
+
+        :param check_obj: pandas DataFrame to validate.
+        :param column_keys: column names in ``check_obj`` to validate, e.g.
+            the columns matched by a regex column name.
+        :param coerce: override the ``coerce`` attribute of the column.
+        :param dtype: override the data type of the column.
+        :returns: validated DataFrame.
+        """
+        if coerce is None:
+            coerce = self.coerce
+
+        # per-validation overrides are applied to shallow copies of the
+        # column, which share the checks with the original column, only if
+        # needed.
+        schema = self
+        if dtype is not None and dtype is not self._dtype:
+            schema = copy(self)
+            with modifying_copies():
+                schema._dtype = dtype
+
         def validate_column(check_obj, column_name):
-            super(Column, copy(self).set_name(column_name)).validate(
+            if column_name == schema._name:
+                column_schema = schema
+            else:
+                with modifying_copies():
+                    column_schema = copy(schema).set_name(column_name)
+            super(Column, column_schema).validate(
                 check_obj,
                 head,
                 tail,
@@ -203,14 +262,8 @@ class Column(SeriesSchemaBase):
                 inplace=inplace,
             )
 
-        column_keys_to_check = (
-            self.get_regex_columns(check_obj.columns)
-            if self._regex
-            else [self._name]
-        )
-
-        for column_name in column_keys_to_check:
-            if self.coerce:
+        for column_name in column_keys:
+            if coerce:
                 check_obj[column_name] = self.coerce_dtype(
                     check_obj[column_name]
                 )
@@ -321,7 +374,7 @@ class Column(SeriesSchemaBase):
         def _compare_dict(obj):
             return {
                 k: v if k != "_checks" else set(v)
-                for k, v in obj.__dict__.items()
+                for k, v in _schema_definition(obj).items()
             }
 
         return _compare_dict(self) == _compare_dict(other)
@@ -440,7 +493,7 @@ class Index(SeriesSchemaBase):
             return self.strategy(size=size).example()
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        return _schema_definition(self) == _schema_definition(other)
 
 
 class MultiIndex(DataFrameSchema):
@@ -622,6 +675,8 @@ class MultiIndex(DataFrameSchema):
         random_state: Optional[int] = None,
         lazy: bool = False,
         inplace: bool = False,
+        n_jobs: Optional[int] = None,
+        n_shards: Optional[int] = None,
     ) -> Union[pd.DataFrame, pd.Series]:
         """Validate DataFrame or Series MultiIndex.
 
@@ -638,6 +693,8 @@ class MultiIndex(DataFrameSchema):
             ``SchemaError`` as soon as one occurs.
         :param inplace: if True, applies coercion to the object of validation,
             otherwise creates a copy of the data.
+        :param n_jobs: number of threads used to validate the index levels.
+        :param n_shards: number of row shards validated in a process pool.
         :returns: validated DataFrame or Series.
         """
         # pylint: disable=too-many-locals
@@ -653,29 +710,39 @@ class MultiIndex(DataFrameSchema):
         # it leads to some weird behavior when calling coerce_dtype within the
         # DataFrameSchema.validate call. Need to fix this by having MultiIndex
         # not inherit from DataFrameSchema.
-        self_copy = deepcopy(self)
-        self_copy.coerce = False
-        for index in self_copy.indexes:
-            index.coerce = False
-
-        # rename integer-based column names in case of duplicate index names,
-        # with at least one named index.
-        if (
-            not all(x is None for x in check_obj.index.names)
-            and len(set(check_obj.index.names)) != check_obj.index.nlevels
-        ):
-            index_names = []
-            for i, name in enumerate(check_obj.index.names):
-                name = i if name is None else name
-                if name not in index_names:
-                    index_names.append(name)
-
-            columns = {}
-            for name, (_, column) in zip(
-                index_names, self_copy.columns.items()
+        with modifying_copies():
+            self_copy = copy(self)
+            self_copy.coerce = False
+            self_copy.indexes = []
+            for index in self.indexes:
+                index_copy = copy(index)
+                index_copy.coerce = False
+                self_copy.indexes.append(index_copy)
+
+            # rename integer-based column names in case of duplicate index
+            # names, with at least one named index.
+            if (
+                not all(x is None for x in check_obj.index.names)
+                and len(set(check_obj.index.names)) != check_obj.index.nlevels
             ):
-                columns[name] = column.set_name(name)
-            self_copy.columns = columns
+                index_names = []
+                for i, name in enumerate(check_obj.index.names):
+                    name = i if name is None else name
+                    if name not in index_names:
+                        index_names.append(name)
+
+                columns = {}
+                for name, (_, column) in zip(
+                    index_names, self_copy.columns.items()
+                ):
+                    columns[name] = copy(column).set_name(name)
+                self_copy.columns = columns
+            else:
+                # the copy shares the compiled validation plans of this
+                # MultiIndex, since it has the same columns.
+                self_copy.__dict__[
+                    "_validation_plans"
+                ] = self.__dict__.setdefault("_validation_plans", {})
 
         def to_dataframe(multiindex):
             """
@@ -708,6 +775,8 @@ class MultiIndex(DataFrameSchema):
                 random_state,
                 lazy,
                 inplace,
+                n_jobs,
+                n_shards,
             )
         except errors.SchemaErrors as err:
             # This is a hack to re-raise the SchemaErrors exception and change
@@ -719,7 +788,8 @@ class MultiIndex(DataFrameSchema):
                 error = errors.SchemaError(
                     self,
                     check_obj,
-                    error.args[0],
+                    # render the message of the error only if it's accessed
+                    error.__str__,
                     error.failure_cases.assign(column=error.schema.name),
                     error.check,
                     error.check_index,
@@ -781,6 +851,3 @@ class MultiIndex(DataFrameSchema):
             f"{indent}ordered={self.ordered}\n"
             ")>"
         )
-
-    def __eq__(self, other):
-        return self.__dict__ == other.__dict__
@@ -3,20 +3,32 @@
 
 from __future__ import annotations
 
-import time
+import collections
+import contextvars
 import copy
+import functools
 import itertools
 import os
+import time
 import traceback
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
     List,
+    NamedTuple,
     Optional,
+    Sequence,
+    Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -27,19 +39,39 @@ from typing import (
 import numpy as np
 import pandas as pd
 
-from . import check_utils, errors
+from . import check_utils, derived_arrays, errors, events
 from . import strategies as st
-from .checks import Check
+from .checks import Check, CheckResult
+from .config import CONFIG
 from .dtypes import DataType, UniqueSettings
-from .engines import pandas_engine
+from .engines import numpy_engine, pandas_engine
 from .error_formatters import (
     format_generic_error_message,
     format_vectorized_error_message,
+    lazy_message,
     reshape_failure_cases,
     scalar_failure_case,
 )
-from .error_handlers import SchemaErrorHandler
+from .error_handlers import (
+    SchemaErrorHandler,
+    failure_case_budget,
+    get_failure_case_budget,
+)
+from .fingerprints import (
+    invalidate_fingerprints,
+    memoized_fingerprint,
+    modifying_copies,
+)
+from .fusion import fused_check_results
 from .hypotheses import Hypothesis
+from .instrumentation import validation_phase
+from .profiling import profile_validation
+from .uniqueness import (
+    ApproximateUnique,
+    DuplicateTracker,
+    _approximate_unique,
+    duplicated,
+)
 
 try:
     from typing import Literal
@@ -53,6 +85,7 @@ except ImportError:
 
 
 if TYPE_CHECKING:
+    from pandera.incremental import IncrementalState
     from pandera.schema_components import Column
 
 N_INDENT_SPACES = 4
@@ -77,6 +110,45 @@ StrictType = Union[bool, Literal["filter"]]
 
 TSeriesSchemaBase = TypeVar("TSeriesSchemaBase", bound="SeriesSchemaBase")
 
+# maximum number of compiled validation plans cached on a DataFrameSchema,
+# one per distinct set of dataframe columns.
+VALIDATION_PLAN_CACHE_SIZE = 32
+
+# checks that are evaluated separately from the schema component validating
+# the data, e.g. on row shards of the data. Checks are identified by the
+# type and name of the schema component, the check index and the check id.
+_SKIPPED_CHECKS: contextvars.ContextVar[
+    FrozenSet[Tuple[type, Any, int, int]]
+] = contextvars.ContextVar("_SKIPPED_CHECKS", default=frozenset())
+
+# attributes derived from the schema definition, which are not considered in
+# schema equality, copies or pickling.
+_DERIVED_SCHEMA_ATTRS = frozenset(["_validation_plans", "_fingerprint"])
+
+
+def _failure_case_budget_scope(method):
+    """Collect failure cases within the ``max_failure_cases`` of the schema."""
+
+    @wraps(method)
+    def _wrapper(schema, *args, **kwargs):
+        with failure_case_budget(
+            schema.max_failure_cases, kwargs.get("random_state")
+        ):
+            return method(schema, *args, **kwargs)
+
+    return _wrapper
+
+
+def _derived_arrays_scope(method):
+    """Share the arrays derived from the validated series, e.g. null masks."""
+
+    @wraps(method)
+    def _wrapper(*args, **kwargs):
+        with derived_arrays.derived_arrays_scope():
+            return method(*args, **kwargs)
+
+    return _wrapper
+
 
 def _inferred_schema_guard(method):
     """
@@ -100,6 +172,10 @@ def _inferred_schema_guard(method):
 class DataFrameSchema:  # pylint: disable=too-many-public-methods
     """A light-weight pandas DataFrame validator."""
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        invalidate_fingerprints(self)
+
     def __init__(
         self,
         columns: Optional[Dict[Any, Column]] = None,
@@ -115,6 +191,7 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         unique_column_names: bool = False,
         title: Optional[str] = None,
         description: Optional[str] = None,
+        max_failure_cases: Optional[int] = None,
     ) -> None:
         """Initialize DataFrameSchema validator.
 
@@ -147,6 +224,13 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         :param unique_column_names: whether or not column names must be unique.
         :param title: A human-readable label for the schema.
         :param description: An arbitrary textual description of the schema.
+        :param max_failure_cases: maximum number of failure cases collected
+            across all the checks of a validation. The kept failure cases are
+            a uniform random sample of all the failure cases, and the number
+            of failure cases of each check is reported by
+            :attr:`~pandera.errors.SchemaErrors.failure_counts`. If 0, only
+            the number of failure cases is collected. By default, all the
+            failure cases are collected.
 
         :raises SchemaInitError: if impossible to build schema from parameters
 
@@ -210,6 +294,7 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         self._unique_column_names = unique_column_names
         self._title = title
         self._description = description
+        self.max_failure_cases = max_failure_cases
         self._validate_schema()
         self._set_column_names()
 
@@ -283,6 +368,13 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
     def _is_inferred(self, value: bool) -> None:
         self._IS_INFERRED = value
 
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            k: v
+            for k, v in self.__dict__.items()
+            if k not in _DERIVED_SCHEMA_ATTRS
+        }
+
     def _validate_schema(self) -> None:
         for column_name, column in self.columns.items():
             for check in column.checks:
@@ -297,6 +389,24 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
                         f"Check for Column {column_name} not "
                         "specified in the DataFrameSchema."
                     )
+        if isinstance(self._unique, ApproximateUnique) and not list(
+            self._unique
+        ):
+            raise errors.SchemaInitError(
+                "ApproximateUnique must specify the columns that are jointly "
+                "unique in a DataFrameSchema."
+            )
+
+    def _unique_groups(self) -> List[Sequence[str]]:
+        """Groups of columns that must be jointly unique."""
+        # pylint: disable=not-an-iterable
+        if not self.unique:
+            return []
+        if isinstance(self.unique, str):
+            return [[self.unique]]
+        if all(isinstance(x, str) for x in self.unique):
+            return [self.unique]
+        return self.unique
 
     def _set_column_names(self) -> None:
         def _set_column_handler(column, column_name):
@@ -323,7 +433,6 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
 
         :returns: dictionary of columns and their associated dtypes.
         """
-        start_time = time.time()
         regex_columns = [
             name for name, col in self.columns.items() if col.regex
         ]
@@ -334,10 +443,7 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
                 "for these columns.",
                 UserWarning,
             )
-        end_time = time.time()
-        time_diff = end_time - start_time
-        print("Time taken by dtypes is {:.12f}".format(time_diff))
-        return {n: c.dtype for n, c in self.columns.items() if not c.regex}, time_diff
+        return {n: c.dtype for n, c in self.columns.items() if not c.regex}
 
     def get_dtypes(self, dataframe: pd.DataFrame) -> Dict[str, DataType]:
         """
@@ -346,7 +452,6 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
 
         :returns: dictionary of columns and their associated dtypes.
         """
-        start_time = time.time()
         regex_dtype = {}
         for _, column in self.columns.items():
             if column.regex:
@@ -356,13 +461,10 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
                         for c in column.get_regex_columns(dataframe.columns)
                     }
                 )
-        end_time = time.time()
-        time_diff = end_time - start_time
-        print("Time taken by get_dtypes is {:.12f}".format(time_diff))                
         return {
             **{n: c.dtype for n, c in self.columns.items() if not c.regex},
             **regex_dtype,
-        }, time_diff
+        }
 
     @property
     def dtype(
@@ -383,19 +485,93 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
                 "to coerce dtype"
             )
 
+        with validation_phase(self, "coercion", obj):
+            try:
+                return self.dtype.try_coerce(obj)
+            except errors.ParserError as exc:
+                events.emit(
+                    "coercion_failure", self, failures=len(exc.failure_cases)
+                )
+                raise errors.SchemaError(
+                    self,
+                    obj,
+                    lazy_message(
+                        "Error while coercing '{}' to type {}: {}\n{}",
+                        self.name,
+                        self.dtype,
+                        exc,
+                        exc.failure_cases,
+                    ),
+                    failure_cases=exc.failure_cases,
+                    check=f"coerce_dtype('{self.dtype}')",
+                ) from exc
+
+    def _coerce_columns_at_once(
+        self, obj: pd.DataFrame, columns: List[Tuple[Any, "Column"]]
+    ) -> Tuple[pd.DataFrame, Set[Any]]:
+        """Coerce the columns whose data types are coerced with ``astype``
+        with a single ``astype`` of the dataframe.
+
+        Setting the columns of a dataframe one at a time splits its blocks,
+        which takes quadratic time in the number of columns, so the coerced
+        columns are returned in a new dataframe instead.
+
+        :param obj: dataframe to coerce.
+        :param columns: column labels and schemas of the columns to coerce.
+        :returns: the coerced dataframe and the labels of the coerced
+            columns. The columns whose coercion fails are left to be coerced
+            one at a time, which collects their failure cases.
+        """
+        if (
+            not isinstance(obj, pd.DataFrame)
+            or isinstance(obj.columns, pd.MultiIndex)
+            or not obj.columns.is_unique
+        ):
+            return obj, set()
+        n_schemas = collections.Counter(colname for colname, _ in columns)
+        obj_dtypes = obj.dtypes
+        unchanged, dtypes = set(), {}
+        for colname, col_schema in columns:
+            dtype = _astype_dtype(col_schema.dtype)
+            # columns coerced by several schemas are coerced in order
+            if dtype is None or n_schemas[colname] > 1:
+                continue
+            if obj_dtypes[colname] == dtype:
+                unchanged.add(colname)
+            else:
+                dtypes[colname] = dtype
+        if dtypes:
+            with validation_phase(self, "coercion", obj):
+                obj = self._astype_columns(obj, dtypes)
+
+        coerced_columns = unchanged | set(dtypes)
+        for colname, col_schema in columns:
+            if colname in coerced_columns:
+                # the coercion of the columns is recorded by the dataframe
+                # schema
+                with validation_phase(col_schema, "coercion", obj):
+                    pass
+        return obj, coerced_columns
+
+    @staticmethod
+    def _astype_columns(
+        obj: pd.DataFrame, dtypes: Dict[Any, Any]
+    ) -> pd.DataFrame:
+        """Coerce columns of a dataframe with ``astype``.
+
+        :param dtypes: data types of the columns to coerce. The columns
+            whose coercion fails are removed and aren't coerced.
+        :returns: the coerced dataframe.
+        """
         try:
-            return self.dtype.try_coerce(obj)
-        except errors.ParserError as exc:
-            raise errors.SchemaError(
-                self,
-                obj,
-                (
-                    f"Error while coercing '{self.name}' to type "
-                    f"{self.dtype}: {exc}\n{exc.failure_cases}"
-                ),
-                failure_cases=exc.failure_cases,
-                check=f"coerce_dtype('{self.dtype}')",
-            ) from exc
+            return obj.astype(dtypes)
+        except Exception:  # pylint: disable=broad-except
+            for colname, dtype in list(dtypes.items()):
+                try:
+                    obj[colname].astype(dtype)
+                except Exception:  # pylint: disable=broad-except
+                    del dtypes[colname]
+            return obj.astype(dtypes) if dtypes else obj
 
     def coerce_dtype(self, obj: pd.DataFrame) -> pd.DataFrame:
         """Coerce dataframe to the type specified in dtype.
@@ -403,6 +579,17 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         :param obj: dataframe to coerce.
         :returns: dataframe with coerced dtypes
         """
+        return self._coerce_dtypes(obj, inplace=False)
+
+    def _coerce_dtypes(self, obj: pd.DataFrame, inplace: bool) -> pd.DataFrame:
+        """Coerce dataframe to the type specified in dtype.
+
+        :param obj: dataframe to coerce.
+        :param inplace: if True, the coerced columns are set in ``obj``
+            one at a time, otherwise they may be coerced at once in a new
+            dataframe.
+        :returns: dataframe with coerced dtypes
+        """
         error_handler = SchemaErrorHandler(lazy=True)
 
         def _try_coercion(coerce_fn, obj):
@@ -412,6 +599,7 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
                 error_handler.collect_error("dtype_coercion_error", exc)
                 return obj
 
+        columns_to_coerce = []
         for colname, col_schema in self.columns.items():
             if col_schema.regex:
                 try:
@@ -419,16 +607,25 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
                 except errors.SchemaError:
                     matched_columns = pd.Index([])
 
-                for matched_colname in matched_columns:
-                    if col_schema.coerce or self.coerce:
-                        obj[matched_colname] = _try_coercion(
-                            col_schema.coerce_dtype, obj[matched_colname]
-                        )
+                if col_schema.coerce or self.coerce:
+                    columns_to_coerce.extend(
+                        (matched_colname, col_schema)
+                        for matched_colname in matched_columns
+                    )
             elif (
                 (col_schema.coerce or self.coerce)
                 and self.dtype is None
                 and colname in obj
             ):
+                columns_to_coerce.append((colname, col_schema))
+
+        coerced_columns: Set[Any] = set()
+        if not inplace:
+            obj, coerced_columns = self._coerce_columns_at_once(
+                obj, columns_to_coerce
+            )
+        for colname, col_schema in columns_to_coerce:
+            if colname not in coerced_columns:
                 obj[colname] = _try_coercion(
                     col_schema.coerce_dtype, obj[colname]
                 )
@@ -436,11 +633,12 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         if self.dtype is not None:
             obj = _try_coercion(self._coerce_dtype, obj)
         if self.index is not None and (self.index.coerce or self.coerce):
-            index_schema = copy.deepcopy(self.index)
+            index_schema = copy.copy(self.index)
             if self.coerce:
                 # coercing at the dataframe-level should apply index coercion
                 # for both single- and multi-indexes.
-                index_schema._coerce = True
+                with modifying_copies():
+                    index_schema._coerce = True
             coerced_index = _try_coercion(index_schema.coerce_dtype, obj.index)
             if coerced_index is not None:
                 obj.index = coerced_index
@@ -452,6 +650,41 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
 
         return obj
 
+    def _get_validation_plan(self, columns: pd.Index) -> "_ValidationPlan":
+        """Get the compiled validation plan for a set of dataframe columns.
+
+        Plans are cached on the schema, keyed by the column labels and the
+        parts of the schema definition that the plan depends on, so that
+        validating dataframes with the same columns only compiles the plan
+        once.
+        """
+        plans = self.__dict__.setdefault("_validation_plans", {})
+        try:
+            key = (
+                # column labels that compare equal, e.g. 1 and True, may
+                # match regex column names differently.
+                tuple(columns),
+                tuple(map(type, columns)),
+                self.strict,
+                self.ordered,
+                self.unique_column_names,
+                tuple(
+                    (col_name, id(col), col.name, col.regex, col.required)
+                    for col_name, col in self.columns.items()
+                ),
+            )
+            plan = plans.get(key)
+        except TypeError:
+            # unhashable column labels
+            return _compile_validation_plan(self, columns)
+
+        if plan is None:
+            plan = _compile_validation_plan(self, columns)
+            if len(plans) >= VALIDATION_PLAN_CACHE_SIZE:
+                plans.pop(next(iter(plans)))
+            plans[key] = plan
+        return plan
+
     def validate(
         self,
         check_obj: pd.DataFrame,
@@ -461,6 +694,8 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         random_state: Optional[int] = None,
         lazy: bool = False,
         inplace: bool = False,
+        n_jobs: Optional[int] = None,
+        n_shards: Optional[int] = None,
     ) -> pd.DataFrame:
         """Check if all columns in a dataframe have a column in the Schema.
 
@@ -477,6 +712,14 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
             ``SchemaError`` as soon as one occurs.
         :param inplace: if True, applies coercion to the object of validation,
             otherwise creates a copy of the data.
+        :param n_jobs: number of threads used to run column-level validation
+            and dataframe-level checks concurrently. ``-1`` uses all CPUs.
+            By default, validation runs in the calling thread. Errors are
+            reported in the same order as with sequential validation.
+        :param n_shards: split the rows of a pandas ``DataFrame`` into this
+            many shards and run row-wise checks on the shards in a process
+            pool. Checks that need the whole dataframe are evaluated on the
+            whole dataframe. See :func:`pandera.sharding.validate_sharded`.
         :returns: validated ``DataFrame``
 
         :raises SchemaError: when ``DataFrame`` violates built-in or custom
@@ -516,7 +759,6 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         4         0.80      dog
         5         0.76      dog
         """
-        start_time = time.time()
 
         if not check_utils.is_table(check_obj):
             raise TypeError(f"expected pd.DataFrame, got {type(check_obj)}")
@@ -536,13 +778,12 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
                 random_state=random_state,
                 lazy=lazy,
                 inplace=inplace,
+                n_jobs=n_jobs,
+                n_shards=n_shards,
                 meta=check_obj,
             )
 
             return check_obj.pandera.add_schema(self)
-        end_time = time.time()
-        time_diff = end_time - start_time
-        print("Time taken by validate is {:.12f}".format(time_diff))  
         return self._validate(
             check_obj=check_obj,
             head=head,
@@ -551,8 +792,12 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
             random_state=random_state,
             lazy=lazy,
             inplace=inplace,
-        ), time_diff
+            n_jobs=n_jobs,
+            n_shards=n_shards,
+        )
 
+    @events.emits_validation_events
+    @_failure_case_budget_scope
     def _validate(
         self,
         check_obj: pd.DataFrame,
@@ -562,9 +807,31 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         random_state: Optional[int] = None,
         lazy: bool = False,
         inplace: bool = False,
+        n_jobs: Optional[int] = None,
+        n_shards: Optional[int] = None,
     ) -> pd.DataFrame:
         # pylint: disable=too-many-locals,too-many-branches,too-many-statements
 
+        if (
+            n_shards is not None
+            and n_shards > 1
+            and head is None
+            and tail is None
+            and sample is None
+            and type(check_obj) is pd.DataFrame
+        ):
+            # pylint: disable=import-outside-toplevel,cyclic-import
+            from .sharding import validate_sharded
+
+            return validate_sharded(
+                self,
+                check_obj,
+                n_shards,
+                lazy=lazy,
+                inplace=inplace,
+                n_jobs=n_jobs,
+            )
+
         if self._is_inferred:
             warnings.warn(
                 f"This {type(self)} is an inferred schema that hasn't been "
@@ -577,79 +844,46 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         error_handler = SchemaErrorHandler(lazy)
 
         if not inplace:
-            check_obj = check_obj.copy()
+            check_obj = _copy_check_obj(check_obj)
 
         if hasattr(check_obj, "pandera"):
             check_obj = check_obj.pandera.add_schema(self)
 
-        # dataframe strictness check makes sure all columns in the dataframe
-        # are specified in the dataframe schema
-        if self.strict or self.ordered:
-            column_names: List[Any] = []
-            for col_name, col_schema in self.columns.items():
-                if col_schema.regex:
-                    try:
-                        column_names.extend(
-                            col_schema.get_regex_columns(check_obj.columns)
-                        )
-                    except errors.SchemaError:
-                        pass
-                elif col_name in check_obj.columns:
-                    column_names.append(col_name)
-            # ordered "set" of columns
-            sorted_column_names = iter(dict.fromkeys(column_names))
-            expanded_column_names = frozenset(column_names)
-
-            # drop adjacent duplicated column names
-            if check_obj.columns.has_duplicates:
-                columns = [k for k, _ in itertools.groupby(check_obj.columns)]
-            else:
-                columns = check_obj.columns
-
-            filter_out_columns = []
+        with validation_phase(self, "strictness", check_obj):
+            # the column-dependent parts of validation are compiled once per
+            # column index and re-used on subsequent calls.
+            plan = self._get_validation_plan(check_obj.columns)
 
-            for column in columns:
-                is_schema_col = column in expanded_column_names
-                if (self.strict is True) and not is_schema_col:
+            # dataframe strictness check makes sure all columns in the
+            # dataframe are specified in the dataframe schema
+            for reason_code, column in plan.column_errors:
+                if reason_code == "column_not_in_schema":
                     msg = (
                         f"column '{column}' not in {self.__class__.__name__}"
                         f" {self.columns}"
                     )
-                    error_handler.collect_error(
-                        "column_not_in_schema",
-                        errors.SchemaError(
-                            self,
-                            check_obj,
-                            msg,
-                            failure_cases=scalar_failure_case(column),
-                            check="column_in_schema",
-                        ),
-                    )
-                if self.strict == "filter" and not is_schema_col:
-                    filter_out_columns.append(column)
-                if self.ordered and is_schema_col:
-                    try:
-                        next_ordered_col = next(sorted_column_names)
-                    except StopIteration:
-                        pass
-                    if next_ordered_col != column:
-                        error_handler.collect_error(
-                            "column_not_ordered",
-                            errors.SchemaError(
-                                self,
-                                check_obj,
-                                message=f"column '{column}' out-of-order",
-                                failure_cases=scalar_failure_case(column),
-                                check="column_ordered",
-                            ),
-                        )
+                    check = "column_in_schema"
+                else:
+                    msg = f"column '{column}' out-of-order"
+                    check = "column_ordered"
+                error_handler.collect_error(
+                    reason_code,
+                    errors.SchemaError(
+                        self,
+                        check_obj,
+                        msg,
+                        failure_cases=scalar_failure_case(column),
+                        check=check,
+                    ),
+                )
 
-        if self.strict == "filter":
-            check_obj.drop(labels=filter_out_columns, inplace=True, axis=1)
+            if plan.filter_out_columns:
+                check_obj.drop(
+                    labels=plan.filter_out_columns, inplace=True, axis=1
+                )
 
-        if self._unique_column_names:
-            failed = check_obj.columns[check_obj.columns.duplicated()]
-            if failed.any():
+            if plan.duplicated_column_labels is not None:
+                failed = plan.duplicated_column_labels
                 msg = (
                     "dataframe contains multiple columns with label(s): "
                     f"{failed.tolist()}"
@@ -665,20 +899,14 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
                     ),
                 )
 
-        # check for columns that are not in the dataframe and collect columns
-        # that are not in the dataframe that should be excluded for lazy
-        # validation
-        lazy_exclude_columns = []
-        for colname, col_schema in self.columns.items():
-            if (
-                not col_schema.regex
-                and colname not in check_obj
-                and col_schema.required
-            ):
-                if lazy:
-                    lazy_exclude_columns.append(colname)
-                msg = (
-                    f"column '{colname}' not in dataframe\n{check_obj.head()}"
+            # check for columns that are not in the dataframe. These columns
+            # are excluded from the plan's schema components for lazy
+            # validation.
+            for colname in plan.columns_not_in_dataframe:
+                msg = lazy_message(
+                    "column '{}' not in dataframe\n{}",
+                    colname,
+                    check_obj.head(),
                 )
                 error_handler.collect_error(
                     "column_not_in_dataframe",
@@ -698,7 +926,7 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
             or any(col.coerce for col in self.columns.values())
         ):
             try:
-                check_obj = self.coerce_dtype(check_obj)
+                check_obj = self._coerce_dtypes(check_obj, inplace=inplace)
             except errors.SchemaErrors as err:
                 for schema_error_dict in err.schema_errors:
                     if not lazy:
@@ -708,107 +936,452 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
                     error_handler.collect_error(
                         "schema_component_check", schema_error_dict["error"]
                     )
-
-        # collect schema components for validation
-        schema_components = []
-        for col_name, col in self.columns.items():
-            if (
-                col.required or col_name in check_obj
-            ) and col_name not in lazy_exclude_columns:
-                col = copy.deepcopy(col)
-                col._coerce = False  # type: ignore
-                if self.dtype is not None:
-                    # override column dtype with dataframe dtype
-                    col.dtype = self.dtype
-                schema_components.append(col)
-
-        if self.index is not None:
-            schema_components.append(self.index)
+                # the columns that were coerced are in the data of the errors
+                check_obj = err.data
+            if hasattr(check_obj, "pandera"):
+                # columns may be coerced in a new dataframe
+                check_obj = check_obj.pandera.add_schema(self)
 
         df_to_validate = _pandas_obj_to_validate(
             check_obj, head, tail, sample, random_state
         )
 
-        check_results = []
-        # schema-component-level checks
-        for schema_component in schema_components:
-            try:
-                result = schema_component(
+        def validate_component(schema_component, column_keys):
+            with events.component_events(schema_component):
+                if column_keys is None:
+                    # the index, or regex columns that don't match any
+                    # dataframe columns, which raise a SchemaError.
+                    return schema_component(
+                        df_to_validate,
+                        lazy=lazy,
+                        # don't make a copy of the data
+                        inplace=True,
+                    )
+                return schema_component._validate_column_keys(
                     df_to_validate,
+                    column_keys,
                     lazy=lazy,
-                    # don't make a copy of the data
                     inplace=True,
+                    # columns are coerced at the dataframe level and the
+                    # dataframe dtype overrides the column dtypes.
+                    coerce=False,
+                    dtype=self.dtype,
                 )
+
+        # columns only read the data, so they can be validated concurrently.
+        # The index may be coerced in-place, so it's validated afterwards in
+        # the calling thread.
+        component_results = _map_validation_tasks(
+            [
+                functools.partial(validate_component, *component)
+                for component in plan.column_components
+            ],
+            n_jobs,
+        )
+        if self.index is not None:
+            component_results = itertools.chain(
+                component_results,
+                _map_validation_tasks(
+                    [functools.partial(validate_component, self.index, None)],
+                    None,
+                ),
+            )
+
+        check_results = []
+        # schema-component-level checks
+        for result, err in component_results:
+            if err is None:
                 check_results.append(check_utils.is_table(result))
-            except errors.SchemaError as err:
+            elif isinstance(err, errors.SchemaError):
                 error_handler.collect_error("schema_component_check", err)
-            except errors.SchemaErrors as err:
+            else:
                 for schema_error_dict in err.schema_errors:
                     error_handler.collect_error(
                         "schema_component_check", schema_error_dict["error"]
                     )
 
         # dataframe-level checks
-        for check_index, check in enumerate(self.checks):
-            try:
-                check_results.append(
-                    _handle_check_results(
-                        self, check_index, check, df_to_validate
-                    )
+        for result, err in _map_validation_tasks(
+            [
+                functools.partial(
+                    _handle_check_results,
+                    self,
+                    check_index,
+                    check,
+                    df_to_validate,
                 )
-            except errors.SchemaError as err:
+                for check_index, check in enumerate(self.checks)
+            ],
+            n_jobs,
+        ):
+            if err is None:
+                check_results.append(result)
+            else:
                 error_handler.collect_error("dataframe_check", err)
 
         if self.unique:
             keep_setting = convert_uniquesettings(self._report_duplicates)
-            # NOTE: fix this pylint error
-            # pylint: disable=not-an-iterable
-            temp_unique: List[List] = (
-                [self.unique]
-                if all(isinstance(x, str) for x in self.unique)
-                else self.unique
+            with validation_phase(self, "unique", df_to_validate):
+                for lst in self._unique_groups():
+                    if not isinstance(df_to_validate, pd.DataFrame):
+                        duplicates = df_to_validate.duplicated(
+                            subset=list(lst), keep=keep_setting
+                        )
+                    elif isinstance(lst, ApproximateUnique):
+                        duplicates = lst.duplicated(
+                            df_to_validate[list(lst)], keep=keep_setting
+                        )
+                    else:
+                        duplicates = duplicated(
+                            df_to_validate[list(lst)], keep=keep_setting
+                        )
+                    if duplicates.any():
+                        # NOTE: this is a hack to support pyspark.pandas, need
+                        # to figure out a workaround to error: "Cannot combine
+                        # the series or dataframe because it comes from a
+                        # different dataframe."
+                        if type(duplicates).__module__.startswith(
+                            "pyspark.pandas"
+                        ):
+                            # pylint: disable=import-outside-toplevel
+                            import pyspark.pandas as ps
+
+                            with ps.option_context(
+                                "compute.ops_on_diff_frames", True
+                            ):
+                                failure_cases = df_to_validate.loc[
+                                    duplicates, list(lst)
+                                ]
+                        else:
+                            failure_cases = df_to_validate.loc[
+                                duplicates, list(lst)
+                            ]
+
+                        failure_cases = reshape_failure_cases(failure_cases)
+                        error_handler.collect_error(
+                            "duplicates",
+                            errors.SchemaError(
+                                self,
+                                check_obj,
+                                lazy_message(
+                                    "columns '{}' not unique:\n{}",
+                                    tuple(lst),
+                                    failure_cases,
+                                ),
+                                failure_cases=failure_cases,
+                                check="multiple_fields_uniqueness",
+                            ),
+                        )
+
+        if lazy and error_handler.collected_errors:
+            raise errors.SchemaErrors(
+                self, error_handler.collected_errors, check_obj
+            )
+
+        assert all(check_results), "all check results must be True."
+        return check_obj
+
+    def validate_stream(
+        self,
+        check_objs: Iterable[pd.DataFrame],
+        lazy: bool = False,
+        inplace: bool = False,
+        n_jobs: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Validate an iterable of dataframe chunks.
+
+        Chunks are validated as they are consumed from ``check_objs``, e.g.
+        from ``pd.read_csv(..., chunksize=n)``, and the validated chunks are
+        yielded, so that only one chunk is held in memory at a time.
+
+        The ``unique`` constraints of the schema and its columns are checked
+        across all chunks by keeping the hashes of the values seen so far.
+        A value that duplicates a value of a previous chunk is reported in
+        the chunk where it occurs again. Index uniqueness is checked within
+        each chunk.
+
+        :param check_objs: iterable of dataframes to validate.
+        :param lazy: if True, lazily evaluates all chunks against all
+            validation checks and raises a ``SchemaErrors`` with the errors
+            of all chunks after the last chunk is yielded. Otherwise, raise
+            ``SchemaError`` as soon as one occurs.
+        :param inplace: if True, applies coercion to the object of validation,
+            otherwise creates a copy of the data.
+        :param n_jobs: number of threads used to validate each chunk.
+        :returns: generator of validated dataframes.
+
+        :example:
+
+        >>> import pandas as pd
+        >>> import pandera as pa
+        >>>
+        >>> schema = pa.DataFrameSchema({"id": pa.Column(int, unique=True)})
+        >>> chunks = [pd.DataFrame({"id": [1, 2]}), pd.DataFrame({"id": [3]})]
+        >>> for chunk in schema.validate_stream(chunks):
+        ...     print(chunk.id.tolist())
+        [1, 2]
+        [3]
+        """
+        chunk_schema, columns = self._chunk_schema()
+        trackers: Dict[Any, DuplicateTracker] = {}
+        error_handler = SchemaErrorHandler(lazy)
+
+        for check_obj in check_objs:
+            try:
+                check_obj = chunk_schema._validate(
+                    check_obj, lazy=lazy, inplace=inplace, n_jobs=n_jobs
+                )
+            except errors.SchemaErrors as err:
+                check_obj = err.data
+                for schema_error_dict in err.schema_errors:
+                    error_handler.collect_error(
+                        schema_error_dict["reason_code"],
+                        schema_error_dict["error"],
+                    )
+            self._collect_chunk_duplicates(
+                chunk_schema, columns, check_obj, trackers, error_handler
+            )
+            yield check_obj
+
+        if error_handler.collected_errors:
+            raise errors.SchemaErrors(
+                self, error_handler.collected_errors, None
             )
-            for lst in temp_unique:
-                duplicates = df_to_validate.duplicated(
-                    subset=lst, keep=keep_setting
+
+    def validate_incremental(
+        self,
+        check_obj: pd.DataFrame,
+        state: "IncrementalState",
+        lazy: bool = False,
+        n_jobs: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Validate the rows appended to a dataframe since the last call.
+
+        The ``state`` keeps the number of rows that were validated and the
+        hashes of their unique values, so that only the appended rows are
+        validated. Checks that aren't row-wise, e.g. of the mean of a column,
+        are evaluated on the whole dataframe, even if no rows were appended.
+        See :mod:`pandera.incremental`.
+
+        :param check_obj: dataframe whose first ``state.n_rows`` rows were
+            validated by previous calls with the same state.
+        :param state: state of the incremental validation, which is updated
+            if the appended rows pass validation.
+        :param lazy: if True, lazily evaluates the appended rows against all
+            validation checks and raises a ``SchemaErrors``. Otherwise, raise
+            ``SchemaError`` as soon as one occurs.
+        :param n_jobs: number of threads used to validate the appended rows.
+        :returns: validated dataframe.
+        :raises ValueError: if the state was created by another schema, or if
+            the previously validated rows were removed or reordered.
+
+        :example:
+
+        >>> import pandas as pd
+        >>> import pandera as pa
+        >>> from pandera.incremental import IncrementalState
+        >>>
+        >>> schema = pa.DataFrameSchema({"id": pa.Column(int, unique=True)})
+        >>> state = IncrementalState()
+        >>> df = pd.DataFrame({"id": [1, 2]})
+        >>> df = schema.validate_incremental(df, state)
+        >>> df = pd.concat([df, pd.DataFrame({"id": [3]})], ignore_index=True)
+        >>> df = schema.validate_incremental(df, state)
+        >>> state.n_rows
+        3
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from .incremental import validate_incremental
+
+        return validate_incremental(
+            self, check_obj, state, lazy=lazy, n_jobs=n_jobs
+        )
+
+    def _chunk_schema(
+        self, index_unique: bool = True
+    ) -> Tuple["DataFrameSchema", Dict[int, Any]]:
+        """Copy the schema to validate chunks of data.
+
+        Uniqueness is checked across chunks, so it's removed from the copy.
+
+        :param index_unique: whether the index uniqueness is checked within
+            each chunk, otherwise it's also removed from the copy.
+        :returns: the copy and the schema components of this schema by the
+            id of their copies.
+        """
+        chunk_schema = copy.copy(self)
+        components: Dict[int, Any] = {}
+        with modifying_copies():
+            chunk_schema.unique = None
+            chunk_schema.columns = {}
+            for name, column in self.columns.items():
+                chunk_column = copy.copy(column)
+                chunk_column.unique = False
+                chunk_schema.columns[name] = chunk_column
+                components[id(chunk_column)] = column
+            if not index_unique and self.index is not None:
+                chunk_schema.index = copy.copy(self.index)
+                chunk_schema.index.unique = False
+        return chunk_schema, components
+
+    def _collect_chunk_duplicates(
+        self,
+        chunk_schema: "DataFrameSchema",
+        components: Dict[int, Any],
+        check_obj: pd.DataFrame,
+        trackers: Dict[Any, DuplicateTracker],
+        error_handler: SchemaErrorHandler,
+    ) -> None:
+        """Collect the errors of the values of a chunk that duplicate values
+        of the chunk or of previous chunks.
+
+        :param chunk_schema: schema from :meth:`_chunk_schema`.
+        :param components: schema components from :meth:`_chunk_schema`.
+        :param check_obj: the validated chunk.
+        :param trackers: the values seen in previous chunks, which is updated
+            with the values of the chunk. The index is tracked under the
+            ``None`` key if it's in the trackers.
+        """
+        plan = chunk_schema._get_validation_plan(check_obj.columns)
+        for chunk_column, column_keys in plan.column_components:
+            column = components[id(chunk_column)]
+            if not column.unique:
+                continue
+            for column_name in column_keys or []:
+                tracker = trackers.setdefault(
+                    ("column", column_name),
+                    DuplicateTracker(
+                        convert_uniquesettings(column._report_duplicates),
+                        approximate=_approximate_unique(column.unique),
+                    ),
                 )
+                series = check_obj[column_name]
+                duplicates = tracker.duplicated(series)
                 if duplicates.any():
-                    # NOTE: this is a hack to support pyspark.pandas, need to
-                    # figure out a workaround to error: "Cannot combine the
-                    # series or dataframe because it comes from a different
-                    # dataframe."
-                    if type(duplicates).__module__.startswith(
-                        "pyspark.pandas"
-                    ):
-                        # pylint: disable=import-outside-toplevel
-                        import pyspark.pandas as ps
-
-                        with ps.option_context(
-                            "compute.ops_on_diff_frames", True
-                        ):
-                            failure_cases = df_to_validate.loc[duplicates, lst]
+                    failed = series[duplicates]
+                    if column.name == column_name:
+                        error_column = column
                     else:
-                        failure_cases = df_to_validate.loc[duplicates, lst]
-
-                    failure_cases = reshape_failure_cases(failure_cases)
+                        with modifying_copies():
+                            error_column = copy.copy(column).set_name(
+                                column_name
+                            )
                     error_handler.collect_error(
-                        "duplicates",
+                        "schema_component_check",
                         errors.SchemaError(
-                            self,
+                            error_column,
                             check_obj,
-                            f"columns '{*lst,}' not unique:\n{failure_cases}",
-                            failure_cases=failure_cases,
-                            check="multiple_fields_uniqueness",
+                            lazy_message(
+                                "series '{}' contains duplicate values:\n{}",
+                                column_name,
+                                failed,
+                            ),
+                            failure_cases=reshape_failure_cases(failed),
+                            check="field_uniqueness",
                         ),
                     )
 
-        if lazy and error_handler.collected_errors:
-            raise errors.SchemaErrors(
-                self, error_handler.collected_errors, check_obj
+        if None in trackers and check_obj.index.nlevels == 1:
+            duplicates = trackers[None].duplicated(check_obj.index)
+            if duplicates.any():
+                failed = check_obj.index[duplicates].to_series()
+                failed = failed.reset_index(drop=True)
+                error_handler.collect_error(
+                    "schema_component_check",
+                    errors.SchemaError(
+                        self.index,
+                        check_obj,
+                        lazy_message(
+                            "series '{}' contains duplicate values:\n{}",
+                            self.index.name,
+                            failed,
+                        ),
+                        failure_cases=reshape_failure_cases(failed),
+                        check="field_uniqueness",
+                    ),
+                )
+
+        for lst in self._unique_groups():
+            if any(col not in check_obj for col in lst):
+                continue
+            tracker = trackers.setdefault(
+                ("unique", tuple(lst)),
+                DuplicateTracker(
+                    convert_uniquesettings(self._report_duplicates),
+                    approximate=_approximate_unique(lst),
+                ),
             )
+            duplicates = tracker.duplicated(check_obj[list(lst)])
+            if duplicates.any():
+                failure_cases = reshape_failure_cases(
+                    check_obj.loc[duplicates, list(lst)]
+                )
+                error_handler.collect_error(
+                    "duplicates",
+                    errors.SchemaError(
+                        self,
+                        check_obj,
+                        lazy_message(
+                            "columns '{}' not unique:\n{}",
+                            tuple(lst),
+                            failure_cases,
+                        ),
+                        failure_cases=failure_cases,
+                        check="multiple_fields_uniqueness",
+                    ),
+                )
 
-        assert all(check_results), "all check results must be True."
-        return check_obj
+    def profile(
+        self,
+        check_obj: pd.DataFrame,
+        head: Optional[int] = None,
+        tail: Optional[int] = None,
+        sample: Optional[int] = None,
+        random_state: Optional[int] = None,
+        n_jobs: Optional[int] = None,
+        trace_memory: bool = True,
+    ) -> pd.DataFrame:
+        """Validate a dataframe lazily and profile each validation.
+
+        :param check_obj: the dataframe to be validated.
+        :param head: validate the first n rows. Rows overlapping with `tail` or
+            `sample` are de-duplicated.
+        :param tail: validate the last n rows. Rows overlapping with `head` or
+            `sample` are de-duplicated.
+        :param sample: validate a random sample of n rows. Rows overlapping
+            with `head` or `tail` are de-duplicated.
+        :param random_state: random seed for the ``sample`` argument.
+        :param n_jobs: number of threads used to validate the columns.
+        :param trace_memory: if True, trace the peak memory of each validation
+            with :mod:`tracemalloc`, which slows down validation.
+        :returns: dataframe with one row per validation phase of each schema
+            component and check, sorted by decreasing time. See
+            :func:`~pandera.profiling.profile_validation`.
+
+        :example:
+
+        >>> import pandas as pd
+        >>> import pandera as pa
+        >>>
+        >>> schema = pa.DataFrameSchema(
+        ...     {"a": pa.Column(int, pa.Check(lambda s: s > 1))}
+        ... )
+        >>> report = schema.profile(pd.DataFrame({"a": [1, 2, 3]}))
+        >>> failed = report[report.failures > 0].reset_index(drop=True)
+        >>> print(failed[["component", "check", "calls", "rows", "failures"]])
+             component     check  calls  rows  failures
+        0  Column('a')  <lambda>      1     3         1
+        """
+        return profile_validation(
+            self,
+            check_obj,
+            trace_memory=trace_memory,
+            head=head,
+            tail=tail,
+            sample=sample,
+            random_state=random_state,
+            n_jobs=n_jobs,
+        )
 
     def __call__(
         self,
@@ -819,6 +1392,8 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         random_state: Optional[int] = None,
         lazy: bool = False,
         inplace: bool = False,
+        n_jobs: Optional[int] = None,
+        n_shards: Optional[int] = None,
     ):
         """Alias for :func:`DataFrameSchema.validate` method.
 
@@ -837,9 +1412,19 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
             ``SchemaError`` as soon as one occurs.
         :param inplace: if True, applies coercion to the object of validation,
             otherwise creates a copy of the data.
+        :param n_jobs: number of threads used for validation.
+        :param n_shards: number of row shards validated in a process pool.
         """
         return self.validate(
-            dataframe, head, tail, sample, random_state, lazy, inplace
+            dataframe,
+            head,
+            tail,
+            sample,
+            random_state,
+            lazy,
+            inplace,
+            n_jobs,
+            n_shards,
         )
 
     def __repr__(self) -> str:
@@ -913,11 +1498,24 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
 
         def _compare_dict(obj):
             return {
-                k: v for k, v in obj.__dict__.items() if k != "_IS_INFERRED"
+                k: v
+                for k, v in obj.__dict__.items()
+                if k != "_IS_INFERRED" and k not in _DERIVED_SCHEMA_ATTRS
             }
 
         return _compare_dict(self) == _compare_dict(other)
 
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """Fingerprint of the definition of the schema.
+
+        Schemas with the same definition have the same fingerprint, see
+        :func:`~pandera.fingerprints.schema_fingerprint`, which is None if
+        the definition can't be fingerprinted. The fingerprint is memoized
+        until an attribute of a schema, schema component or check is set.
+        """
+        return memoized_fingerprint(self)
+
     @st.strategy_import_error
     def strategy(
         self, *, size: Optional[int] = None, n_regex_columns: int = 1
@@ -1002,16 +1600,11 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         .. seealso:: :func:`remove_columns`
 
         """
-        start_time = time.time()
         schema_copy = copy.deepcopy(self)
         schema_copy.columns = {
             **schema_copy.columns,
             **self.__class__(extra_schema_cols).columns,
         }
-        end_time = time.time()
-        time_diff = end_time - start_time
-        print("Time taken by add_columns is {:.12f}".format(time_diff))
-        return_performance_time(time_diff)
         return schema_copy
 
     @_inferred_schema_guard
@@ -1131,7 +1724,7 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
             **{**column_copy.properties, **kwargs}
         )
         schema_copy.columns.update({column_name: new_column})
-    
+
         return schema_copy
 
     def update_columns(self, update_dict: Dict[str, Dict[str, Any]]) -> Self:
@@ -1705,6 +2298,10 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
 class SeriesSchemaBase:
     """Base series validator object."""
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        invalidate_fingerprints(self)
+
     def __init__(
         self,
         dtype: PandasDtypeInputTypes = None,
@@ -1867,20 +2464,27 @@ class SeriesSchemaBase:
         if self.dtype is None:
             return obj
 
-        try:
-            return self.dtype.try_coerce(obj)
-        except errors.ParserError as exc:
-            msg = (
-                f"Error while coercing '{self.name}' to type "
-                f"{self.dtype}: {exc}:\n{exc.failure_cases}"
-            )
-            raise errors.SchemaError(
-                self,
-                obj,
-                msg,
-                failure_cases=exc.failure_cases,
-                check=f"coerce_dtype('{self.dtype}')",
-            ) from exc
+        with validation_phase(self, "coercion", obj):
+            try:
+                return self.dtype.try_coerce(obj)
+            except errors.ParserError as exc:
+                events.emit(
+                    "coercion_failure", self, failures=len(exc.failure_cases)
+                )
+                msg = lazy_message(
+                    "Error while coercing '{}' to type {}: {}:\n{}",
+                    self.name,
+                    self.dtype,
+                    exc,
+                    exc.failure_cases,
+                )
+                raise errors.SchemaError(
+                    self,
+                    obj,
+                    msg,
+                    failure_cases=exc.failure_cases,
+                    check=f"coerce_dtype('{self.dtype}')",
+                ) from exc
 
     @property
     def _allow_groupby(self):
@@ -1890,6 +2494,7 @@ class SeriesSchemaBase:
             "of SeriesSchemaBase"
         )
 
+    @_derived_arrays_scope
     def validate(
         self,
         check_obj: Union[pd.DataFrame, pd.Series],
@@ -1931,7 +2536,7 @@ class SeriesSchemaBase:
         error_handler = SchemaErrorHandler(lazy)
 
         if not inplace:
-            check_obj = check_obj.copy()
+            check_obj = _copy_check_obj(check_obj)
 
         series = (
             check_obj
@@ -1964,98 +2569,119 @@ class SeriesSchemaBase:
             )
 
         if not self._nullable:
-            nulls = series.isna()
-            if nulls.sum() > 0:
-                failed = series[nulls]
-                msg = (
-                    f"non-nullable series '{series.name}' contains null "
-                    f"values:\n{failed}"
-                )
-                error_handler.collect_error(
-                    "series_contains_nulls",
-                    errors.SchemaError(
-                        self,
-                        check_obj,
-                        msg,
-                        failure_cases=reshape_failure_cases(
-                            series[nulls], ignore_na=False
+            with validation_phase(self, "nullable", series):
+                nulls = derived_arrays.isna(series)
+                n_nulls = nulls.sum()
+                if n_nulls > 0:
+                    failed = _failed_values(series, nulls)
+                    msg = lazy_message(
+                        "non-nullable series '{}' contains null values:\n{}",
+                        series.name,
+                        failed,
+                    )
+                    error_handler.collect_error(
+                        "series_contains_nulls",
+                        errors.SchemaError(
+                            self,
+                            check_obj,
+                            msg,
+                            failure_cases=reshape_failure_cases(
+                                failed, ignore_na=False
+                            ),
+                            check="not_nullable",
+                            failure_count=int(n_nulls),
+                            n_checked=len(series),
                         ),
-                        check="not_nullable",
-                    ),
-                )
+                    )
 
         # Check if the series contains duplicate values
         if self._unique:
-            keep_argument = convert_uniquesettings(self._report_duplicates)
-
-            if type(series).__module__.startswith("pyspark.pandas"):
-                duplicates = (
-                    series.to_frame()
-                    .duplicated(keep=keep_argument)
-                    .reindex(series.index)
-                )
-                # pylint: disable=import-outside-toplevel
-                import pyspark.pandas as ps
-
-                with ps.option_context("compute.ops_on_diff_frames", True):
-                    failed = series[duplicates]
-            else:
-                duplicates = series.duplicated(keep=keep_argument)
-                failed = series[duplicates]
+            with validation_phase(self, "unique", series):
+                keep_argument = convert_uniquesettings(self._report_duplicates)
+
+                if type(series).__module__.startswith("pyspark.pandas"):
+                    duplicates = (
+                        series.to_frame()
+                        .duplicated(keep=keep_argument)
+                        .reindex(series.index)
+                    )
+                    # pylint: disable=import-outside-toplevel
+                    import pyspark.pandas as ps
+
+                    with ps.option_context("compute.ops_on_diff_frames", True):
+                        failed = series[duplicates]
+                else:
+                    if isinstance(self._unique, ApproximateUnique):
+                        duplicates = pd.Series(
+                            self._unique.duplicated(
+                                series, keep=keep_argument
+                            ),
+                            index=series.index,
+                            name=series.name,
+                        )
+                    else:
+                        duplicates = duplicated(series, keep=keep_argument)
+                    failed = _failed_values(series, duplicates)
 
-            if duplicates.any():
-                msg = (
-                    f"series '{series.name}' contains duplicate values:\n"
-                    f"{failed}"
-                )
-                error_handler.collect_error(
-                    "series_contains_duplicates",
-                    errors.SchemaError(
-                        self,
-                        check_obj,
-                        msg,
-                        failure_cases=reshape_failure_cases(failed),
-                        check="field_uniqueness",
-                    ),
-                )
+                if duplicates.any():
+                    msg = lazy_message(
+                        "series '{}' contains duplicate values:\n{}",
+                        series.name,
+                        failed,
+                    )
+                    error_handler.collect_error(
+                        "series_contains_duplicates",
+                        errors.SchemaError(
+                            self,
+                            check_obj,
+                            msg,
+                            failure_cases=reshape_failure_cases(failed),
+                            check="field_uniqueness",
+                            failure_count=int(duplicates.sum()),
+                            n_checked=len(series),
+                        ),
+                    )
 
         if self._dtype is not None:
-            failure_cases = None
+            with validation_phase(self, "dtype", series):
+                failure_cases = None
 
-            check_output = self._dtype.check(
-                pandas_engine.Engine.dtype(series.dtype), series
-            )
-            if check_output is False:
-                failure_cases = scalar_failure_case(str(series.dtype))
-                msg = (
-                    f"expected series '{series.name}' to have type {self._dtype}, "
-                    + f"got {series.dtype}"
-                )
-            elif not isinstance(check_output, bool):
-                _, failure_cases = check_utils.prepare_series_check_output(
-                    series,
-                    pd.Series(list(check_output))
-                    if not isinstance(check_output, pd.Series)
-                    else check_output,
-                )
-                failure_cases = reshape_failure_cases(failure_cases)
-                msg = (
-                    f"expected series '{series.name}' to have type {self._dtype}:\n"
-                    f"failure cases:\n{failure_cases}"
+                check_output = self._dtype.check(
+                    pandas_engine.Engine.dtype(series.dtype), series
                 )
+                if check_output is False:
+                    failure_cases = scalar_failure_case(str(series.dtype))
+                    msg = (
+                        f"expected series '{series.name}' to have type {self._dtype}, "
+                        + f"got {series.dtype}"
+                    )
+                elif not isinstance(check_output, bool):
+                    _, failure_cases = check_utils.prepare_series_check_output(
+                        series,
+                        pd.Series(list(check_output))
+                        if not isinstance(check_output, pd.Series)
+                        else check_output,
+                    )
+                    failure_cases = reshape_failure_cases(failure_cases)
+                    msg = lazy_message(
+                        "expected series '{}' to have type {}:\n"
+                        "failure cases:\n{}",
+                        series.name,
+                        self._dtype,
+                        failure_cases,
+                    )
 
-            print(f'\nType coercion required. Consider changing data type to {self._dtype}\n\n\n')
-            if failure_cases is not None and not failure_cases.empty:
-                error_handler.collect_error(
-                    "wrong_dtype",
-                    errors.SchemaError(
-                        self,
-                        check_obj,
-                        msg,
-                        failure_cases=failure_cases,
-                        check=f"dtype('{self.dtype}')",
-                    ),
-                )
+                if failure_cases is not None and not failure_cases.empty:
+                    error_handler.collect_error(
+                        "wrong_dtype",
+                        errors.SchemaError(
+                            self,
+                            check_obj,
+                            msg,
+                            failure_cases=failure_cases,
+                            check=f"dtype('{self.dtype}')",
+                        ),
+                    )
 
         check_results = []
         if check_utils.is_field(check_obj):
@@ -2063,11 +2689,20 @@ class SeriesSchemaBase:
         else:
             check_args = [self.name]  # type: ignore
 
+        fused_results = {}
+        if self.checks:
+            with validation_phase(self, "check", series, "fused_checks"):
+                fused_results = fused_check_results(self.checks, series)
         for check_index, check in enumerate(self.checks):
             try:
                 check_results.append(
                     _handle_check_results(
-                        self, check_index, check, check_obj, *check_args
+                        self,
+                        check_index,
+                        check,
+                        check_obj,
+                        *check_args,
+                        check_result=fused_results.get(check_index),
                     )
                 )
             except errors.SchemaError as err:
@@ -2075,22 +2710,9 @@ class SeriesSchemaBase:
             except Exception as err:  # pylint: disable=broad-except
                 # catch other exceptions that may occur when executing the
                 # Check
-                err_msg = f'"{err.args[0]}"' if len(err.args) > 0 else ""
-                err_str = f"{err.__class__.__name__}({ err_msg})"
-                msg = (
-                    f"Error while executing check function: {err_str}\n"
-                    + traceback.format_exc()
-                )
                 error_handler.collect_error(
                     "check_error",
-                    errors.SchemaError(
-                        self,
-                        check_obj,
-                        msg,
-                        failure_cases=scalar_failure_case(err_str),
-                        check=check,
-                        check_index=check_index,
-                    ),
+                    _check_error(self, check_obj, check, check_index, err),
                     original_exc=err,
                 )
 
@@ -2102,6 +2724,42 @@ class SeriesSchemaBase:
         assert all(check_results)
         return check_obj
 
+    def profile(
+        self,
+        check_obj: Union[pd.DataFrame, pd.Series],
+        head: Optional[int] = None,
+        tail: Optional[int] = None,
+        sample: Optional[int] = None,
+        random_state: Optional[int] = None,
+        trace_memory: bool = True,
+    ) -> pd.DataFrame:
+        """Validate a series or specific column in dataframe lazily and
+        profile each validation.
+
+        :param check_obj: pandas DataFrame or Series to validate.
+        :param head: validate the first n rows. Rows overlapping with `tail` or
+            `sample` are de-duplicated.
+        :param tail: validate the last n rows. Rows overlapping with `head` or
+            `sample` are de-duplicated.
+        :param sample: validate a random sample of n rows. Rows overlapping
+            with `head` or `tail` are de-duplicated.
+        :param random_state: random seed for the ``sample`` argument.
+        :param trace_memory: if True, trace the peak memory of each validation
+            with :mod:`tracemalloc`, which slows down validation.
+        :returns: dataframe with one row per validation phase of each check,
+            sorted by decreasing time. See
+            :func:`~pandera.profiling.profile_validation`.
+        """
+        return profile_validation(
+            self,
+            check_obj,
+            trace_memory=trace_memory,
+            head=head,
+            tail=tail,
+            sample=sample,
+            random_state=random_state,
+        )
+
     def __call__(
         self,
         check_obj: Union[pd.DataFrame, pd.Series],
@@ -2118,7 +2776,18 @@ class SeriesSchemaBase:
         )
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        return _schema_definition(self) == _schema_definition(other)
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """Fingerprint of the definition of the schema.
+
+        Schemas with the same definition have the same fingerprint, see
+        :func:`~pandera.fingerprints.schema_fingerprint`, which is None if
+        the definition can't be fingerprinted. The fingerprint is memoized
+        until an attribute of a schema, schema component or check is set.
+        """
+        return memoized_fingerprint(self)
 
     @st.strategy_import_error
     def strategy(self, *, size=None):
@@ -2188,6 +2857,7 @@ class SeriesSchema(SeriesSchemaBase):
         name: str = None,
         title: Optional[str] = None,
         description: Optional[str] = None,
+        max_failure_cases: Optional[int] = None,
     ) -> None:
         """Initialize series schema base object.
 
@@ -2213,6 +2883,9 @@ class SeriesSchema(SeriesSchemaBase):
         :param name: series name.
         :param title: A human-readable label for the series.
         :param description: An arbitrary textual description of the series.
+        :param max_failure_cases: maximum number of failure cases collected
+            across all the checks of a validation, see
+            :class:`DataFrameSchema`.
 
         """
         super().__init__(
@@ -2227,6 +2900,7 @@ class SeriesSchema(SeriesSchemaBase):
             description,
         )
         self.index = index
+        self.max_failure_cases = max_failure_cases
 
     @property
     def _allow_groupby(self) -> bool:
@@ -2318,6 +2992,8 @@ class SeriesSchema(SeriesSchemaBase):
             inplace=inplace,
         )
 
+    @events.emits_validation_events
+    @_failure_case_budget_scope
     def _validate(
         self,
         check_obj: pd.Series,
@@ -2329,7 +3005,7 @@ class SeriesSchema(SeriesSchemaBase):
         inplace: bool = False,
     ) -> pd.Series:
         if not inplace:
-            check_obj = check_obj.copy()
+            check_obj = _copy_check_obj(check_obj)
 
         if hasattr(check_obj, "pandera"):
             check_obj = check_obj.pandera.add_schema(self)
@@ -2347,8 +3023,9 @@ class SeriesSchema(SeriesSchemaBase):
         if self.index:
             # coerce data type using index schema copy to prevent mutation
             # of original index schema attribute.
-            _index = copy.deepcopy(self.index)
-            _index.coerce = _index.coerce or self.coerce
+            _index = copy.copy(self.index)
+            with modifying_copies():
+                _index.coerce = _index.coerce or self.coerce
             try:
                 check_obj = _index(
                     check_obj, head, tail, sample, random_state, lazy, inplace
@@ -2394,7 +3071,183 @@ class SeriesSchema(SeriesSchemaBase):
         )
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        return _schema_definition(self) == _schema_definition(other)
+
+
+class _ValidationPlan(NamedTuple):
+    """Column-dependent validation steps of a :class:`DataFrameSchema`.
+
+    Everything in the plan only depends on the schema and the column labels of
+    the dataframe, and not on the data itself.
+    """
+
+    #: (reason_code, column) pairs for columns that aren't in the schema or
+    #: are out of order.
+    column_errors: List[Tuple[str, Any]]
+    #: columns to drop when ``strict="filter"``.
+    filter_out_columns: List[Any]
+    #: duplicated column labels when ``unique_column_names=True``.
+    duplicated_column_labels: Optional[pd.Index]
+    #: required columns that are not in the dataframe.
+    columns_not_in_dataframe: List[Any]
+    #: (column schema, column keys) pairs to validate, where the column keys
+    #: are the dataframe columns matched by the column schema, or ``None`` if
+    #: a regex column doesn't match any column.
+    column_components: List[Tuple["Column", Optional[List[Any]]]]
+
+
+def _compile_validation_plan(
+    schema: DataFrameSchema, columns: pd.Index
+) -> _ValidationPlan:
+    """Compile the validation plan of a schema for a set of columns."""
+    # pylint: disable=protected-access
+    column_errors: List[Tuple[str, Any]] = []
+    filter_out_columns: List[Any] = []
+
+    if schema.strict or schema.ordered:
+        column_names: List[Any] = []
+        for col_name, col_schema in schema.columns.items():
+            if col_schema.regex:
+                try:
+                    column_names.extend(col_schema.get_regex_columns(columns))
+                except errors.SchemaError:
+                    pass
+            elif col_name in columns:
+                column_names.append(col_name)
+        # ordered "set" of columns
+        sorted_column_names = iter(dict.fromkeys(column_names))
+        expanded_column_names = frozenset(column_names)
+
+        # drop adjacent duplicated column names
+        if columns.has_duplicates:
+            unique_columns = [k for k, _ in itertools.groupby(columns)]
+        else:
+            unique_columns = columns
+
+        for column in unique_columns:
+            is_schema_col = column in expanded_column_names
+            if (schema.strict is True) and not is_schema_col:
+                column_errors.append(("column_not_in_schema", column))
+            if schema.strict == "filter" and not is_schema_col:
+                filter_out_columns.append(column)
+            if schema.ordered and is_schema_col:
+                try:
+                    next_ordered_col = next(sorted_column_names)
+                except StopIteration:
+                    pass
+                if next_ordered_col != column:
+                    column_errors.append(("column_not_ordered", column))
+
+    if filter_out_columns:
+        columns = columns.drop(filter_out_columns)
+
+    duplicated_column_labels = None
+    if schema.unique_column_names:
+        failed = columns[columns.duplicated()]
+        if failed.any():
+            duplicated_column_labels = failed
+
+    columns_not_in_dataframe = [
+        colname
+        for colname, col_schema in schema.columns.items()
+        if not col_schema.regex
+        and colname not in columns
+        and col_schema.required
+    ]
+
+    column_components: List[Tuple[Column, Optional[List[Any]]]] = []
+    for col_name, col in schema.columns.items():
+        if (
+            col.required or col_name in columns
+        ) and col_name not in columns_not_in_dataframe:
+            column_keys = [col.name]
+            if col.regex:
+                try:
+                    column_keys = col.get_regex_columns(columns)
+                except errors.SchemaError:
+                    # the error is raised when the column is validated
+                    column_keys = None
+            column_components.append((col, column_keys))
+
+    return _ValidationPlan(
+        column_errors=column_errors,
+        filter_out_columns=filter_out_columns,
+        duplicated_column_labels=duplicated_column_labels,
+        columns_not_in_dataframe=columns_not_in_dataframe,
+        column_components=column_components,
+    )
+
+
+def _map_validation_tasks(
+    tasks: List[Callable[[], Any]], n_jobs: Optional[int]
+) -> Iterable[Tuple[Any, Optional[BaseException]]]:
+    """Run validation tasks, optionally in a thread pool.
+
+    Yields a ``(result, error)`` tuple for each task in the order of
+    ``tasks``, where ``error`` is the ``SchemaError`` or ``SchemaErrors``
+    raised by the task, if any. Without a thread pool, tasks are run lazily
+    so that non-lazy validation stops at the first error.
+    """
+
+    def run(task):
+        try:
+            return task(), None
+        except (errors.SchemaError, errors.SchemaErrors) as err:
+            return None, err
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+    if n_jobs is None or n_jobs <= 1 or len(tasks) <= 1:
+        return map(run, tasks)
+
+    # run each task in a copy of the calling context, so that context
+    # variables are visible to the worker threads.
+    contexts = [contextvars.copy_context() for _ in tasks]
+    with ThreadPoolExecutor(max_workers=min(n_jobs, len(tasks))) as executor:
+        return list(
+            executor.map(lambda ctx, task: ctx.run(run, task), contexts, tasks)
+        )
+
+
+def _schema_definition(schema: Any) -> Dict[str, Any]:
+    """Get the attributes of a schema that define it."""
+    return {
+        k: v
+        for k, v in schema.__dict__.items()
+        if k not in _DERIVED_SCHEMA_ATTRS
+    }
+
+
+def _astype_dtype(pandera_dtype: Optional[DataType]) -> Any:
+    """Native data type that a data type is coerced to with ``astype``.
+
+    :returns: None if the data type isn't coerced with a plain ``astype``.
+    """
+    dtype_cls = type(pandera_dtype)
+    if getattr(dtype_cls, "coerce", None) not in (
+        pandas_engine.DataType.coerce,
+        numpy_engine.DataType.coerce,
+    ) or getattr(dtype_cls, "try_coerce", None) not in (
+        pandas_engine.DataType.try_coerce,
+        numpy_engine.DataType.try_coerce,
+    ):
+        return None
+    return pandera_dtype.type  # type: ignore[union-attr]
+
+
+def _copy_check_obj(
+    check_obj: Union[pd.DataFrame, pd.Series]
+) -> Union[pd.DataFrame, pd.Series]:
+    """Copy the object of validation when validating with ``inplace=False``.
+
+    A shallow copy that shares the data with ``check_obj`` is made if pandas
+    copy-on-write is enabled or with the ``copy_on_write`` pandera config.
+    Coerced or filtered columns are replaced in the copy, so ``check_obj``
+    itself is never modified.
+    """
+    if CONFIG.copy_on_write or pandas_engine.pandas_copy_on_write():
+        return check_obj.copy(deep=False)
+    return check_obj.copy()
 
 
 def _pandas_obj_to_validate(
@@ -2428,35 +3281,83 @@ def _handle_check_results(
     check: Union[Check, Hypothesis],
     check_obj: Union[pd.DataFrame, pd.Series],
     *check_args,
+    check_result: Optional[CheckResult] = None,
 ) -> bool:
     """Handle check results, raising SchemaError on check failure.
 
     :param check_index: index of check in the schema component check list.
     :param check: Check object used to validate pandas object.
     :param check_args: arguments to pass into check object.
+    :param check_result: result of the check if it was already evaluated,
+        e.g. by :func:`~pandera.fusion.fused_check_results`.
     :returns: True if check results pass or check.raise_warning=True, otherwise
         False.
     """
-    check_result = check(check_obj, *check_args)
+    skipped_checks = _SKIPPED_CHECKS.get()
+    if (
+        skipped_checks
+        and (type(schema), schema.name, check_index, id(check))
+        in skipped_checks
+    ):
+        return True
+    with validation_phase(schema, "check", check_obj, check, check_index):
+        start = time.perf_counter() if events.handlers_registered() else None
+        if check_result is None:
+            check_result = check(check_obj, *check_args)
+        if start is not None:
+            events.emit(
+                "check_result",
+                schema,
+                check,
+                duration=time.perf_counter() - start,
+                passed=bool(check_result.check_passed),
+                failures=_n_failure_cases(check_result),
+            )
+        return _handle_check_result(
+            schema, check_index, check, check_obj, check_result
+        )
+
+
+def _n_failure_cases(check_result: CheckResult) -> int:
+    if check_result.check_passed:
+        return 0
+    if check_result.failure_cases is None:
+        return 1
+    return len(check_result.failure_cases)
+
+
+def _handle_check_result(
+    schema: Union[DataFrameSchema, SeriesSchemaBase],
+    check_index: int,
+    check: Union[Check, Hypothesis],
+    check_obj: Union[pd.DataFrame, pd.Series],
+    check_result: CheckResult,
+) -> bool:
+    """Raise SchemaError if the result of a check failed."""
     if not check_result.check_passed:
         if check_result.failure_cases is None:
             # encode scalar False values explicitly
             failure_cases = scalar_failure_case(check_result.check_passed)
-            error_msg = format_generic_error_message(
-                schema, check, check_index
+            error_msg = functools.partial(
+                format_generic_error_message, schema, check, check_index
             )
         else:
             failure_cases = reshape_failure_cases(
                 check_result.failure_cases, check.ignore_na
             )
-            error_msg = format_vectorized_error_message(
-                schema, check, check_index, failure_cases
+            error_msg = functools.partial(
+                format_vectorized_error_message,
+                schema,
+                check,
+                check_index,
+                failure_cases,
             )
 
         # raise a warning without exiting if the check is specified to do so
         if check.raise_warning:
-            warnings.warn(error_msg, UserWarning)
+            warnings.warn(error_msg(), UserWarning)
             return True
+        failure_count, n_checked = _failure_count(check_result)
         raise errors.SchemaError(
             schema,
             check_obj,
@@ -2465,10 +3366,61 @@ def _handle_check_results(
             check=check,
             check_index=check_index,
             check_output=check_result.check_output,
+            failure_count=failure_count,
+            n_checked=n_checked,
         )
     return check_result.check_passed
 
 
+def _failed_values(series: pd.Series, failed: pd.Series) -> pd.Series:
+    """Select the failed values of a series within the failure case budget."""
+    budget = get_failure_case_budget()
+    if budget is None or not isinstance(series, pd.Series):
+        return series[failed]
+    return budget.sample(series, failed)
+
+
+def _failure_count(check_result: CheckResult) -> Tuple[int, int]:
+    """Count the failure cases and checked values of a failed check.
+
+    The failure cases of the check result may be sampled or truncated, so
+    boolean check outputs are counted instead.
+    """
+    check_output = check_result.check_output
+    if isinstance(check_output, (pd.Series, pd.DataFrame)):
+        values = check_output.to_numpy()
+        if values.dtype == np.bool_:
+            return int(values.size - values.sum()), int(values.size)
+    if check_result.failure_cases is None:
+        return 1, 1
+    n_failure_cases = len(check_result.failure_cases)
+    return n_failure_cases, n_failure_cases
+
+
+def _check_error(
+    schema: Union[DataFrameSchema, SeriesSchemaBase],
+    check_obj: Union[pd.DataFrame, pd.Series],
+    check: Union[Check, Hypothesis],
+    check_index: int,
+    err: Exception,
+) -> errors.SchemaError:
+    """Create a SchemaError for an exception raised by a check function."""
+    err_msg = f'"{err.args[0]}"' if len(err.args) > 0 else ""
+    err_str = f"{err.__class__.__name__}({ err_msg})"
+    msg = (
+        f"Error while executing check function: {err_str}\n"
+        + traceback.format_exc()
+    )
+    return errors.SchemaError(
+        schema,
+        check_obj,
+        msg,
+        failure_cases=scalar_failure_case(err_str),
+        check=check,
+        check_index=check_index,
+    )
+
+
 def convert_uniquesettings(unique: UniqueSettings) -> Union[bool, str]:
     """
     Converts UniqueSettings object to string that can be passed onto pandas .duplicated() call
@@ -2486,8 +3438,3 @@ def convert_uniquesettings(unique: UniqueSettings) -> Union[bool, str]:
             str(unique) + " is not a recognized report_duplicates value"
         )
     return keep_argument
-
-
-def return_performance_time(x):
-    performance_time = x
-    return performance_time
\ No newline at end of file
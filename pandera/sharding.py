@@ -0,0 +1,442 @@
+"""Row-sharded validation of pandas dataframes in a process pool.
+
+Row-wise checks, e.g. most built-in :class:`~pandera.checks.Check` methods
+and element-wise checks, are evaluated on row shards of the dataframe in
+worker processes, and the failure cases of the shards are merged into one
+report. Columns with numpy data types are passed to the workers through
+shared memory instead of being pickled.
+
+All other validations, i.e. data types, nullability, uniqueness, groupby
+checks, hypotheses and vectorized custom checks, are evaluated on the whole
+dataframe in the calling process.
+"""
+
+import contextlib
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from . import errors
+from .checks import Check, CheckResult
+from .error_handlers import SchemaErrorHandler
+from .fingerprints import modifying_copies
+from .hypotheses import Hypothesis
+from .schema_components import Index
+from .schemas import (
+    _SKIPPED_CHECKS,
+    DataFrameSchema,
+    _check_error,
+    _handle_check_result,
+)
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover
+    # python < 3.8 doesn't support shared memory, so shards are pickled.
+    shared_memory = None  # type: ignore
+
+ROW_WISE_CHECKS = frozenset(
+    [
+        "equal_to",
+        "not_equal_to",
+        "greater_than",
+        "greater_than_or_equal_to",
+        "less_than",
+        "less_than_or_equal_to",
+        "in_range",
+        "isin",
+        "notin",
+        "str_matches",
+        "str_contains",
+        "str_startswith",
+        "str_endswith",
+        "str_length",
+    ]
+)
+"""Built-in checks that are evaluated independently for each row."""
+
+
+class _SharedArray(NamedTuple):
+    """Numpy array of a column or index stored in shared memory."""
+
+    shm_name: str
+    dtype: np.dtype
+    shape: Tuple[int, ...]
+    name: Any
+
+
+class _ShardTask(NamedTuple):
+    """Check that is evaluated on each row shard."""
+
+    #: "column", "index" or "dataframe"
+    kind: str
+    #: column label of column checks
+    key: Any
+    #: a picklable check, or the name, statistics and ``ignore_na`` setting
+    #: of a built-in check.
+    check: Any
+
+
+def _row_wise_check(check) -> Any:
+    """Get a picklable version of a row-wise check, or None."""
+    if (
+        isinstance(check, Hypothesis)
+        or check.groupby is not None
+        or check.n_failure_cases is not None
+    ):
+        return None
+    if check.statistics is not None and check.name in ROW_WISE_CHECKS:
+        # the check functions of built-in checks are closures, which can't
+        # be pickled, so they're re-created from the check statistics.
+        return (check.name, check.statistics, check.ignore_na)
+    if check.element_wise:
+        try:
+            pickle.dumps(check)
+        except Exception:  # pylint: disable=broad-except
+            return None
+        return check
+    return None
+
+
+def _check_components(
+    schema: DataFrameSchema, columns: pd.Index
+) -> List[Tuple[str, Any, Any]]:
+    """Find the schema components whose checks validate a dataframe.
+
+    :returns: list of ``(kind, key, schema_component)`` tuples, where kind
+        is "column", "index" or "dataframe" and key is the column label of
+        column components.
+    """
+    components = []
+    plan = schema._get_validation_plan(columns)
+    with modifying_copies():
+        for column, column_keys in plan.column_components:
+            for key in column_keys or []:
+                component = (
+                    column
+                    if column.name == key
+                    else copy(column).set_name(key)
+                )
+                components.append(("column", key, component))
+    # pylint: disable=unidiomatic-typecheck
+    if type(schema.index) is Index:
+        components.append(("index", None, schema.index))
+    components.append(("dataframe", None, schema))
+    return components
+
+
+def _plan_shard_tasks(
+    schema: DataFrameSchema, columns: pd.Index
+) -> List[Tuple[_ShardTask, Any, int, Any]]:
+    """Find the checks of a schema that are evaluated on row shards.
+
+    :returns: list of ``(task, schema_component, check_index, check)``
+        tuples.
+    """
+    planned = []
+    for kind, key, component in _check_components(schema, columns):
+        for check_index, check in enumerate(component.checks):
+            row_wise_check = _row_wise_check(check)
+            if row_wise_check is not None:
+                planned.append(
+                    (
+                        _ShardTask(kind, key, row_wise_check),
+                        component,
+                        check_index,
+                        check,
+                    )
+                )
+    return planned
+
+
+def _share(obj, stack: contextlib.ExitStack) -> Any:
+    """Copy a series or index with a numpy data type to shared memory.
+
+    Other objects are returned as-is, and are pickled for each shard.
+    """
+    if (
+        shared_memory is None
+        or isinstance(obj, (pd.RangeIndex, pd.MultiIndex))
+        or not isinstance(obj.dtype, np.dtype)
+        or obj.dtype.kind not in "biufcmM"
+    ):
+        return obj
+    values = obj.to_numpy()
+    shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    stack.callback(shm.unlink)
+    stack.callback(shm.close)
+    np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)[:] = values
+    return _SharedArray(shm.name, values.dtype, values.shape, obj.name)
+
+
+def _shard(obj, start: int, stop: int) -> Any:
+    """Get the rows of a shard from a shared array, series or index."""
+    if isinstance(obj, _SharedArray):
+        return obj
+    if isinstance(obj, pd.Series):
+        return obj.iloc[start:stop]
+    return obj[start:stop]
+
+
+def _load(obj, start: int, stop: int, shms: Dict[str, Any]) -> Any:
+    """Load the rows of a shard in a worker process."""
+    if not isinstance(obj, _SharedArray):
+        return obj
+    if obj.shm_name not in shms:
+        shms[obj.shm_name] = shared_memory.SharedMemory(name=obj.shm_name)
+    return np.ndarray(
+        obj.shape, dtype=obj.dtype, buffer=shms[obj.shm_name].buf
+    )[start:stop]
+
+
+def _evaluate_shard(
+    tasks: List[_ShardTask],
+    columns: Dict[Any, Any],
+    index: Any,
+    start: int,
+    stop: int,
+    shms: Dict[str, Any],
+) -> List[Tuple[str, Optional[Any]]]:
+    """Evaluate the checks on a row shard."""
+    shard_index = _load(index, start, stop, shms)
+    if isinstance(index, _SharedArray):
+        shard_index = pd.Index(shard_index, name=index.name)
+
+    series = {}
+    for key, column in columns.items():
+        values = _load(column, start, stop, shms)
+        series[key] = (
+            pd.Series(values, index=shard_index, name=column.name)
+            if isinstance(column, _SharedArray)
+            else values
+        )
+
+    dataframe = None
+    results: List[Tuple[str, Optional[Any]]] = []
+    for task in tasks:
+        check = task.check
+        if isinstance(check, tuple):
+            name, statistics, ignore_na = check
+            check = getattr(Check, name)(**statistics, ignore_na=ignore_na)
+
+        if task.kind == "column":
+            check_obj = series[task.key]
+        elif task.kind == "index":
+            check_obj = shard_index.to_series(index=pd.RangeIndex(start, stop))
+        else:
+            if dataframe is None:
+                dataframe = pd.DataFrame(
+                    {key: column.array for key, column in series.items()},
+                    index=shard_index,
+                    columns=list(series),
+                )
+            check_obj = dataframe
+
+        try:
+            check_result = check(check_obj)
+        except Exception:  # pylint: disable=broad-except
+            # the check is evaluated on the whole dataframe to report the
+            # error.
+            results.append(("error", None))
+            continue
+        if check_result.check_passed:
+            results.append(("passed", None))
+        else:
+            results.append(("failed", check_result.failure_cases))
+    return results
+
+
+def _validate_shard(
+    tasks: List[_ShardTask],
+    columns: Dict[Any, Any],
+    index: Any,
+    start: int,
+    stop: int,
+) -> List[Tuple[str, Optional[Any]]]:
+    """Evaluate the checks on a row shard in a worker process.
+
+    :returns: for each task, a ``(status, failure_cases)`` tuple where status
+        is "passed", "failed" or "error".
+    """
+    shms: Dict[str, Any] = {}
+    try:
+        return _evaluate_shard(tasks, columns, index, start, stop, shms)
+    finally:
+        for shm in shms.values():
+            try:
+                shm.close()
+            except BufferError:  # pragma: no cover
+                # data of the shard is still referenced. The memory is
+                # unmapped when the worker process exits.
+                pass
+
+
+def _run_shards(
+    check_obj: pd.DataFrame, tasks: List[_ShardTask], n_shards: int
+) -> List[Tuple[str, Optional[Any]]]:
+    """Evaluate tasks on row shards of a dataframe in a process pool.
+
+    :returns: for each task, a ``(status, failure_cases)`` tuple where the
+        failure cases of the shards are concatenated.
+    """
+    bounds = np.unique(np.linspace(0, len(check_obj), n_shards + 1, dtype=int))
+    shards = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+    if not shards:
+        return [("passed", None)] * len(tasks)
+
+    if any(task.kind == "dataframe" for task in tasks):
+        keys = list(check_obj.columns)
+    else:
+        keys = list(
+            dict.fromkeys(task.key for task in tasks if task.kind == "column")
+        )
+
+    with contextlib.ExitStack() as stack:
+        columns = {key: _share(check_obj[key], stack) for key in keys}
+        index = _share(check_obj.index, stack)
+        with ProcessPoolExecutor(
+            max_workers=min(len(shards), os.cpu_count() or 1)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _validate_shard,
+                    tasks,
+                    {
+                        key: _shard(column, start, stop)
+                        for key, column in columns.items()
+                    },
+                    _shard(index, start, stop),
+                    start,
+                    stop,
+                )
+                for start, stop in shards
+            ]
+            shard_results = [future.result() for future in futures]
+
+    results: List[Tuple[str, Optional[Any]]] = []
+    for task_results in zip(*shard_results):
+        statuses = [status for status, _ in task_results]
+        failure_cases = [
+            failure_case
+            for status, failure_case in task_results
+            if status == "failed"
+        ]
+        if "error" in statuses:
+            results.append(("error", None))
+        elif not failure_cases:
+            results.append(("passed", None))
+        elif any(failure_case is None for failure_case in failure_cases):
+            # the check returned a scalar False on at least one shard.
+            results.append(("failed", None))
+        else:
+            results.append(("failed", pd.concat(failure_cases)))
+    return results
+
+
+def validate_sharded(
+    schema: DataFrameSchema,
+    check_obj: pd.DataFrame,
+    n_shards: int,
+    lazy: bool = False,
+    inplace: bool = False,
+    n_jobs: Optional[int] = None,
+) -> pd.DataFrame:
+    """Validate a dataframe, evaluating row-wise checks on row shards.
+
+    The dataframe is first validated in the calling process without the
+    row-wise checks, which coerces its data types. The row-wise checks are
+    then evaluated on ``n_shards`` row shards in a
+    :class:`~concurrent.futures.ProcessPoolExecutor`.
+
+    Row-wise checks are the built-in checks listed in
+    :data:`ROW_WISE_CHECKS` and element-wise checks with picklable check
+    functions, without ``groupby`` or ``n_failure_cases`` options.
+
+    :param schema: dataframe schema to validate with.
+    :param check_obj: dataframe to validate.
+    :param n_shards: number of row shards.
+    :param lazy: if True, lazily evaluates dataframe against all validation
+        checks and raises a ``SchemaErrors``. Otherwise, raise
+        ``SchemaError`` as soon as one occurs.
+    :param inplace: if True, applies coercion to the object of validation,
+        otherwise creates a copy of the data.
+    :param n_jobs: number of threads used to validate the whole dataframe.
+    :returns: validated dataframe.
+    """
+    planned = (
+        _plan_shard_tasks(schema, check_obj.columns)
+        if check_obj.columns.is_unique
+        else []
+    )
+    token = _SKIPPED_CHECKS.set(
+        frozenset(
+            (type(component), component.name, check_index, id(check))
+            for _, component, check_index, check in planned
+        )
+    )
+    schema_errors: List[Dict[str, Any]] = []
+    try:
+        check_obj = schema._validate(
+            check_obj, lazy=lazy, inplace=inplace, n_jobs=n_jobs
+        )
+    except errors.SchemaErrors as err:
+        check_obj, schema_errors = err.data, err.schema_errors
+    finally:
+        _SKIPPED_CHECKS.reset(token)
+
+    error_handler = SchemaErrorHandler(lazy)
+    for schema_error_dict in schema_errors:
+        error_handler.collect_error(
+            schema_error_dict["reason_code"], schema_error_dict["error"]
+        )
+
+    results = (
+        _run_shards(check_obj, [task for task, *_ in planned], n_shards)
+        if planned
+        else []
+    )
+    for (task, component, check_index, check), (status, failure_cases) in zip(
+        planned, results
+    ):
+        if status == "passed":
+            continue
+        if task.kind == "dataframe":
+            obj, check_args = check_obj, []
+            reason_code = "dataframe_check"
+        elif task.kind == "column":
+            obj, check_args = check_obj, [task.key]
+            reason_code = "schema_component_check"
+        else:
+            obj = check_obj.index.to_series().reset_index(drop=True)
+            check_args = []
+            reason_code = "schema_component_check"
+
+        try:
+            if status == "error":
+                check_result = check(obj, *check_args)
+            else:
+                check_result = CheckResult(None, False, None, failure_cases)
+            _handle_check_result(
+                component, check_index, check, obj, check_result
+            )
+        except errors.SchemaError as err:
+            error_handler.collect_error(reason_code, err)
+        except Exception as err:  # pylint: disable=broad-except
+            if task.kind == "dataframe":
+                raise
+            error_handler.collect_error(
+                reason_code,
+                _check_error(component, obj, check, check_index, err),
+                original_exc=err,
+            )
+
+    if error_handler.collected_errors:
+        raise errors.SchemaErrors(
+            schema, error_handler.collected_errors, check_obj
+        )
+    return check_obj
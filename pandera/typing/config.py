@@ -46,6 +46,9 @@ class BaseConfig:  # pylint:disable=R0903
     #: make sure dataframe column names are unique
     unique_column_names: bool = False
 
+    #: maximum number of failure cases collected by lazy validation
+    max_failure_cases: Optional[int] = None
+
     #: data format before validation. This option only applies to
     #: schemas used in the context of the pandera type constructor
     #: ``pa.typing.DataFrame[Schema](data)``. If None, assumes a data structure
@@ -0,0 +1,710 @@
+"""Find duplicate values and rows of data.
+
+:func:`duplicated` finds the duplicate values of a series or the duplicate
+rows of a dataframe like :meth:`pandas.DataFrame.duplicated`:
+
+- numeric keys that are already sorted, e.g. primary keys of fact tables,
+  are compared with the previous row without hashing.
+- the rows of several columns are hashed into one 64-bit hash per row by
+  combining the hashes of each column. Rows whose hash is unique are
+  unique, so only the rows with repeated hashes are compared exactly.
+  Values of object columns are hashed with their type and numbers by a
+  canonical string, since pandas hashes objects by their string
+  representation.
+- other series are compared with :meth:`pandas.Series.duplicated`.
+
+:class:`DuplicateTracker` finds duplicates across chunks of data, e.g. by
+:meth:`~pandera.DataFrameSchema.validate_stream`, with the same row hashes,
+comparing the values with repeated hashes exactly.
+
+:class:`ApproximateUnique` finds duplicates in a fixed amount of memory
+with a :class:`BloomFilter` of the row hashes, for data with more distinct
+values than can be kept in memory.
+"""
+
+import copy
+import math
+import numbers
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+Keep = Union[bool, str]
+
+# number of values sampled to estimate whether the values of an object
+# column are mostly distinct, in which case hashing each value is faster
+# than hashing the distinct values.
+_CARDINALITY_SAMPLE_SIZE = 10_000
+
+# inferred types of object columns whose values are all strings or all
+# integers, whose string representation is the same for equal values.
+_CANONICAL_INFERRED_TYPES = frozenset(["string", "integer"])
+
+
+def _as_pandas(
+    obj: Union[pd.Series, pd.DataFrame, pd.Index]
+) -> Union[pd.Series, pd.DataFrame]:
+    if isinstance(obj, pd.MultiIndex):
+        return obj.to_frame(index=False)
+    if isinstance(obj, pd.Index):
+        return pd.Series(obj, copy=False)
+    return obj
+
+
+def _columns(obj: Union[pd.Series, pd.DataFrame]) -> List[pd.Series]:
+    if isinstance(obj, pd.Series):
+        return [obj]
+    return [obj.iloc[:, i] for i in range(obj.shape[1])]
+
+
+def _type_name(value_type: type) -> str:
+    """Name of the type of values, which is the same for all numbers."""
+    if issubclass(value_type, (numbers.Number, np.bool_)):
+        return "number"
+    return f"{value_type.__module__}.{value_type.__qualname__}"
+
+
+def _canonical(value: Any) -> Any:
+    """Represent numbers that compare equal with the same string, e.g.
+    ``1``, ``1.0`` and ``True``, and leave other values unchanged."""
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if value_type is float or value_type is np.float64:
+        # nan and infinite floats aren't integers
+        return str(int(value)) if value.is_integer() else repr(float(value))
+    if value_type is int or value_type is bool:
+        return str(int(value))
+    if not isinstance(value, (numbers.Number, np.bool_)):
+        return value
+    try:
+        if isinstance(value, (numbers.Integral, bool, np.bool_)):
+            return str(int(value))
+        if not isinstance(value, numbers.Real):
+            if value.imag:
+                return repr(complex(value))
+            value = value.real
+        if math.isfinite(value) and value == int(value):
+            return str(int(value))
+        if value == float(value) or math.isnan(value):
+            return repr(float(value))
+    except (ArithmeticError, TypeError, ValueError):
+        pass
+    return repr(value)
+
+
+def _object_hashes(series: pd.Series, categorize: bool) -> np.ndarray:
+    """Hash the values of an object series.
+
+    pandas hashes objects by their string representation, so the values are
+    hashed with their type, e.g. ``1`` and ``"1"`` have different hashes,
+    and numbers are hashed by a canonical string, e.g. ``1`` and ``1.0``
+    have the same hash. Missing values all have the same hash.
+    """
+    inferred = pd.api.types.infer_dtype(series, skipna=False)
+    if inferred in _CANONICAL_INFERRED_TYPES:
+        value_type = str if inferred == "string" else int
+        names = np.array([_type_name(value_type)], dtype=object)
+        codes = np.zeros(len(series), dtype=np.intp)
+    else:
+        missing = series.isna().to_numpy()
+        value_types = series.map(type)
+        value_types[missing] = type(None)
+        codes, types = pd.factorize(value_types)
+        series = series.map(_canonical)
+        series[missing] = None
+        names = np.array([_type_name(t) for t in types], dtype=object)
+    hashes = pd.util.hash_pandas_object(
+        series, index=False, categorize=categorize
+    ).to_numpy()
+    return hashes ^ pd.util.hash_array(names)[codes]
+
+
+def _column_hashes(series: pd.Series) -> np.ndarray:
+    """Hash the values of a series."""
+    if series.dtype != object:
+        return pd.util.hash_pandas_object(series, index=False).to_numpy()
+    categorize = True
+    if len(series) > _CARDINALITY_SAMPLE_SIZE:
+        sample = series.iloc[:: len(series) // _CARDINALITY_SAMPLE_SIZE]
+        categorize = sample.nunique(dropna=False) < len(sample) // 2
+    return _object_hashes(series, categorize)
+
+
+def row_hashes(obj: Union[pd.Series, pd.DataFrame, pd.Index]) -> np.ndarray:
+    """Hash the values of a series or the rows of a dataframe.
+
+    Equal values and rows of columns with the same data type have the same
+    hash, but values and rows with the same hash aren't necessarily equal,
+    e.g. objects of the same type with the same string representation, so
+    they must be compared exactly.
+
+    :param obj: a Series, a DataFrame whose rows are hashed, or an Index.
+    :returns: array of the 64-bit hash of each value or row.
+    """
+    columns = _columns(_as_pandas(obj))
+    if not columns:
+        return np.zeros(len(obj), dtype=np.uint64)
+    hashes = _column_hashes(columns[0])
+    if len(columns) == 1:
+        return hashes
+    # combine the hashes of the columns like tuples are hashed, so that
+    # permuted values in a row have different hashes.
+    hashes = hashes ^ np.uint64(0x345678)
+    multiplier = np.uint64(1000003)
+    with np.errstate(over="ignore"):
+        for i, column in enumerate(columns[1:]):
+            hashes *= multiplier
+            hashes ^= _column_hashes(column)
+            multiplier += np.uint64(82520 + 2 * (len(columns) - i))
+    return hashes
+
+
+def _adjacent_duplicated(equal: np.ndarray, keep: Keep) -> np.ndarray:
+    """Mark the duplicates of sorted values from adjacent equal values."""
+    duplicates = np.zeros(len(equal) + 1, dtype=bool)
+    if keep in ("first", False):
+        duplicates[1:] |= equal
+    if keep in ("last", False):
+        duplicates[:-1] |= equal
+    return duplicates
+
+
+def _sorted_duplicated(
+    columns: List[pd.Series], keep: Keep
+) -> Union[np.ndarray, None]:
+    """Find the duplicate rows of sorted numeric columns.
+
+    :returns: None if the columns aren't numeric or their rows aren't
+        sorted lexicographically.
+    """
+    if not all(
+        isinstance(column.dtype, np.dtype) and column.dtype.kind in "biufmM"
+        for column in columns
+    ) or not (
+        # stops at the first unsorted value, so that unsorted data is
+        # detected quickly.
+        columns[0].is_monotonic_increasing
+    ):
+        return None
+    values = [
+        # NaT values are compared as the smallest integer, like pandas does
+        column.to_numpy().view(np.int64)
+        if column.dtype.kind in "mM"
+        else column.to_numpy()
+        for column in columns
+    ]
+    equal = values[0][1:] == values[0][:-1]
+    if len(values) > 1:
+        # rows are sorted if, for each column, the values are increasing
+        # where the previous columns are equal.
+        for column_values in values[1:]:
+            previous, current = column_values[:-1], column_values[1:]
+            if not (current >= previous)[equal].all():
+                return None
+            equal &= current == previous
+    return _adjacent_duplicated(equal, keep)
+
+
+def duplicated(
+    obj: Union[pd.Series, pd.DataFrame, pd.Index], keep: Keep = "first"
+) -> pd.Series:
+    """Find the duplicate values of a series or rows of a dataframe.
+
+    :param obj: a Series, a DataFrame whose rows are compared, or an Index.
+    :param keep: ``keep`` argument of :meth:`pandas.Series.duplicated`.
+    :returns: boolean series marking the duplicates, with the same index as
+        ``obj`` for Series and DataFrames.
+    """
+    pandas_obj = _as_pandas(obj)
+    if not isinstance(pandas_obj, (pd.Series, pd.DataFrame)):
+        # other dataframe libraries, e.g. pyspark.pandas
+        return obj.duplicated(keep=keep)
+    index = None if isinstance(obj, pd.Index) else pandas_obj.index
+    name = pandas_obj.name if isinstance(pandas_obj, pd.Series) else None
+    columns = _columns(pandas_obj)
+    if not len(pandas_obj) or not columns:
+        return pandas_obj.duplicated(keep=keep)
+
+    duplicates = _sorted_duplicated(columns, keep)
+    if duplicates is not None:
+        return pd.Series(duplicates, index=index, name=name)
+    if len(columns) == 1:
+        # the hash table of pandas is faster than hashing a single column
+        return pd.Series(
+            columns[0].duplicated(keep=keep).to_numpy(),
+            index=index,
+            name=name,
+        )
+
+    hashes = row_hashes(pandas_obj)
+    sorted_hashes = np.sort(hashes)
+    repeated = np.unique(
+        sorted_hashes[1:][sorted_hashes[1:] == sorted_hashes[:-1]]
+    )
+    duplicates = np.zeros(len(hashes), dtype=bool)
+    if len(repeated):
+        # rows with repeated hashes may be duplicates or hash collisions
+        positions = np.searchsorted(repeated, hashes)
+        positions[positions == len(repeated)] = 0
+        candidates = np.flatnonzero(repeated[positions] == hashes)
+        duplicates[candidates] = (
+            pandas_obj.iloc[candidates].duplicated(keep=keep).to_numpy()
+        )
+    return pd.Series(duplicates, index=index, name=name)
+
+
+class BloomFilter:
+    """Bloom filter of 64-bit hashes.
+
+    A Bloom filter is a fixed-size bit array that tells whether a hash was
+    added to it, with false positives but no false negatives. The bits of
+    each hash are found by double hashing, i.e. the ``i``-th bit is
+    ``h1 + i * h2`` modulo the number of bits, where ``h1`` is the hash and
+    ``h2`` is derived from it.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        """Initialize BloomFilter.
+
+        :param capacity: number of distinct hashes that can be added before
+            the false positive rate exceeds ``error_rate``.
+        :param error_rate: probability that a hash that wasn't added is
+            reported as added, after ``capacity`` distinct hashes were added.
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, found {capacity}")
+        if not 0 < error_rate < 1:
+            raise ValueError(
+                f"error_rate must be between 0 and 1, found {error_rate}"
+            )
+        self.capacity = capacity
+        self.error_rate = error_rate
+        #: number of bits, which is optimal for the capacity and error rate.
+        self.n_bits = int(
+            math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        #: number of bits set for each hash.
+        self.n_hashes = max(1, round(self.n_bits / capacity * math.log(2)))
+        self._bits = np.zeros((self.n_bits + 7) // 8, dtype=np.uint8)
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes of the bit array."""
+        return self._bits.nbytes
+
+    def _positions(self, hashes: np.ndarray) -> Iterator[np.ndarray]:
+        """Positions of the bits of each hash, for each hash function."""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        n_bits = np.uint64(self.n_bits)
+        with np.errstate(over="ignore"):
+            # the second hash is odd so that the positions of a hash differ
+            step = (
+                (hashes ^ (hashes >> np.uint64(31)))
+                * np.uint64(0x9E3779B97F4A7C15)
+            ) | np.uint64(1)
+            position = hashes % n_bits
+            step %= n_bits
+            for _ in range(self.n_hashes):
+                yield position
+                position = (position + step) % n_bits
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """Whether hashes may have been added to the filter.
+
+        :param hashes: array of 64-bit hashes.
+        :returns: boolean array, which is True for all the added hashes and
+            for false positives.
+        """
+        contained = np.ones(len(hashes), dtype=bool)
+        for position in self._positions(hashes):
+            contained &= (
+                self._bits[position >> np.uint64(3)]
+                >> (position & np.uint64(7)).astype(np.uint8)
+                & np.uint8(1)
+            ).astype(bool)
+        return contained
+
+    def add(self, hashes: np.ndarray) -> None:
+        """Add hashes to the filter.
+
+        :param hashes: array of 64-bit hashes.
+        """
+        for position in self._positions(hashes):
+            byte = position >> np.uint64(3)
+            bit = (position & np.uint64(7)).astype(np.uint8)
+            # bytes may repeat, so the bits are set one bit index at a time,
+            # grouping the bytes by bit index with a stable sort.
+            byte = byte[np.argsort(bit, kind="stable")]
+            bounds = np.zeros(9, dtype=np.intp)
+            np.cumsum(np.bincount(bit, minlength=8), out=bounds[1:])
+            for i in range(8):
+                self._bits[byte[bounds[i] : bounds[i + 1]]] |= np.uint8(1 << i)
+
+
+def _group_ids(values: Union[pd.Series, pd.DataFrame]) -> np.ndarray:
+    """Number the distinct values of a series or rows of a dataframe."""
+    return (
+        (
+            values.groupby(values, sort=False, dropna=False)
+            if isinstance(values, pd.Series)
+            else values.groupby(list(values.columns), sort=False, dropna=False)
+        )
+        .ngroup()
+        .to_numpy()
+    )
+
+
+def _isin(
+    values: Union[pd.Series, pd.DataFrame],
+    reference: Union[pd.Series, pd.DataFrame],
+) -> np.ndarray:
+    """Whether values or rows are equal to values or rows of a reference."""
+    groups = _group_ids(
+        pd.concat(
+            [reference.reset_index(drop=True), values], ignore_index=True
+        )
+    )
+    return np.isin(groups[len(reference) :], groups[: len(reference)])
+
+
+class DuplicateTracker:
+    """Track the values seen in chunks of data to find duplicates.
+
+    Values are compared across chunks by their 64-bit hashes from
+    :func:`row_hashes`, and the distinct values seen so far are kept to
+    confirm exactly that values with the hash of a seen value are equal to
+    it. Duplicates within a chunk are found exactly by :func:`duplicated`.
+
+    With an :class:`ApproximateUnique` setting, the hashes are moved to a
+    :class:`BloomFilter` once more than ``max_exact`` distinct values were
+    seen, and the values are dropped, so that the memory used by the
+    tracker is bounded.
+    """
+
+    def __init__(
+        self,
+        keep: Keep = "first",
+        approximate: Optional["ApproximateUnique"] = None,
+    ) -> None:
+        """Initialize DuplicateTracker.
+
+        :param keep: ``keep`` argument of :meth:`pandas.Series.duplicated`
+            used within a chunk. Values that were seen in previous chunks
+            are always marked as duplicates.
+        :param approximate: settings of the approximate tracking of the
+            values seen in previous chunks. By default, they are tracked
+            exactly.
+        """
+        self.keep = keep
+        self.approximate = approximate
+        # sorted hashes of the distinct values seen so far, which repeat for
+        # distinct values with the same hash, and the positions of these
+        # values in the concatenated chunks of values.
+        self._seen = np.empty(0, dtype=np.uint64)
+        self._seen_positions = np.empty(0, dtype=np.intp)
+        self._values: List[Union[pd.Series, pd.DataFrame]] = []
+        self._n_values = 0
+        self._filter: Optional[BloomFilter] = None
+        self._n_filtered = 0
+
+    def __copy__(self) -> "DuplicateTracker":
+        # the bits of the Bloom filter and the list of values are updated in
+        # place
+        tracker = DuplicateTracker.__new__(DuplicateTracker)
+        tracker.__dict__.update(self.__dict__)
+        tracker._values = list(self._values)
+        tracker._filter = copy.deepcopy(self._filter)
+        return tracker
+
+    @property
+    def n_seen(self) -> int:
+        """Number of distinct values seen so far.
+
+        Once the values are tracked by a Bloom filter, values that are false
+        positives of the filter aren't counted.
+        """
+        return len(self._seen) + self._n_filtered
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used to track the values seen so far, without
+        the memory of the Python objects referenced by object columns."""
+        return (
+            self._seen.nbytes
+            + self._seen_positions.nbytes
+            + sum(
+                int(np.sum(values.memory_usage(index=False)))
+                for values in self._values
+            )
+            + (0 if self._filter is None else self._filter.nbytes)
+        )
+
+    def duplicated(
+        self, obj: Union[pd.Series, pd.DataFrame, pd.Index]
+    ) -> np.ndarray:
+        """Find duplicate values in a chunk and add them to the seen values.
+
+        :param obj: a Series, a DataFrame whose rows are compared, or an
+            Index.
+        :returns: boolean array marking the duplicate values.
+        """
+        duplicates, seen = self._track(obj)
+        return duplicates | seen
+
+    def _track(
+        self, obj: Union[pd.Series, pd.DataFrame, pd.Index]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the duplicates within a chunk and the values that were seen
+        in previous chunks, and add the values to the seen values.
+
+        :returns: boolean arrays marking the duplicates within the chunk and
+            the values that were seen before.
+        """
+        values = _as_pandas(obj)
+        first_duplicates = duplicated(values, keep="first").to_numpy()
+        duplicates = (
+            first_duplicates
+            if self.keep == "first"
+            else duplicated(values, keep=self.keep).to_numpy()
+        )
+        hashes = row_hashes(values)
+        if self._filter is not None:
+            seen = self._filter.contains(hashes)
+            self._n_filtered += len(np.unique(hashes[~seen]))
+            self._filter.add(hashes)
+            return duplicates, seen
+
+        positions = np.searchsorted(self._seen, hashes)
+        positions[positions == len(self._seen)] = 0
+        seen = np.zeros(len(hashes), dtype=bool)
+        if len(self._seen):
+            (candidates,) = np.nonzero(self._seen[positions] == hashes)
+            if len(candidates):
+                # values with the hash of a seen value may be hash collisions
+                seen[candidates] = _isin(
+                    values.iloc[candidates],
+                    self._seen_values(hashes[candidates]),
+                )
+        self._add(values, hashes, np.flatnonzero(~seen & ~first_duplicates))
+        return duplicates, seen
+
+    def _seen_values(
+        self, hashes: np.ndarray
+    ) -> Union[pd.Series, pd.DataFrame]:
+        """Get the seen values with the given hashes."""
+        hashes = np.unique(hashes)
+        starts = np.searchsorted(self._seen, hashes, side="left")
+        counts = np.searchsorted(self._seen, hashes, side="right") - starts
+        # positions in the seen hashes of each range of equal hashes
+        indices = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        indices += np.arange(len(indices))
+        positions = np.sort(self._seen_positions[indices])
+        offsets = np.cumsum([0] + [len(values) for values in self._values])
+        chunks = np.searchsorted(offsets, positions, side="right") - 1
+        return pd.concat(
+            [
+                self._values[chunk].iloc[
+                    positions[chunks == chunk] - offsets[chunk]
+                ]
+                for chunk in np.unique(chunks)
+            ],
+            ignore_index=True,
+        )
+
+    def _add(
+        self,
+        values: Union[pd.Series, pd.DataFrame],
+        hashes: np.ndarray,
+        new: np.ndarray,
+    ) -> None:
+        """Add new distinct values to the seen values.
+
+        :param new: positions of the new distinct values in ``values``.
+        """
+        if not len(new):
+            return
+        if self.approximate is not None and (
+            len(self._seen) + len(new) > self.approximate.max_exact
+        ):
+            self._filter = BloomFilter(
+                self.approximate.capacity, self.approximate.error_rate
+            )
+            self._filter.add(self._seen)
+            self._filter.add(hashes[new])
+            self._n_filtered = len(self._seen) + len(new)
+            self._seen = np.empty(0, dtype=np.uint64)
+            self._seen_positions = np.empty(0, dtype=np.intp)
+            self._values = []
+            return
+        order = np.argsort(hashes[new], kind="stable")
+        new_hashes = hashes[new][order]
+        # insert the new hashes in the sorted seen hashes rather than
+        # sorting all of them again.
+        insert_at = np.searchsorted(self._seen, new_hashes)
+        self._seen = np.insert(self._seen, insert_at, new_hashes)
+        self._seen_positions = np.insert(
+            self._seen_positions, insert_at, self._n_values + order
+        )
+        self._values.append(values.iloc[new].reset_index(drop=True))
+        self._n_values += len(new)
+
+
+class ApproximateUnique:
+    """Check uniqueness in a fixed amount of memory.
+
+    Pass it as the ``unique`` argument of a
+    :class:`~pandera.schema_components.Column` or
+    :class:`~pandera.schemas.SeriesSchema`, or as the ``unique`` argument of
+    a :class:`~pandera.schemas.DataFrameSchema` with the ``columns`` that
+    must be jointly unique.
+
+    The values are validated in blocks of ``block_size`` rows. Duplicates
+    within a block are found exactly, and duplicates of the values of
+    previous blocks and previous chunks of a stream are found exactly with
+    the 64-bit hashes and the distinct values seen so far. Once more than
+    ``max_exact`` distinct values were seen, the hashes are moved to a
+    :class:`BloomFilter` with ``capacity`` values, so that at most
+    ``error_rate`` of the values are falsely reported as duplicates of
+    values of previous blocks as long as at most ``capacity`` distinct
+    values are seen. Duplicates in previous
+    blocks are always reported like ``report_duplicates="exclude_first"``.
+
+    :example:
+
+    >>> import pandas as pd
+    >>> import pandera as pa
+    >>>
+    >>> schema = pa.DataFrameSchema(
+    ...     {"id": pa.Column(int, unique=pa.ApproximateUnique(10**9))}
+    ... )
+    >>> schema.validate(pd.DataFrame({"id": [1, 2, 3]}))
+       id
+    0   1
+    1   2
+    2   3
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10**9,
+        error_rate: float = 0.01,
+        columns: Optional[Union[str, Sequence[str]]] = None,
+        max_exact: int = 10**7,
+        block_size: int = 10**6,
+    ) -> None:
+        """Initialize ApproximateUnique.
+
+        :param capacity: expected maximum number of distinct values. The
+            Bloom filter takes about ``1.44 * log2(1 / error_rate)`` bits per
+            value of capacity, e.g. 1.2 GB for a billion values with a 1%
+            error rate.
+        :param error_rate: false positive rate of the Bloom filter.
+        :param columns: for dataframe schemas, the columns that must be
+            jointly unique.
+        :param max_exact: maximum number of distinct values that are
+            tracked exactly, whose hashes and values are kept in memory.
+        :param block_size: number of rows validated at once.
+        """
+        if capacity <= 0 or block_size <= 0 or max_exact < 0:
+            raise ValueError(
+                "capacity and block_size must be positive and max_exact "
+                f"non-negative, found {capacity}, {block_size} and "
+                f"{max_exact}"
+            )
+        if not 0 < error_rate < 1:
+            raise ValueError(
+                f"error_rate must be between 0 and 1, found {error_rate}"
+            )
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.columns = [columns] if isinstance(columns, str) else columns
+        self.max_exact = max_exact
+        self.block_size = block_size
+
+    def __repr__(self) -> str:
+        return (
+            f"ApproximateUnique(capacity={self.capacity}, "
+            f"error_rate={self.error_rate}, columns={self.columns}, "
+            f"max_exact={self.max_exact}, block_size={self.block_size})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ApproximateUnique):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        # dataframe schemas iterate over the columns of unique constraints
+        return iter(self.columns or [])
+
+    def duplicated(
+        self, obj: Union[pd.Series, pd.DataFrame], keep: Keep = "first"
+    ) -> np.ndarray:
+        """Find the duplicate values of a series or rows of a dataframe.
+
+        If the values of previous blocks were tracked by a Bloom filter and
+        at most ``max_exact`` or ``block_size`` values are reported as
+        duplicates of values of previous blocks, these values are confirmed
+        exactly, so that there are no false positives.
+
+        :param obj: a Series, or a DataFrame whose rows are compared.
+        :param keep: ``keep`` argument of :meth:`pandas.Series.duplicated`
+            used within a block.
+        :returns: boolean array marking the duplicates.
+        """
+        tracker = DuplicateTracker(keep, approximate=self)
+        duplicates = np.zeros(len(obj), dtype=bool)
+        # values reported as duplicates of values of previous blocks only
+        candidates = []
+        for start in range(0, len(obj), self.block_size):
+            block = obj.iloc[start : start + self.block_size]
+            filtered = tracker._filter is not None
+            block_duplicates, seen = tracker._track(block)
+            if filtered:
+                candidates.append(
+                    start + np.flatnonzero(seen & ~block_duplicates)
+                )
+            duplicates[start : start + len(block)] = block_duplicates | seen
+        if candidates:
+            positions = np.concatenate(candidates)
+            if 0 < len(positions) <= max(self.max_exact, self.block_size):
+                duplicates[positions] = self._confirm(obj, positions)
+        return duplicates
+
+    def _confirm(
+        self, obj: Union[pd.Series, pd.DataFrame], positions: np.ndarray
+    ) -> np.ndarray:
+        """Confirm that values occur in blocks before their own block.
+
+        :returns: boolean array of the confirmed values at ``positions``.
+        """
+        candidate_hashes = np.unique(row_hashes(obj.iloc[positions]))
+        # positions of the values with the same hash as a candidate
+        matched = np.concatenate(
+            [
+                start
+                + np.flatnonzero(
+                    np.isin(
+                        row_hashes(obj.iloc[start : start + self.block_size]),
+                        candidate_hashes,
+                    )
+                )
+                for start in range(0, len(obj), self.block_size)
+            ]
+        )
+        groups = _group_ids(obj.iloc[matched])
+        blocks = matched // self.block_size
+        first_blocks = np.full(groups.max() + 1, len(obj), dtype=np.intp)
+        np.minimum.at(first_blocks, groups, blocks)
+        candidates = np.searchsorted(matched, positions)
+        return first_blocks[groups[candidates]] < blocks[candidates]
+
+
+def _approximate_unique(unique: Any) -> Optional[ApproximateUnique]:
+    """The ``unique`` setting of a schema if it's approximate."""
+    return unique if isinstance(unique, ApproximateUnique) else None
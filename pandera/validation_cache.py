@@ -0,0 +1,238 @@
+"""Cache the results of validations by the content of the validated data.
+
+A :class:`ValidationCache` skips validating data whose content is identical
+to data that was already validated successfully by the same schema, e.g.
+reference tables that are validated many times by a pipeline. Entries are
+keyed by a fingerprint of the data and a fingerprint of the schema
+definition, see :mod:`pandera.fingerprints`.
+
+:example:
+
+>>> import pandas as pd
+>>> import pandera as pa
+>>> from pandera.validation_cache import ValidationCache
+>>>
+>>> schema = pa.DataFrameSchema({"a": pa.Column(int, pa.Check.ge(0))})
+>>> cache = ValidationCache()
+>>> df = pd.DataFrame({"a": [1, 2, 3]})
+>>> _ = cache.validate(schema, df)
+>>> _ = cache.validate(schema, df.copy())
+>>> cache.hits, cache.misses
+(1, 1)
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+import pandas as pd
+
+from .fingerprints import content_fingerprint, schema_fingerprint
+from .schemas import _copy_check_obj
+
+# validate arguments that don't change the result of a successful
+# validation.
+_IGNORED_VALIDATE_KWARGS = frozenset(["lazy", "inplace", "n_jobs", "n_shards"])
+
+# marks entries whose validated data is identical to the data to validate,
+# so that the data doesn't need to be stored.
+_UNCHANGED = "unchanged"
+
+
+def _fingerprint(schema: Any) -> Optional[str]:
+    if hasattr(schema, "fingerprint") and not isinstance(schema, type):
+        # memoized on schemas
+        return schema.fingerprint
+    if isinstance(schema, type) and hasattr(schema, "to_schema"):
+        # SchemaModel classes
+        return _fingerprint(schema.to_schema())
+    return schema_fingerprint(schema)
+
+
+def _nbytes(value: Any) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True, index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True, index=True))
+    return 0
+
+
+class ValidationCache:
+    """Least-recently used cache of successful validations.
+
+    Validations are only cached if they succeed, so data that fails
+    validation is validated again each time. If validation modifies the
+    data, e.g. by coercing data types, the validated data is stored in the
+    cache, otherwise only the key of the validation is stored.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_bytes: Optional[int] = 2**30,
+        directory: Optional[Union[str, os.PathLike]] = None,
+    ) -> None:
+        """Initialize ValidationCache.
+
+        :param max_entries: maximum number of validations in memory.
+        :param max_bytes: maximum number of bytes of the validated data
+            stored in memory, or None for no limit. Validated data larger
+            than this limit isn't cached.
+        :param directory: if specified, validations are also stored in
+            pickle files in this directory, so that they're shared across
+            processes. Entries on disk aren't evicted; use :meth:`clear` to
+            remove them.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = None if directory is None else Path(directory)
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(schema: Any, content: str, **validate_kwargs) -> Optional[str]:
+        """Get the cache key of the validation of data by a schema.
+
+        :param schema: schema or schema component.
+        :param content: fingerprint of the data from
+            :func:`content_fingerprint`.
+        :param validate_kwargs: keyword arguments of ``schema.validate``.
+        :returns: hexadecimal digest, or None if the schema can't be
+            fingerprinted, in which case its validations aren't cached.
+        """
+        fingerprint = _fingerprint(schema)
+        if fingerprint is None:
+            return None
+        kwargs = sorted(
+            (name, value)
+            for name, value in validate_kwargs.items()
+            if name not in _IGNORED_VALIDATE_KWARGS and value is not None
+        )
+        return hashlib.blake2b(
+            repr((fingerprint, content, kwargs)).encode(),
+            digest_size=16,
+        ).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{key}.pkl"
+
+    def get(self, key: str) -> Any:
+        """Get a cached validation.
+
+        :returns: the validated data, the ``"unchanged"`` marker if it's
+            identical to the data to validate, or None if the validation
+            isn't cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as file:
+                value = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        self._put_in_memory(key, value)
+        return value
+
+    def _put_in_memory(self, key: str, value: Any) -> None:
+        nbytes = _nbytes(value)
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous[1]
+            self._entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self.nbytes > self.max_bytes
+            ):
+                _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+                self.nbytes -= evicted_nbytes
+
+    def put(self, key: str, value: Any) -> None:
+        """Cache a validation.
+
+        :param key: key from :meth:`key`.
+        :param value: the validated data, or ``"unchanged"``.
+        """
+        self._put_in_memory(key, value)
+        if self.directory is None:
+            return
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=self.directory, delete=False, suffix=".tmp"
+        ) as file:
+            pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(file.name, self._path(key))
+
+    def clear(self) -> None:
+        """Remove all the validations from memory and disk."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+        if self.directory is not None:
+            for path in self.directory.glob("*.pkl"):
+                path.unlink()
+
+    def validate(self, schema: Any, check_obj: Any, **validate_kwargs) -> Any:
+        """Validate data with a schema unless it was validated already.
+
+        :param schema: schema or schema component.
+        :param check_obj: data to validate.
+        :param validate_kwargs: keyword arguments of ``schema.validate``.
+        :returns: the validated data. On cache hits, the data to validate
+            isn't modified, even with ``inplace=True``, and a copy of the
+            validated data is returned.
+        """
+        content = (
+            None
+            # sampled rows are random without a random state
+            if validate_kwargs.get("sample") is not None
+            and validate_kwargs.get("random_state") is None
+            else content_fingerprint(check_obj)
+        )
+        key = (
+            None
+            if content is None
+            else self.key(schema, content, **validate_kwargs)
+        )
+        if key is None:
+            return schema.validate(check_obj, **validate_kwargs)
+
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            if isinstance(cached, str) and cached == _UNCHANGED:
+                if validate_kwargs.get("inplace", False):
+                    return check_obj
+                return _copy_check_obj(check_obj)
+            return cached.copy()
+
+        self.misses += 1
+        validated = schema.validate(check_obj, **validate_kwargs)
+        # with inplace=True, the validated data may be the modified data to
+        # validate.
+        unchanged = (
+            type(validated) is type(check_obj)
+            and content_fingerprint(validated) == content
+        )
+        self.put(key, _UNCHANGED if unchanged else validated.copy())
+        return validated
@@ -15,9 +15,11 @@ from pandera import (
     Int,
     SeriesSchema,
     String,
+    check_utils,
     error_formatters,
     errors,
 )
+from pandera.config import CONFIG
 
 
 def test_vectorized_checks() -> None:
@@ -474,3 +476,129 @@ def test_prepare_series_check_output_df_level():
     expected_output = [True, False, True, False, True, False, True]
     result = check(df)
     assert result.check_output.tolist() == expected_output
+
+
+@pytest.mark.parametrize("vectorize", [True, False])
+def test_element_wise_vectorization(vectorize, monkeypatch) -> None:
+    """Test that element-wise checks are applied to whole arrays if possible."""
+    monkeypatch.setattr(CONFIG, "vectorize_element_wise", vectorize)
+    calls = []
+
+    def in_range(x):
+        calls.append(x)
+        return (x >= 0) & (x < 10)
+
+    def is_str(x):
+        calls.append(x)
+        return isinstance(x, str)
+
+    series = pd.Series([1, 5, 20], index=[2, 4, 6], name="x")
+    check = Check(in_range, element_wise=True)
+    for _ in range(2):
+        result = check(series)
+        assert result.check_output.tolist() == [True, True, False]
+        assert result.failure_cases.to_dict() == {6: 20}
+    assert len(calls) == (2 if vectorize else 6)
+
+    # element-wise checks that fail on arrays are applied per element, and
+    # only tried with whole arrays once per dtype.
+    calls.clear()
+    check = Check(is_str, element_wise=True)
+    for _ in range(2):
+        result = check(pd.Series(["a", 1]))
+        assert result.check_output.tolist() == [True, False]
+    assert len(calls) == (5 if vectorize else 4)
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [2, 2, 2]})
+    check = Check(lambda row: row["a"] < row["b"], element_wise=True)
+    result = check(df)
+    assert result.check_output.tolist() == [True, False, False]
+    assert not check(df).check_passed
+
+
+@pytest.mark.parametrize("vectorize", [True, False])
+def test_element_wise_dataframe_reduction(vectorize, monkeypatch) -> None:
+    """Test that element-wise dataframe checks reducing rows aren't applied
+    to whole dataframes by default, since reductions of a dataframe reduce
+    its columns."""
+    monkeypatch.setattr(CONFIG, "vectorize_element_wise", vectorize)
+    df = pd.DataFrame([[1, -5], [2, -3]])
+    check = Check(lambda row: row.max() > 0, element_wise=True)
+    result = check(df)
+    assert result.check_output.tolist() == [True, True]
+    assert result.check_passed
+    DataFrameSchema(checks=check).validate(df)
+
+    # vectorizing element-wise dataframe checks is opt-in
+    monkeypatch.setattr(CONFIG, "vectorize_element_wise_dataframes", True)
+    calls = []
+
+    def a_lt_b(row):
+        calls.append(row)
+        return row["a"] < row["b"]
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [2, 2, 2]})
+    result = Check(a_lt_b, element_wise=True)(df)
+    assert result.check_output.tolist() == [True, False, False]
+    assert len(calls) == 1
+
+
+def test_element_wise_dataframe_row_views() -> None:
+    """Test that element-wise dataframe checks can be applied to row views."""
+    df = pd.DataFrame(
+        {"a": [1, 2, 3], "b": ["x", "y", "z"]}, index=["i", "j", "k"]
+    )
+
+    def check_row(row):
+        return row["a"] in {1, 2} and row.b != "y" and "x" in list(row)
+
+    check = Check(check_row, element_wise=True)
+    result = check(df)
+    assert result.check_output.tolist() == [True, False, False]
+    assert result.check_output.index.tolist() == ["i", "j", "k"]
+    assert check._element_wise_strategies == {
+        (("a", "b"), tuple(df.dtypes)): "rows"
+    }
+
+    # columns that can't be attributes are accessed by label
+    check = Check(
+        lambda row: row["name"] == row.get("a b") and "a b" in row,
+        element_wise=True,
+    )
+    other = pd.DataFrame({"name": [1, 2], "a b": [1, 3]})
+    assert check(other).check_output.tolist() == [True, False]
+    assert list(check._element_wise_strategies.values()) == ["rows"]
+
+    # functions using pd.Series methods fall back to DataFrame.apply
+    check = Check(lambda row: row.isna().sum() == 0, element_wise=True)
+    assert check(df.assign(b=["x", None, "z"])).check_output.tolist() == [
+        True,
+        False,
+        True,
+    ]
+    assert list(check._element_wise_strategies.values()) == ["apply"]
+
+
+def test_passing_check_fast_path(monkeypatch) -> None:
+    """Test that failure cases are only prepared when a check fails."""
+
+    def prepare_series_check_output(*args, **kwargs):
+        raise AssertionError("failure cases prepared for a passing check")
+
+    series = pd.Series([1.0, 2.0, None], index=["a", "b", "c"])
+    with monkeypatch.context() as context:
+        context.setattr(
+            check_utils,
+            "prepare_series_check_output",
+            prepare_series_check_output,
+        )
+        result = Check.ge(0)(series.fillna(0))
+    assert result.check_passed
+    assert result.failure_cases.empty
+    assert result.check_output.index.equals(series.index)
+
+    # nulls and failures still go through the regular path
+    assert Check.ge(0)(series).check_passed
+    result = Check.ge(2, n_failure_cases=1)(series)
+    assert not result.check_passed
+    assert result.failure_cases.to_dict() == {"a": 1.0}
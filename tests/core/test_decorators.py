@@ -6,6 +6,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+import pandera.schemas
 from pandera import (
     Check,
     Column,
@@ -16,6 +17,7 @@ from pandera import (
     Int,
     SchemaModel,
     String,
+    check,
     check_input,
     check_io,
     check_output,
@@ -567,6 +569,99 @@ def test_check_types_unchanged() -> None:
     pd.testing.assert_frame_equal(transform(df, 2), df)
 
 
+def test_check_types_skips_validated_schema(monkeypatch) -> None:
+    """Test that check_types doesn't re-validate data validated by an equal
+    schema, without comparing the schemas."""
+
+    @check_types
+    def inner(df: DataFrame[OnlyZeroesSchema]) -> DataFrame[OnlyZeroesSchema]:
+        return df
+
+    @check_types
+    def outer(df: DataFrame[OnlyZeroesSchema]) -> DataFrame[OnlyZeroesSchema]:
+        return inner(df)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("schemas shouldn't be compared")
+
+    schema = OnlyZeroesSchema.to_schema()
+    monkeypatch.setattr(type(schema), "__eq__", fail)
+    monkeypatch.setattr(type(schema), "__ne__", fail, raising=False)
+    validated = schema.validate(pd.DataFrame({"a": [0]}))
+
+    validations = []
+    validate = type(schema).validate
+    monkeypatch.setattr(
+        type(schema),
+        "validate",
+        lambda self, *args, **kwargs: validations.append(self)
+        or validate(self, *args, **kwargs),
+    )
+    outer(validated)
+    assert not validations
+
+    # data validated by another schema is validated again
+    outer(validated.pandera.add_schema(DataFrameSchema({"a": Column(int)})))
+    assert len(validations) == 1
+
+
+def test_check_types_revalidates_different_arrays() -> None:
+    """Test that check_types validates data validated by a schema whose
+    checks only differ inside a large array."""
+
+    def make_model(values):
+        class Model(SchemaModel):  # pylint: disable=too-few-public-methods
+            """Test schema with a check referencing an array."""
+
+            a: Series[int]
+
+            @check("a")
+            @classmethod
+            def in_values(cls, series: pd.Series) -> pd.Series:
+                """Check that the values are in the array."""
+                return series.isin(values)
+
+        return Model
+
+    values = np.arange(5000)
+    other_values = values.copy()
+    other_values[2500] = -1
+    model, other_model = make_model(values), make_model(other_values)
+
+    @check_types
+    def transform(df: DataFrame[other_model]):  # type: ignore
+        return df
+
+    validated = model.validate(pd.DataFrame({"a": [2500]}))
+    with pytest.raises(errors.SchemaError):
+        transform(validated)
+
+
+def test_check_types_revalidates_without_fingerprint(monkeypatch) -> None:
+    """Test that check_types validates data again if the schema can't be
+    fingerprinted."""
+    monkeypatch.setattr(
+        pandera.schemas, "memoized_fingerprint", lambda _: None
+    )
+
+    @check_types
+    def transform(df: DataFrame[OnlyZeroesSchema]):
+        return df
+
+    schema = OnlyZeroesSchema.to_schema()
+    validated = schema.validate(pd.DataFrame({"a": [0]}))
+    validations = []
+    validate = type(schema).validate
+    monkeypatch.setattr(
+        type(schema),
+        "validate",
+        lambda self, *args, **kwargs: validations.append(self)
+        or validate(self, *args, **kwargs),
+    )
+    transform(validated)
+    assert len(validations) == 1
+
+
 # required to be globals:
 # see https://pydantic-docs.helpmanual.io/usage/postponed_annotations/
 class InSchema(SchemaModel):  # pylint:disable=too-few-public-methods
@@ -193,3 +193,40 @@ def test_return_base_dtype(engine: Engine):
         TypeError, match="DataType 'ParametrizedDtypec' cannot be instantiated"
     ):
         engine.dtype(ParametrizedDtypec)
+
+
+def test_memoized_dtype():
+    """Test that the data types resolved by an engine are memoized until
+    new data types are registered."""
+    calls = []
+
+    class CachedEngine(  # pylint:disable=too-few-public-methods
+        metaclass=Engine, base_pandera_dtypes=BaseDataType
+    ):
+        @classmethod
+        def dtype(cls, data_type: Any) -> DataType:
+            calls.append(data_type)
+            return Engine.dtype(cls, data_type)
+
+    CachedEngine.register_dtype(SimpleDtype, equivalents=["simple", 1])
+
+    assert CachedEngine.dtype("simple") == SimpleDtype()
+    assert CachedEngine.dtype("simple") == SimpleDtype()
+    assert CachedEngine.dtype(1) == SimpleDtype()
+    assert CachedEngine.dtype(1) == SimpleDtype()
+    # only strings and classes are memoized
+    assert calls == ["simple", 1, 1]
+    info = CachedEngine.dtype_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    with pytest.raises(TypeError, match="not understood"):
+        CachedEngine.dtype("foo")
+    assert CachedEngine.dtype_cache_info().currsize == 1
+
+    @CachedEngine.register_dtype(equivalents=["simple", "foo"])
+    class _Dtype(BaseDataType):
+        pass
+
+    assert CachedEngine.dtype_cache_info().currsize == 0
+    assert CachedEngine.dtype("simple") == _Dtype()
+    assert CachedEngine.dtype("foo") == _Dtype()
@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from pandera.engines import utils
+from pandera.engines import pandas_engine, utils
 
 
 @pytest.mark.parametrize(
@@ -25,6 +25,43 @@ def test_numpy_pandas_coercible(
     )
 
 
+@pytest.mark.parametrize(
+    "values, data_type",
+    [
+        [["1", "x", None, 2.5, 3, "1.5", 2**70, "nan"], "int64"],
+        [["1", "x", None, 200, -1], "uint8"],
+        [["1", "x", None, 2.5, "inf", True], "float64"],
+        [["1", "x", None, 2.5, 3], "Int64"],
+        [["2021-01-01", "x", None, pd.Timestamp("2021"), 1], "datetime64"],
+        [["a", "x", None, 1, np.nan], pd.CategoricalDtype(["a", 1])],
+        [[True, "x", None, 1, 0.0, "True", np.nan], "boolean"],
+        [["a", "b", None], str],
+    ],
+)
+def test_numpy_pandas_coercible_vectorized(values, data_type):
+    """Test that values found coercible with vectorized operations are
+    coercible one at a time."""
+    data_container = pd.Series(
+        values,
+        dtype=object,
+        index=list("abcdefgh")[: len(values)],
+        name="values",
+    )
+    pandera_dtype = pandas_engine.Engine.dtype(data_type)
+
+    def _coercible(value):
+        try:
+            pandera_dtype.coerce_value(value)
+            return True
+        except Exception:  # pylint:disable=broad-except
+            return False
+
+    pd.testing.assert_series_equal(
+        utils.numpy_pandas_coercible(data_container, data_type),
+        data_container.map(_coercible),
+    )
+
+
 @pytest.mark.parametrize(
     "data_container",
     [
@@ -20,7 +20,10 @@ import pytest
 
 from pandera import Check, Column, DataFrameSchema
 from pandera.engines import pandas_engine
+from pandera.error_handlers import FailureCaseBudget
 from pandera.errors import (
+    CollectedErrors,
+    FailureCaseAccumulator,
     ParserError,
     ReducedPickleExceptionBase,
     SchemaError,
@@ -324,3 +327,137 @@ def test_pickling_parser_error():
         assert unpickled.failure_cases == str(exc.failure_cases)
     else:
         pytest.fail("ParserError not raised")
+
+
+def test_failure_case_accumulator():
+    """Test that failure cases are accumulated into one DataFrame."""
+    schema = DataFrameSchema(
+        {
+            "a": Column(int, Check.ge(0)),
+            ("b", "c"): Column(int, [Check.ge(0), Check.le(1)]),
+        },
+        checks=Check(lambda df: df.sum(axis=1) < 2),
+    )
+    df = pd.DataFrame({"a": [-1, 2], ("b", "c"): [-1, 2]})
+    with pytest.raises(SchemaErrors) as exc_info:
+        schema.validate(df, lazy=True)
+    exc = exc_info.value
+    failure_cases = exc.failure_cases
+    assert exc.failure_cases is failure_cases
+    assert failure_cases.columns.tolist() == FailureCaseAccumulator.COLUMNS
+    assert failure_cases.check_number.dtype == np.int64
+    assert failure_cases.failure_case.dtype == np.int64
+    assert failure_cases.index.tolist() == [3, 4, 0, 1, 2]
+    assert failure_cases[
+        ["column", "failure_case", "index"]
+    ].values.tolist() == [
+        ["a", 2, 1],
+        [("b", "c"), 2, 1],
+        ["a", -1, 0],
+        [("b", "c"), -1, 0],
+        [("b", "c"), 2, 1],
+    ]
+
+    # the same failure cases collected twice are deduplicated
+    collected = CollectedErrors(exc.schema_errors + exc.schema_errors)
+    assert len(collected.failure_cases) == 2 * len(failure_cases)
+    pd.testing.assert_frame_equal(
+        collected.failure_cases.to_frame(), failure_cases
+    )
+
+
+def test_lazy_error_message():
+    """Test that error messages are rendered once, on first access."""
+    rendered = []
+
+    def render_message():
+        rendered.append(True)
+        return "error message"
+
+    exc = SchemaError(None, None, render_message)
+    assert not rendered
+    assert str(exc) == "error message"
+    assert exc.args == ("error message",)
+    assert repr(exc) == "SchemaError('error message')"
+    assert rendered == [True]
+
+    with pytest.warns(UserWarning, match="Pickling SchemaError"):
+        unpickled = pickle.loads(
+            pickle.dumps(SchemaError(None, None, render_message))
+        )
+    assert str(unpickled) == "error message"
+
+
+@pytest.mark.parametrize("max_failure_cases", [0, 10, 2000])
+def test_max_failure_cases(max_failure_cases):
+    """Test that the failure cases are sampled within the budget."""
+    schema = DataFrameSchema(
+        {
+            "a": Column(int, Check.lt(100), unique=True),
+            "b": Column(float, Check.gt(500)),
+        },
+        max_failure_cases=max_failure_cases,
+    )
+    df = pd.DataFrame(
+        {"a": np.arange(1000), "b": np.r_[[np.nan] * 300, np.arange(700.0)]}
+    )
+    with pytest.raises(SchemaErrors) as exc_info:
+        schema.validate(df, lazy=True, random_state=0)
+    exc = exc_info.value
+    failure_cases = exc.failure_cases
+    assert len(failure_cases) == min(max_failure_cases, 900 + 300 + 501)
+    assert "Failure Counts" in str(exc)
+    # the failure counts include all the failure cases
+    counts = exc.failure_counts
+    assert counts[["column", "check", "n_failure_cases", "n_checked"]].to_dict(
+        "records"
+    ) == [
+        {
+            "column": "a",
+            "check": "less_than(100)",
+            "n_failure_cases": 900,
+            "n_checked": 1000,
+        },
+        {
+            "column": "b",
+            "check": "not_nullable",
+            "n_failure_cases": 300,
+            "n_checked": 1000,
+        },
+        {
+            "column": "b",
+            "check": "greater_than(500)",
+            "n_failure_cases": 501,
+            "n_checked": 1000,
+        },
+    ]
+    assert counts.failure_fraction.tolist() == [0.9, 0.3, 0.501]
+
+    # failure cases are values of the validated dataframe
+    for column, failure_case, index in failure_cases[
+        ["column", "failure_case", "index"]
+    ].itertuples(index=False):
+        value = df.at[index, column]
+        assert value == failure_case or (
+            np.isnan(value) and np.isnan(failure_case)
+        )
+
+
+def test_failure_case_budget_reservoir():
+    """Test that merged samples of failure cases are uniform samples."""
+    budget = FailureCaseBudget(100, random_state=0)
+    counts = [1000, 3000, 50, 0]
+    n_kept = np.zeros(len(counts))
+    for _ in range(200):
+        takes = budget.reservoir(counts, [min(c, 100) for c in counts])
+        assert sum(len(take) for take in takes) == 100
+        for take in takes:
+            assert (np.diff(take) > 0).all()
+        n_kept += [len(take) for take in takes]
+    fractions = n_kept / n_kept.sum()
+    np.testing.assert_allclose(
+        fractions, np.array(counts) / sum(counts), atol=0.01
+    )
+
+    with pytest.raises(ValueError, match="non-negative"):
+        FailureCaseBudget(-1)
@@ -0,0 +1,145 @@
+"""Tests for validation events and their exporters."""
+
+import json
+
+import pandas as pd
+import pytest
+
+from pandera import Check, Column, DataFrameSchema, SeriesSchema, errors
+from pandera.events import (
+    flush_events,
+    register_event_handler,
+    unregister_event_handler,
+)
+from pandera.exporters import JSONLinesSpanLogger, PrometheusWriter
+
+
+@pytest.fixture
+def handled_events():
+    """Collect the events emitted within the test."""
+    collected = []
+    handler = register_event_handler(collected.append)
+    try:
+        yield collected
+    finally:
+        flush_events()
+        unregister_event_handler(handler)
+
+
+def test_validation_events(handled_events) -> None:
+    """Test the events emitted by the validation of a dataframe."""
+    schema = DataFrameSchema(
+        {
+            "a": Column(int, Check.ge(0)),
+            "b": Column(int, coerce=True),
+        },
+        name="my_schema",
+    )
+    schema.validate(pd.DataFrame({"a": [1, 2], "b": ["1", "2"]}))
+    flush_events()
+    assert [
+        (event.kind, event.schema, event.column, event.check, event.passed)
+        for event in handled_events
+    ] == [
+        ("validation_start", "my_schema", None, None, None),
+        ("component_start", "my_schema", "a", None, None),
+        (
+            "check_result",
+            "my_schema",
+            "a",
+            "greater_than_or_equal_to(0)",
+            True,
+        ),
+        ("component_end", "my_schema", "a", None, True),
+        ("component_start", "my_schema", "b", None, None),
+        ("component_end", "my_schema", "b", None, True),
+        ("validation_end", "my_schema", None, None, True),
+    ]
+    assert all(
+        event.duration >= 0
+        for event in handled_events
+        if event.kind.endswith("_end")
+    )
+
+    handled_events.clear()
+    with pytest.raises(errors.SchemaErrors):
+        schema.validate(
+            pd.DataFrame({"a": [-1, -2, 3], "b": ["1", "x", "y"]}),
+            lazy=True,
+        )
+    flush_events()
+    by_kind = {event.kind: event for event in handled_events}
+    assert by_kind["coercion_failure"].column == "b"
+    assert by_kind["coercion_failure"].failures == 2
+    assert not by_kind["check_result"].passed
+    assert by_kind["check_result"].failures == 2
+    assert not by_kind["validation_end"].passed
+
+
+def test_series_schema_events(handled_events) -> None:
+    """Test that series schemas emit validation and check events."""
+    SeriesSchema(int, Check.gt(0)).validate(pd.Series([1, 2]))
+    flush_events()
+    assert [(event.kind, event.schema) for event in handled_events] == [
+        ("validation_start", "SeriesSchema"),
+        ("check_result", "SeriesSchema"),
+        ("validation_end", "SeriesSchema"),
+    ]
+
+
+def test_handler_errors_are_warnings() -> None:
+    """Test that exceptions raised by handlers are reported as warnings."""
+
+    def handler(event):
+        raise ValueError(event.kind)
+
+    register_event_handler(handler)
+    try:
+        with pytest.warns(RuntimeWarning, match="validation_start"):
+            SeriesSchema(int).validate(pd.Series([1]))
+            flush_events()
+    finally:
+        unregister_event_handler(handler)
+
+
+def test_exporters(tmp_path) -> None:
+    """Test the Prometheus writer and the JSON lines span logger."""
+    metrics_path = tmp_path / "pandera.prom"
+    spans_path = tmp_path / "spans.jsonl"
+    writer = register_event_handler(PrometheusWriter(metrics_path))
+    logger = register_event_handler(JSONLinesSpanLogger(spans_path))
+    schema = DataFrameSchema({"a": Column(int, Check.ge(0))}, name="s")
+    try:
+        schema.validate(pd.DataFrame({"a": [1, 2]}))
+        with pytest.raises(errors.SchemaError):
+            schema.validate(pd.DataFrame({"a": [-1, 2]}))
+        flush_events()
+    finally:
+        unregister_event_handler(writer)
+        unregister_event_handler(logger)
+        logger.close()
+
+    metrics = metrics_path.read_text()
+    assert metrics == writer.render()
+    for line in [
+        "# TYPE pandera_validations_total counter",
+        'pandera_validations_total{schema="s",status="failed"} 1.0',
+        'pandera_validations_total{schema="s",status="passed"} 1.0',
+        "# TYPE pandera_check_duration_seconds histogram",
+        'pandera_check_duration_seconds_count{schema="s",column="a",'
+        'check="greater_than_or_equal_to(0)"} 2',
+        'pandera_check_failure_cases_total{schema="s",column="a",'
+        'check="greater_than_or_equal_to(0)"} 1.0',
+        'pandera_component_duration_seconds_bucket{schema="s",column="a",'
+        'le="+Inf"} 2',
+    ]:
+        assert line in metrics.splitlines()
+
+    spans = [json.loads(line) for line in spans_path.read_text().splitlines()]
+    assert [span["kind"] for span in spans] == [
+        "check_result",
+        "component_end",
+        "validation_end",
+    ] * 2
+    assert all(span["start"] <= span["timestamp"] for span in spans)
+    assert [span["passed"] for span in spans[3:]] == [False, False, False]
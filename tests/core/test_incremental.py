@@ -0,0 +1,130 @@
+"""Tests for the incremental validation of dataframes."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandera import Check, Column, DataFrameSchema, Index, errors
+from pandera.incremental import IncrementalState
+
+
+def _append(df: pd.DataFrame, rows: dict) -> pd.DataFrame:
+    return pd.concat([df, pd.DataFrame(rows)], ignore_index=True)
+
+
+def test_validate_incremental() -> None:
+    """Test that only the appended rows are validated."""
+    n_checked = []
+
+    def positive(value):
+        n_checked.append(np.size(value))
+        return value > 0
+
+    schema = DataFrameSchema(
+        {"a": Column(int, [Check.ge(0), Check(positive, element_wise=True)])}
+    )
+    state = IncrementalState()
+    df = pd.DataFrame({"a": [1, 2]})
+    assert schema.validate_incremental(df, state) is df
+    assert state.n_rows == 2
+
+    df = _append(df, {"a": [3]})
+    assert schema.validate_incremental(df, state) is df
+    assert schema.validate_incremental(df, state) is df
+    assert sum(n_checked) == 3
+    assert state.n_rows == 3
+
+    invalid = _append(df, {"a": [-1]})
+    with pytest.raises(errors.SchemaError):
+        schema.validate_incremental(invalid, state)
+    # the state isn't updated by failed validations
+    assert state.n_rows == 3
+    schema.validate_incremental(_append(df, {"a": [4]}), state)
+    assert state.n_rows == 4
+
+
+@pytest.mark.parametrize(
+    "schema, first, second",
+    [
+        [
+            DataFrameSchema({"a": Column(int, unique=True)}),
+            pd.DataFrame({"a": [1, 2]}),
+            {"a": [3, 1]},
+        ],
+        [
+            DataFrameSchema(
+                {"a": Column(int), "b": Column(int)}, unique=["a", "b"]
+            ),
+            pd.DataFrame({"a": [1, 1], "b": [1, 2]}),
+            {"a": [2, 1], "b": [1, 2]},
+        ],
+        [
+            DataFrameSchema({"a": Column(int)}, index=Index(int, unique=True)),
+            pd.DataFrame({"a": [1, 2]}, index=[10, 11]),
+            {"a": [3]},
+        ],
+    ],
+)
+def test_validate_incremental_uniqueness(schema, first, second) -> None:
+    """Test that duplicates of previously validated rows are found."""
+    state = IncrementalState()
+    schema.validate_incremental(first, state)
+    if schema.index is not None:
+        df = pd.concat([first, pd.DataFrame(second, index=[10])])
+    else:
+        df = _append(first, second)
+    with pytest.raises(errors.SchemaErrors) as exc_info:
+        schema.validate_incremental(df, state, lazy=True)
+    failure_cases = exc_info.value.failure_cases
+    assert len(failure_cases) >= 1
+    assert state.n_rows == 2
+
+
+def test_validate_incremental_aggregate_checks() -> None:
+    """Test that checks of aggregates are evaluated on the whole dataframe."""
+    schema = DataFrameSchema(
+        {"a": Column(float, Check(lambda s: s.mean() < 10))},
+        checks=Check(lambda df: len(df) <= 3),
+    )
+    state = IncrementalState()
+    df = pd.DataFrame({"a": [1.0, 2.0]})
+    schema.validate_incremental(df, state)
+    with pytest.raises(errors.SchemaErrors) as exc_info:
+        schema.validate_incremental(
+            _append(df, {"a": [100.0, 1.0]}), state, lazy=True
+        )
+    assert (
+        exc_info.value.failure_cases.check.str.contains("lambda")
+    ).sum() == 2
+
+    # checks of aggregates are evaluated even without new rows
+    df["a"] = [1.0, 100.0]
+    with pytest.raises(errors.SchemaError):
+        schema.validate_incremental(df, state)
+
+
+def test_validate_incremental_coercion() -> None:
+    """Test that appended rows are coerced."""
+    schema = DataFrameSchema({"a": Column(int, coerce=True)})
+    state = IncrementalState()
+    df = schema.validate_incremental(pd.DataFrame({"a": ["1", "2"]}), state)
+    df = pd.concat(
+        [df.astype(object), pd.DataFrame({"a": ["3"]})], ignore_index=True
+    )
+    validated = schema.validate_incremental(df, state)
+    assert validated["a"].tolist() == [1, 2, 3]
+    assert validated["a"].dtype == "int64"
+
+
+def test_validate_incremental_invalid_state() -> None:
+    """Test that states of other dataframes or schemas are rejected."""
+    schema = DataFrameSchema({"a": Column(int)})
+    state = IncrementalState()
+    df = pd.DataFrame({"a": [1, 2]}, index=[0, 1])
+    schema.validate_incremental(df, state)
+    with pytest.raises(ValueError, match="removed or reordered"):
+        schema.validate_incremental(df.iloc[:1], state)
+    with pytest.raises(ValueError, match="removed or reordered"):
+        schema.validate_incremental(df.iloc[::-1], state)
+    with pytest.raises(ValueError, match="another schema"):
+        DataFrameSchema({"a": Column(float)}).validate_incremental(df, state)
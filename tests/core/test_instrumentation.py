@@ -0,0 +1,72 @@
+"""Tests for the instrumentation of validation phases."""
+
+import pandas as pd
+import pytest
+
+from pandera import Check, Column, DataFrameSchema, Index, errors
+from pandera.instrumentation import (
+    PHASES,
+    record_validation,
+    validation_phase,
+)
+
+
+def test_record_validation(capfd) -> None:
+    """Test that the phases of validation are recorded."""
+    schema = DataFrameSchema(
+        {
+            "a": Column(int, Check(lambda s: s > 0), unique=True),
+            "b": Column(float, coerce=True, nullable=True),
+        },
+        index=Index(int),
+        checks=Check(lambda df: df["a"] > df["b"].fillna(0), name="a_gt_b"),
+        unique=["a", "b"],
+    )
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [0, None, 1]})
+
+    schema.validate(df)
+    assert capfd.readouterr().out == ""
+
+    with record_validation() as recorder, record_validation() as inner:
+        schema.validate(df)
+    records = recorder.to_frame()
+    assert inner.records == recorder.records
+    assert set(records.phase) <= set(PHASES)
+    assert records[["component", "phase", "check"]].values.tolist() == [
+        ["DataFrameSchema", "strictness", None],
+        ["Column('b')", "coercion", None],
+        ["Column('a')", "nullable", None],
+        ["Column('a')", "unique", None],
+        ["Column('a')", "dtype", None],
+        ["Column('a')", "check", "fused_checks"],
+        ["Column('a')", "check", "<lambda>"],
+        ["Column('b')", "dtype", None],
+        ["Index", "nullable", None],
+        ["Index", "dtype", None],
+        ["DataFrameSchema", "check", "a_gt_b"],
+        ["DataFrameSchema", "unique", None],
+    ]
+    assert (records.duration >= 0).all()
+    assert (records.rows == 3).all()
+    column_a = records.component == "Column('a')"
+    assert (records.nbytes[column_a] == df["a"].nbytes).all()
+    assert not records.raised.any()
+
+    # phases aren't recorded outside of record_validation
+    schema.validate(df)
+    assert len(recorder.records) == len(records)
+
+    with record_validation() as recorder:
+        with pytest.raises(errors.SchemaError):
+            schema.validate(df.assign(a=[1, 1, 3]))
+    assert recorder.to_frame().raised.tolist()[-1]
+
+
+def test_validation_phase_disabled() -> None:
+    """Test that validation phases are no-ops when they aren't recorded."""
+    with validation_phase(None, "check", check="check") as phase:
+        assert phase is None
+    with record_validation() as recorder:
+        with validation_phase(None, "check", check="check"):
+            pass
+    assert recorder.to_frame().check.tolist() == ["check"]
@@ -1,6 +1,7 @@
 """Test numpy engine."""
 
 import hypothesis.strategies as st
+import numpy as np
 import pandas as pd
 import pytest
 from hypothesis import given
@@ -49,6 +50,20 @@ def test_pandas_data_type_coerce(data_type_cls):
         assert exc.failure_cases.shape[0] > 0
 
 
+def test_pandas_memoized_dtype():
+    """Test that pandas dtypes are memoized by the pandas engine."""
+    engine = pandas_engine.Engine
+    info = engine.dtype_cache_info()
+    for data_type in [np.dtype("int64"), pd.StringDtype(), "float64", int]:
+        assert engine.dtype(data_type) is engine.dtype(data_type)
+    assert engine.dtype_cache_info().hits >= info.hits + 4
+
+    # categorical dtypes with categories in a different order compare equal
+    for categories in [["a", "b"], ["b", "a"]]:
+        pandera_dtype = engine.dtype(pd.CategoricalDtype(categories))
+        assert list(pandera_dtype.categories) == categories
+
+
 CATEGORIES = ["A", "B", "C"]
 
 
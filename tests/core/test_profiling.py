@@ -0,0 +1,115 @@
+"""Tests for profiling validation."""
+
+import pandas as pd
+import pytest
+
+from pandera import (
+    Check,
+    Column,
+    DataFrameSchema,
+    Hypothesis,
+    Index,
+    MultiIndex,
+    SeriesSchema,
+)
+from pandera.profiling import PROFILE_COLUMNS
+
+
+def _report_rows(report: pd.DataFrame) -> dict:
+    return {
+        (row.component, row.phase, row.check): (row.calls, row.failures)
+        for row in report.itertuples()
+    }
+
+
+def test_dataframe_schema_profile() -> None:
+    """Test profiling the validation of a dataframe."""
+    schema = DataFrameSchema(
+        {
+            "a": Column(int, Check(lambda s: s > 1)),
+            "b": Column(float, nullable=False),
+            "num_.+": Column(int, Check.ge(0), regex=True),
+            "group": Column(str),
+            "value": Column(
+                float,
+                Hypothesis.two_sample_ttest(
+                    "x", "y", groupby="group", relationship="greater_than"
+                ),
+            ),
+        },
+        index=MultiIndex(
+            [Index(int, Check.ge(0), name="i"), Index(str, name="j")]
+        ),
+        checks=Check(lambda df: df["a"] < 4, name="a_lt_4"),
+    )
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3, 4],
+            "b": [1.0, None, None, 2.0],
+            "num_1": [1, 2, 3, 4],
+            "num_2": [1, -2, 3, 4],
+            "group": ["x", "x", "y", "y"],
+            "value": [1.0, 2.0, 3.0, 4.0],
+        },
+        index=pd.MultiIndex.from_arrays(
+            [[0, -1, 2, 3], ["a", "b", "c", "d"]], names=["i", "j"]
+        ),
+    )
+    report = schema.profile(df)
+
+    assert report.columns.tolist() == PROFILE_COLUMNS
+    assert report.time.is_monotonic_decreasing
+    assert report.time_share.sum() == pytest.approx(1.0)
+    assert (report.peak_memory >= 0).all()
+    rows = _report_rows(report)
+    assert rows[("Column('a')", "check", "<lambda>")] == (1, 1)
+    assert rows[("Column('b')", "nullable", None)] == (1, 2)
+    # regex columns are reported for each matched column
+    assert rows[
+        ("Column('num_2')", "check", "greater_than_or_equal_to(0)")
+    ] == (
+        1,
+        1,
+    )
+    assert rows[("Column('i')", "check", "greater_than_or_equal_to(0)")] == (
+        1,
+        1,
+    )
+    hypothesis = report.loc[report.component == "Column('value')"].iloc[0]
+    assert hypothesis.check.startswith("failed two sample ttest")
+    assert hypothesis.failures == 1
+    # failure cases of dataframe checks are reported for each column
+    assert rows[("DataFrameSchema", "check", "a_lt_4")] == (1, 6)
+    assert rows[("DataFrameSchema", "strictness", None)] == (1, 0)
+    assert report.loc[report.component == "Column('a')", "rows"].eq(4).all()
+
+
+def test_series_schema_profile() -> None:
+    """Test profiling the validation of a series without tracing memory."""
+    schema = SeriesSchema(float, Check.gt(1), nullable=False, name="x")
+    report = schema.profile(
+        pd.Series([1.0, 2.0, None], name="x"), trace_memory=False
+    )
+    rows = _report_rows(report)
+    assert rows[("SeriesSchema('x')", "check", "greater_than(1)")] == (1, 1)
+    assert rows[("SeriesSchema('x')", "nullable", None)] == (1, 1)
+    assert report.peak_memory.isna().all()
+
+    report = Index(int, Check.gt(0)).profile(pd.DataFrame(index=[1, 2]))
+    assert report.failures.sum() == 0
+    assert set(report.component) == {"Index"}
+
+
+def test_profile_truncated_failure_cases() -> None:
+    """Test that failures are counted beyond the collected failure cases."""
+    schema = DataFrameSchema(
+        {
+            "a": Column(int, Check.gt(0)),
+            "b": Column(int, Check.lt(0, n_failure_cases=1)),
+        },
+        max_failure_cases=2,
+    )
+    df = pd.DataFrame({"a": [-1, -2, -3, -4, 5], "b": [1, 2, 3, 4, -5]})
+    rows = _report_rows(schema.profile(df))
+    assert rows[("Column('a')", "check", "greater_than(0)")] == (1, 4)
+    assert rows[("Column('b')", "check", "less_than(0)")] == (1, 4)
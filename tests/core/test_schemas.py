@@ -10,6 +10,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+import pandera.fingerprints
 from pandera import (
     Category,
     Check,
@@ -22,8 +23,11 @@ from pandera import (
     String,
     errors,
 )
+from pandera.config import CONFIG
 from pandera.dtypes import UniqueSettings
 from pandera.engines.pandas_engine import Engine
+from pandera.derived_arrays import derived_arrays, derived_arrays_scope
+from pandera.fusion import fused_check_results
 from pandera.schemas import SeriesSchemaBase
 
 
@@ -610,6 +614,85 @@ def test_no_dtype_series() -> None:
         schema.validate(pd.Series([0, 1, 2, None, 4, 1]))
 
 
+def test_coerce_columns_at_once() -> None:
+    """Test that the columns coerced with astype are coerced at once, and
+    that failing columns are coerced one at a time."""
+    df = pd.DataFrame(
+        {
+            "a": ["1", "2", "3"],
+            "b": ["1.5", "2", "x"],
+            "c": [1, 2, 3],
+            "d": ["2020-01-01", "2020-01-02", "2020-01-03"],
+            "e_1": ["1", "2", "y"],
+            "e_2": ["4", "5", "6"],
+        }
+    )
+    schema = DataFrameSchema(
+        {
+            "a": Column(int),
+            "b": Column(float),
+            "c": Column(int),
+            "d": Column(datetime),
+            "e_.+": Column(int, regex=True),
+            "e_2": Column(float),
+        },
+        coerce=True,
+    )
+    obj = df.copy()
+    with pytest.raises(errors.SchemaErrors) as exc_info:
+        schema.coerce_dtype(obj)
+    failure_cases = exc_info.value.failure_cases
+    assert failure_cases["failure_case"].tolist() == ["x", "y"]
+    assert failure_cases["check"].tolist() == [
+        "coerce_dtype('float64')",
+        "coerce_dtype('int64')",
+    ]
+
+    # the coerced columns are in the data of the errors
+    coerced = exc_info.value.data
+    assert coerced.dtypes.astype(str).tolist() == [
+        "int64",
+        "object",
+        "int64",
+        "datetime64[ns]",
+        "object",
+        "float64",
+    ]
+    assert coerced["e_2"].tolist() == [4.0, 5.0, 6.0]
+    pd.testing.assert_frame_equal(obj, df)
+
+    valid = df.assign(b=["1.5", "2", "3"], e_1=["1", "2", "3"])
+    pd.testing.assert_frame_equal(
+        schema.coerce_dtype(valid.copy()),
+        valid.astype(
+            {
+                "a": int,
+                "b": float,
+                "c": int,
+                "d": "datetime64[ns]",
+                "e_1": int,
+                "e_2": float,
+            }
+        ),
+    )
+
+    # validating in place coerces the columns of the validated dataframe
+    valid = df[["a", "c"]].copy()
+    schema = DataFrameSchema(
+        {"a": Column(int), "c": Column(float)}, coerce=True
+    )
+    schema.validate(valid, inplace=True)
+    assert valid.dtypes.astype(str).tolist() == ["int64", "float64"]
+
+    # lazy validation keeps the coerced columns in the data of the errors
+    with pytest.raises(errors.SchemaErrors) as exc_info:
+        schema.validate(df[["a", "b"]].rename(columns={"b": "c"}), lazy=True)
+    assert exc_info.value.data.dtypes.astype(str).tolist() == [
+        "int64",
+        "object",
+    ]
+
+
 def test_coerce_without_dtype() -> None:
     """Test that an error is thrown when a dtype isn't specified and coerce
     is True."""
@@ -800,6 +883,95 @@ def test_schema_equality_operators():
     assert series_schema_base != not_equal_schema
 
 
+def test_schema_fingerprint(monkeypatch) -> None:
+    """Test that schema fingerprints are memoized until schemas change."""
+
+    def make_schema():
+        return DataFrameSchema(
+            {"a": Column(float, Check(lambda s: s >= 0), nullable=True)},
+            index=Index(int),
+        )
+
+    schema = make_schema()
+    assert schema.fingerprint == make_schema().fingerprint
+    assert schema.fingerprint == copy.deepcopy(schema).fingerprint
+    assert schema == make_schema()
+
+    calls = []
+    monkeypatch.setattr(
+        pandera.fingerprints,
+        "schema_fingerprint",
+        lambda schema, **_: calls.append(schema) or "fingerprint",
+    )
+    schema = make_schema()
+    fingerprint = schema.fingerprint
+    assert schema.fingerprint == fingerprint
+    schema.validate(pd.DataFrame({"a": [1, None]}))
+    assert schema.fingerprint == fingerprint
+    assert calls == [schema]
+    monkeypatch.undo()
+
+    # setting an attribute of a component or check changes the fingerprint
+    for modify in [
+        lambda schema: setattr(schema, "strict", True),
+        lambda schema: setattr(schema.columns["a"], "_nullable", False),
+        lambda schema: setattr(schema.index, "_unique", True),
+        lambda schema: setattr(schema.columns["a"].checks[0], "name", "ge"),
+    ]:
+        schema = make_schema()
+        fingerprint = schema.fingerprint
+        modify(schema)
+        assert schema.fingerprint != fingerprint
+
+    series_schema = SeriesSchema(int, Check.gt(0))
+    assert series_schema.fingerprint != SeriesSchema(int).fingerprint
+    assert (
+        series_schema.fingerprint == SeriesSchema(int, Check.gt(0)).fingerprint
+    )
+
+
+def test_schema_fingerprint_validation(monkeypatch) -> None:
+    """Test that validation and modifying other schemas keep the memoized
+    fingerprints of schemas."""
+    schemas = [
+        DataFrameSchema(
+            {"a_.*": Column(regex=True), "b": Column(float, coerce=True)},
+            dtype=int,
+        ),
+        SeriesSchema(int, index=Index(int), coerce=True),
+    ]
+    data = [
+        pd.DataFrame({"a_1": [1], "a_2": [2], "b": [1]}),
+        pd.Series([1], index=[0]),
+    ]
+    fingerprints = [schema.fingerprint for schema in schemas]
+
+    calls = []
+    monkeypatch.setattr(
+        pandera.fingerprints,
+        "schema_fingerprint",
+        lambda schema, **_: calls.append(schema) or "fingerprint",
+    )
+    for _ in range(2):
+        for schema, obj in zip(schemas, data):
+            schema.validate(obj)
+    other = DataFrameSchema({"a": Column(int)})
+    other.columns["a"].set_checks = None
+    other.strict = True
+    assert [schema.fingerprint for schema in schemas] == fingerprints
+    assert not calls
+
+    monkeypatch.undo()
+
+    # checks shared by schemas invalidate the fingerprints of all of them
+    check = Check.gt(0)
+    parents = [SeriesSchema(int, check), Column(int, check)]
+    fingerprints = [parent.fingerprint for parent in parents]
+    check.name = "positive"
+    for parent, fingerprint in zip(parents, fingerprints):
+        assert parent.fingerprint != fingerprint
+
+
 def test_add_and_remove_columns() -> None:
     """Check that adding and removing columns works as expected and doesn't
     modify the original underlying DataFrameSchema."""
@@ -1929,3 +2101,369 @@ def test_column_set_unique():
     assert not test_schema.columns["a"].unique
     test_schema = test_schema.update_column("a", unique=True)
     assert test_schema.columns["a"].unique
+
+
+def test_validation_plan_cache():
+    """Test that validation plans are compiled once per set of columns."""
+    schema = DataFrameSchema(
+        {
+            "a": Column(int),
+            "num_.+": Column(float, regex=True),
+        },
+        strict=True,
+    )
+    df = pd.DataFrame({"a": [1, 2], "num_1": [1.0, 2.0], "num_2": [0.5, 1]})
+
+    plan = schema._get_validation_plan(df.columns)
+    assert schema._get_validation_plan(df.columns.copy()) is plan
+    assert plan.column_errors == []
+    assert {col.name: list(keys) for col, keys in plan.column_components} == {
+        "a": ["a"],
+        "num_.+": ["num_1", "num_2"],
+    }
+    assert isinstance(schema.validate(df), pd.DataFrame)
+
+    # a different set of columns compiles a different plan
+    other_df = df.assign(b=1)
+    other_plan = schema._get_validation_plan(other_df.columns)
+    assert other_plan is not plan
+    assert other_plan.column_errors == [("column_not_in_schema", "b")]
+    with pytest.raises(errors.SchemaError, match="column 'b' not in"):
+        schema.validate(other_df)
+
+    # modifying the schema compiles a new plan
+    schema.strict = "filter"
+    filter_plan = schema._get_validation_plan(other_df.columns)
+    assert filter_plan is not other_plan
+    assert filter_plan.filter_out_columns == ["b"]
+    assert "b" not in schema.validate(other_df)
+
+    schema.columns["a"].required = False
+    assert schema._get_validation_plan(other_df.columns) is not filter_plan
+
+    # the cache doesn't affect schema equality, copies and pickling.
+    assert schema == copy.deepcopy(schema)
+    assert "_validation_plans" not in copy.deepcopy(schema).__dict__
+    assert "_validation_plans" not in schema.__getstate__()
+
+
+def test_validation_plan_missing_columns():
+    """Test that plans handle missing columns with lazy validation."""
+    schema = DataFrameSchema(
+        {
+            "a": Column(int),
+            "b": Column(int, Check.ge(0)),
+            "c": Column(int, required=False),
+        }
+    )
+    df = pd.DataFrame({"b": [-1, 1]})
+    plan = schema._get_validation_plan(df.columns)
+    assert plan.columns_not_in_dataframe == ["a"]
+    assert [col.name for col, _ in plan.column_components] == ["b"]
+
+    for _ in range(2):
+        with pytest.raises(errors.SchemaErrors) as exc:
+            schema.validate(df, lazy=True)
+        assert exc.value.error_counts == {
+            "column_not_in_dataframe": 1,
+            "schema_component_check": 1,
+        }
+
+
+def test_validation_does_not_copy_schema(monkeypatch):
+    """Test that schema components aren't copied on validation."""
+    schema = DataFrameSchema(
+        {
+            "a": Column(int, Check.ge(0), coerce=True),
+            "num_.+": Column(float, Check.le(10), regex=True),
+        },
+        index=MultiIndex([Index(int, name="i0"), Index(str, name="i1")]),
+        dtype=float,
+        coerce=True,
+    )
+    df = pd.DataFrame(
+        {"a": [1, 2], "num_1": [1, 2], "num_2": [0.5, 1]},
+        index=pd.MultiIndex.from_arrays([[1, 2], ["a", "b"]]),
+    ).rename_axis(["i0", "i1"])
+
+    def _deepcopy(*args, **kwargs):
+        raise AssertionError("deepcopy called during validation")
+
+    monkeypatch.setattr(copy, "deepcopy", _deepcopy)
+    validated_df = schema.validate(df)
+    assert (validated_df.dtypes == float).all()
+
+    # the per-validation dtype override doesn't modify the schema columns
+    assert schema.columns["a"].dtype == Engine.dtype(int)
+    assert schema.columns["a"].coerce
+
+    # the columns of the schema are validated as-is, so modifying them is
+    # reflected in subsequent validations.
+    schema.columns["a"].checks.append(Check.le(1))
+    with pytest.raises(errors.SchemaError, match="less_than_or_equal_to"):
+        schema.validate(df)
+
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(df.assign(num_2=[100, 1]), lazy=True)
+    assert exc.value.failure_cases.column.tolist() == ["a", "num_2"]
+
+
+@pytest.mark.parametrize("copy_on_write", [True, False])
+def test_copy_on_write_validation(copy_on_write, monkeypatch):
+    """Test that validated data is shared with the validated dataframe."""
+    monkeypatch.setattr(CONFIG, "copy_on_write", copy_on_write)
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+
+    schema = DataFrameSchema({"a": Column(int), "b": Column(str)})
+    validated_df = schema.validate(df)
+    assert validated_df is not df
+    assert (
+        np.shares_memory(validated_df["b"].to_numpy(), df["b"].to_numpy())
+        is copy_on_write
+    )
+
+    # columns modified by validation don't modify the original dataframe
+    schema = DataFrameSchema(
+        {"a": Column(float, coerce=True)}, strict="filter"
+    )
+    validated_df = schema.validate(df)
+    assert validated_df.columns.tolist() == ["a"]
+    assert validated_df["a"].dtype == float
+    assert df.columns.tolist() == ["a", "b"]
+    assert df["a"].dtype == int
+
+    series_schema = SeriesSchema(int, Check.ge(0))
+    series = pd.Series([1, 2, 3])
+    assert (
+        np.shares_memory(
+            series_schema.validate(series).to_numpy(), series.to_numpy()
+        )
+        is copy_on_write
+    )
+
+
+@pytest.mark.parametrize("n_jobs", [None, 1, 4, -1])
+def test_validate_n_jobs(n_jobs):
+    """Test that errors are collected in order with parallel validation."""
+    schema = DataFrameSchema(
+        {
+            f"col_{i}": Column(int, Check.ge(0), nullable=i % 2 == 0)
+            for i in range(10)
+        },
+        checks=[
+            Check(lambda df: df.sum(axis=1) > 0, name="positive_sum"),
+            Check(lambda df: df.notna().all(axis=1), name="no_nulls"),
+        ],
+        index=Index(int, Check.lt(3)),
+    )
+    df = pd.DataFrame({f"col_{i}": [1, 2, 3] for i in range(10)})
+    assert schema.validate(df, n_jobs=n_jobs).equals(df)
+
+    invalid_df = df.assign(col_3=[-1, 2, 3], col_7=[1, -2, 3])
+    invalid_df.index = [0, 1, 5]
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(invalid_df, lazy=True, n_jobs=n_jobs)
+    assert [
+        (error["error"].schema.name, error["error"].check)
+        for error in exc.value.schema_errors
+    ] == [
+        ("col_3", Check.ge(0)),
+        ("col_7", Check.ge(0)),
+        (None, Check.lt(3)),
+    ]
+
+    with pytest.raises(errors.SchemaError, match="col_3"):
+        schema.validate(invalid_df, n_jobs=n_jobs)
+
+
+def _is_even(value) -> bool:
+    return value % 2 == 0
+
+
+def _row_a_lt_100(row) -> bool:
+    return row["a"] < 100
+
+
+@pytest.mark.parametrize("n_shards", [2, 3])
+def test_validate_sharded(n_shards):
+    """Test that sharded validation reports the same errors."""
+    schema = DataFrameSchema(
+        {
+            "a": Column(
+                int, [Check.ge(0), Check(_is_even, element_wise=True)]
+            ),
+            "b": Column(str, Check.isin(list("vwxyz")), unique=True),
+            "c": Column(float, Check(lambda s: s.mean() > 0), coerce=True),
+        },
+        checks=Check(_row_a_lt_100, element_wise=True),
+        index=Index(int, Check.le(6)),
+    )
+    df = pd.DataFrame(
+        {"a": [0, 2, 4, 6, 8], "b": list("vwxyz"), "c": range(5)}
+    )
+    assert schema.validate(df, n_shards=n_shards).equals(schema.validate(df))
+
+    invalid_df = df.assign(
+        a=[-2, 1, 4, 200, 3], b=list("vwxxq"), c=[-1, -2, -3, -4, -5]
+    )
+    invalid_df.index = [0, 2, 4, 6, 8]
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(invalid_df, lazy=True)
+    with pytest.raises(errors.SchemaErrors) as sharded_exc:
+        schema.validate(invalid_df, lazy=True, n_shards=n_shards)
+
+    def sort_failure_cases(failure_cases):
+        return (
+            failure_cases.astype(str)
+            .sort_values(list(failure_cases.columns))
+            .reset_index(drop=True)
+        )
+
+    pd.testing.assert_frame_equal(
+        sort_failure_cases(sharded_exc.value.failure_cases),
+        sort_failure_cases(exc.value.failure_cases),
+    )
+    assert sharded_exc.value.error_counts == exc.value.error_counts
+
+    with pytest.raises(errors.SchemaError, match="greater_than_or_equal_to"):
+        schema.validate(df.assign(a=[0, 2, -2, 4, 6]), n_shards=n_shards)
+
+
+@pytest.mark.parametrize(
+    "report_duplicates, expected_index",
+    [
+        ("exclude_first", [1, 2, 4]),
+        ("all", [0, 1, 2, 4]),
+    ],
+)
+def test_validate_stream(report_duplicates, expected_index):
+    """Test that uniqueness is validated across streamed chunks."""
+    schema = DataFrameSchema(
+        {
+            "a": Column(
+                int,
+                Check.ge(0),
+                unique=True,
+                report_duplicates=report_duplicates,
+            ),
+            "b": Column(str),
+        },
+        unique=["a", "b"],
+        report_duplicates=report_duplicates,
+    )
+    chunks = [
+        pd.DataFrame({"a": [1, 1], "b": ["x", "y"]}, index=[0, 1]),
+        pd.DataFrame({"a": [1, -1, 2], "b": ["x", "z", "w"]}, index=[2, 3, 4]),
+        pd.DataFrame({"a": [3], "b": ["x"]}, index=[5]),
+    ]
+    chunks[1].loc[4, "a"] = 1
+
+    validated = []
+    with pytest.raises(errors.SchemaErrors) as exc:
+        for chunk in schema.validate_stream(iter(chunks), lazy=True):
+            validated.append(chunk)
+    assert len(validated) == len(chunks)
+
+    failure_cases = exc.value.failure_cases
+    assert (
+        failure_cases.loc[
+            failure_cases.check == "field_uniqueness", "index"
+        ].tolist()
+        == expected_index
+    )
+    assert failure_cases.loc[
+        failure_cases.check == "greater_than_or_equal_to(0)", "index"
+    ].tolist() == [3]
+    assert failure_cases.loc[
+        failure_cases.check == "multiple_fields_uniqueness", "index"
+    ].tolist() == [2, 2]
+
+    # non-lazy validation raises the first error
+    stream = schema.validate_stream(chunks[:1] + chunks[2:])
+    with pytest.raises(errors.SchemaError, match="duplicate values"):
+        next(stream)
+
+    valid_chunks = [pd.DataFrame({"a": [i], "b": ["x"]}) for i in range(3)]
+    for chunk, validated_chunk in zip(
+        valid_chunks, schema.validate_stream(valid_chunks)
+    ):
+        pd.testing.assert_frame_equal(chunk, validated_chunk)
+
+
+def test_fused_checks():
+    """Test that fused built-in checks report the same errors as checks."""
+    checks = [
+        Check.ge(0),
+        Check.le(10),
+        Check.in_range(0, 10, include_max=False),
+        Check.isin([1, 2, 10]),
+        Check.notin([3]),
+        Check.lt(10, ignore_na=False),
+        Check.eq("a"),
+        Check(lambda s: s > 0),
+    ]
+    fused = fused_check_results(checks, pd.Series([1.0, 2.0, np.nan, 10.0]))
+    assert list(fused) == [0, 1, 3, 4]
+    assert all(result.check_passed for result in fused.values())
+    assert fused_check_results(checks, pd.Series(["a"])) == {}
+
+    schema = SeriesSchema(float, checks[:-2], nullable=True, name="x")
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(
+            pd.Series([1.0, 2.0, np.nan, 10.0], name="x"), lazy=True
+        )
+    failure_cases = exc.value.failure_cases
+    assert failure_cases.check.tolist() == [
+        "in_range(0, 10)",
+        "less_than(10)",
+        "less_than(10)",
+    ]
+    assert failure_cases["index"].tolist() == [3, 2, 3]
+
+    with pytest.warns(UserWarning, match="greater_than_or_equal_to"):
+        SeriesSchema(int, Check.ge(2, raise_warning=True)).validate(
+            pd.Series([1, 2])
+        )
+
+
+def test_derived_arrays(monkeypatch):
+    """Test that the checks of a column share the arrays derived from it."""
+    df = pd.DataFrame({"a": [1.0, np.nan, 3.0], "b": [1, 2, 3]})
+    with derived_arrays_scope() as cache:
+        arrays = derived_arrays(df["a"])
+        assert derived_arrays(df["a"]) is arrays
+        assert derived_arrays(df["b"]) is not arrays
+        assert derived_arrays(df["a"].copy()) is not arrays
+        assert arrays.n_nulls() == 1
+        assert arrays.min_max() == (1.0, 3.0)
+        assert arrays.factorized()[0].tolist() == [0, -1, 1]
+        assert arrays.isna() is arrays.isna()
+        assert len(cache) == 3
+    assert derived_arrays(df["a"]) is None
+
+    isna_calls = []
+    series_isna = pd.Series.isna
+
+    def isna(series):
+        isna_calls.append(series.name)
+        return series_isna(series)
+
+    monkeypatch.setattr(pd.Series, "isna", isna)
+    schema = DataFrameSchema(
+        {
+            "a": Column(
+                float,
+                [Check(lambda s, i=i: s > i, name=str(i)) for i in range(30)],
+                nullable=False,
+            )
+        }
+    )
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(df, lazy=True)
+    assert len(exc.value.schema_errors) == 30
+    assert isna_calls.count("a") == 1
+
+    # comparison checks pass on the bounds of the values, and isin checks
+    # with many values look up the unique values.
+    checks = [Check.in_range(1, 3), Check.isin(range(100)), Check.gt(1)]
+    assert list(fused_check_results(checks, df["b"])) == [0, 1]
@@ -0,0 +1,250 @@
+"""Tests for finding duplicate values and rows."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pandera as pa
+from pandera import uniqueness
+from pandera.errors import SchemaError, SchemaInitError
+from pandera.incremental import IncrementalState
+from pandera.uniqueness import (
+    ApproximateUnique,
+    BloomFilter,
+    DuplicateTracker,
+    duplicated,
+    row_hashes,
+)
+
+
+@pytest.mark.parametrize("keep", ["first", "last", False])
+@pytest.mark.parametrize("sort", [True, False])
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"a": [3, 1, 2, 1, 3, 3]},
+        {"a": [1.0, np.nan, -0.0, 0.0, np.nan, 2.0]},
+        {"a": pd.to_datetime(["2020", None, "2021", None, "2020", "2022"])},
+        {"a": [1, 1, 2, 2, 1, 3], "b": [1.0, 2.0, 2.0, 2.0, 1.0, np.nan]},
+        {"a": [1, 1, 1, 2, 2, 2], "b": [np.nan, np.nan, 1, 1, 1, 2]},
+        {"a": ["x", "y", "x", None, None, "y"], "b": [1, 2, 1, 3, 3, 3]},
+        {"a": [1, 2, 1, 2, 1, 2], "b": [2, 1, 2, 1, 1, 2]},
+    ],
+)
+def test_duplicated(data, sort, keep):
+    """Test that duplicates are found like pandas finds them."""
+    df = pd.DataFrame(data, index=list("uvwxyz"))
+    if sort:
+        df = df.sort_values(list(df.columns), kind="stable")
+    pd.testing.assert_series_equal(
+        duplicated(df, keep=keep), df.duplicated(keep=keep)
+    )
+    pd.testing.assert_series_equal(
+        duplicated(df["a"], keep=keep), df["a"].duplicated(keep=keep)
+    )
+    np.testing.assert_array_equal(
+        duplicated(pd.MultiIndex.from_frame(df), keep=keep).to_numpy(),
+        df.duplicated(keep=keep).to_numpy(),
+    )
+
+
+def test_duplicated_hash_collisions(monkeypatch):
+    """Test that rows with the same hash are compared exactly."""
+    df = pd.DataFrame({"a": [1, 2, 1, 3], "b": ["x", "y", "x", "z"]})
+    monkeypatch.setattr(
+        uniqueness,
+        "row_hashes",
+        lambda obj: np.zeros(len(obj), dtype=np.uint64),
+    )
+    assert duplicated(df).tolist() == [False, False, True, False]
+
+
+@pytest.mark.parametrize("n_chunks", [1, 5])
+def test_duplicated_mixed_types(n_chunks):
+    """Test that rows of object columns with values of different types and
+    the same string representation aren't duplicates."""
+    df = pd.DataFrame({"a": [1, "1", 1.5, "1.5"], "b": ["x", "x", 1, 1]})
+    assert not duplicated(df).any()
+    assert len(np.unique(row_hashes(df))) == len(df)
+    df = pd.concat([df, df.iloc[[1]]])
+    expected = [False, False, False, False, True]
+    assert duplicated(df).tolist() == expected
+    unique = ApproximateUnique(capacity=10, max_exact=0, block_size=2)
+    assert unique.duplicated(df).tolist() == expected
+    tracker = DuplicateTracker()
+    assert (
+        np.concatenate(
+            [
+                tracker.duplicated(chunk)
+                for chunk in np.array_split(df, n_chunks)
+            ]
+        ).tolist()
+        == expected
+    )
+
+
+@pytest.mark.parametrize("duplicate", [5.0, True, np.int64(5), 5 + 0j])
+def test_duplicated_equal_numbers(duplicate):
+    """Test that equal numbers of object columns with mostly distinct values
+    are duplicates."""
+    values = [f"s{i}" for i in range(20_000)] + [5, 1, duplicate]
+    df = pd.DataFrame({"a": pd.Series(values, dtype=object), "b": 0})
+    assert df.duplicated().sum() == 1
+    assert duplicated(df).tolist() == df.duplicated().tolist()
+    schema = pa.DataFrameSchema(unique=["a", "b"])
+    with pytest.raises(SchemaError, match="not unique"):
+        schema.validate(df)
+
+
+def test_row_hashes():
+    """Test that rows are hashed by the values and order of their columns."""
+    df = pd.DataFrame({"a": [1, 2, 1], "b": [2, 1, 2]})
+    hashes = row_hashes(df)
+    assert hashes.dtype == np.uint64
+    assert hashes[0] == hashes[2]
+    assert hashes[0] != hashes[1]
+    np.testing.assert_array_equal(row_hashes(df.a), row_hashes(pd.Index(df.a)))
+
+
+def test_duplicate_tracker():
+    """Test that duplicates are found across chunks."""
+    tracker = DuplicateTracker(keep=False)
+    chunks = [
+        pd.DataFrame({"a": [1, 1, 2], "b": ["x", "x", "y"]}),
+        pd.DataFrame({"a": [3, 2], "b": ["z", "y"]}),
+    ]
+    assert tracker.duplicated(chunks[0]).tolist() == [True, True, False]
+    assert tracker.duplicated(chunks[1]).tolist() == [False, True]
+    assert tracker.n_seen == 3
+
+
+def test_duplicate_tracker_hash_collisions(monkeypatch):
+    """Test that values with the hash of a seen value are compared
+    exactly."""
+    monkeypatch.setattr(
+        uniqueness,
+        "row_hashes",
+        lambda obj: np.zeros(len(obj), dtype=np.uint64),
+    )
+    tracker = DuplicateTracker()
+    assert not tracker.duplicated(pd.Series([1, 2])).any()
+    assert tracker.duplicated(pd.Series([3, 2, 3])).tolist() == [
+        False,
+        True,
+        True,
+    ]
+    assert tracker.duplicated(pd.Series([3, 4])).tolist() == [True, False]
+    assert tracker.n_seen == 4
+
+
+def test_duplicate_tracker_object_types():
+    """Test that values of object columns with the same string
+    representation aren't duplicates across chunks."""
+    assert row_hashes(pd.Series([1, "1"]))[0] != row_hashes(pd.Series(["1"]))
+    schema = pa.DataFrameSchema({"a": pa.Column(object, unique=True)})
+    chunks = [pd.DataFrame({"a": [1, "a"]}), pd.DataFrame({"a": ["1", "b"]})]
+    assert len(list(schema.validate_stream(chunks))) == 2
+    chunks.append(pd.DataFrame({"a": ["c", 1]}))
+    with pytest.raises(SchemaError, match="duplicate values"):
+        list(schema.validate_stream(chunks))
+
+
+@pytest.mark.parametrize("duplicate", [1.0, True])
+def test_duplicate_tracker_equal_numbers(duplicate):
+    """Test that equal numbers of object columns with mostly distinct values
+    are duplicates across chunks."""
+    chunks = [
+        pd.DataFrame(
+            {"a": pd.Series([f"{prefix}{i}" for i in range(20_000)] + [value])}
+        )
+        for prefix, value in [("s", 1), ("t", duplicate)]
+    ]
+    schema = pa.DataFrameSchema({"a": pa.Column(object, unique=True)})
+    with pytest.raises(SchemaError, match="duplicate values"):
+        schema.validate(pd.concat(chunks, ignore_index=True))
+    with pytest.raises(SchemaError, match="duplicate values"):
+        list(schema.validate_stream(chunks))
+    state = IncrementalState()
+    schema.validate_incremental(chunks[0], state)
+    with pytest.raises(SchemaError, match="duplicate values"):
+        schema.validate_incremental(
+            pd.concat(chunks, ignore_index=True), state
+        )
+
+
+def test_bloom_filter():
+    """Test that a Bloom filter has no false negatives and few false
+    positives."""
+    rng = np.random.default_rng(0)
+    hashes = rng.integers(0, 2**63, 20_000, dtype=np.uint64)
+    bloom = BloomFilter(10_000, error_rate=0.01)
+    bloom.add(hashes[:10_000])
+    assert bloom.contains(hashes[:10_000]).all()
+    assert bloom.contains(hashes[10_000:]).mean() < 0.02
+    assert bloom.nbytes < 10_000 * 10 / 8 + 8
+
+
+@pytest.mark.parametrize("keep", ["first", False])
+def test_approximate_unique(keep, monkeypatch):
+    """Test that duplicates of previous blocks are confirmed exactly."""
+    contains = BloomFilter.contains
+
+    def false_positive(self, hashes):
+        # the first value of each block is a false positive
+        seen = contains(self, hashes)
+        seen[0] = True
+        return seen
+
+    monkeypatch.setattr(BloomFilter, "contains", false_positive)
+    df = pd.DataFrame({"a": [1, 2, 3, 4, 5, 1, 6, 6], "b": list("wxyzvwuu")})
+    unique = ApproximateUnique(capacity=100, max_exact=2, block_size=4)
+    expected = [False] * 5 + [True, keep is False, True]
+    assert unique.duplicated(df, keep=keep).tolist() == expected
+    assert unique.duplicated(df.a, keep=keep).tolist() == expected
+
+
+def test_approximate_unique_schemas():
+    """Test validating uniqueness approximately with schemas."""
+    unique = ApproximateUnique(capacity=10, max_exact=1, block_size=2)
+    df = pd.DataFrame({"a": [1, 2, 3, 1], "b": [1, 2, 3, 4]})
+    schema = pa.DataFrameSchema(
+        {"a": pa.Column(int, unique=unique), "b": pa.Column(int)}
+    )
+    with pytest.raises(SchemaError, match="duplicate values"):
+        schema.validate(df)
+    schema.validate(df.iloc[:3])
+    chunks = [df.iloc[:2], df.iloc[2:]]
+    with pytest.raises(SchemaError, match="duplicate values"):
+        list(schema.validate_stream(chunks))
+
+    schema = pa.DataFrameSchema(
+        {"a": pa.Column(int), "b": pa.Column(int)},
+        unique=ApproximateUnique(columns=["a", "b"], block_size=2),
+    )
+    schema.validate(df)
+    with pytest.raises(SchemaError, match="not unique"):
+        schema.validate(pd.concat([df, df.iloc[:1]]))
+    with pytest.raises(SchemaInitError):
+        pa.DataFrameSchema(unique=ApproximateUnique())
+
+
+def test_approximate_duplicate_tracker():
+    """Test that a tracker moves its hashes to a Bloom filter."""
+    tracker = DuplicateTracker(
+        approximate=ApproximateUnique(capacity=100, max_exact=3)
+    )
+    assert not tracker.duplicated(pd.Series([1, 2, 3, 4])).any()
+    assert tracker._filter is not None
+    assert tracker.n_seen == 4
+    assert tracker.duplicated(pd.Series([4, 5])).tolist() == [True, False]
+    assert tracker.n_seen == 5
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"capacity": 0}, {"error_rate": 1}, {"max_exact": -1}, {"block_size": 0}],
+)
+def test_approximate_unique_errors(kwargs):
+    """Test that invalid approximate uniqueness settings raise an error."""
+    with pytest.raises(ValueError):
+        ApproximateUnique(**kwargs)
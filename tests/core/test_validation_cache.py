@@ -0,0 +1,248 @@
+"""Tests for the cache of validations by content fingerprint."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandera import (
+    Category,
+    Check,
+    Column,
+    DataFrameSchema,
+    SeriesSchema,
+    errors,
+)
+from pandera.validation_cache import (
+    ValidationCache,
+    content_fingerprint,
+    schema_fingerprint,
+)
+
+
+def _schema(min_value: int = 0) -> DataFrameSchema:
+    return DataFrameSchema(
+        {
+            "a": Column(int, Check.ge(min_value)),
+            "b": Column(str, Check(lambda s: s.str.len() < 3)),
+        }
+    )
+
+
+def test_schema_fingerprint() -> None:
+    """Test that schemas with the same definition have the same fingerprint."""
+    assert schema_fingerprint(_schema()) == schema_fingerprint(_schema())
+    assert schema_fingerprint(_schema()) != schema_fingerprint(_schema(1))
+
+    def check_less_than(max_value):
+        return Check(lambda s: s < max_value)
+
+    assert schema_fingerprint(
+        SeriesSchema(int, check_less_than(1))
+    ) != schema_fingerprint(SeriesSchema(int, check_less_than(2)))
+    assert schema_fingerprint(SeriesSchema(int)) != schema_fingerprint(
+        SeriesSchema(float)
+    )
+
+    # caches of evaluation strategies aren't part of the fingerprint
+    schema = SeriesSchema(int, Check(lambda x: x > 0, element_wise=True))
+    fingerprint = schema_fingerprint(schema)
+    schema.validate(pd.Series([1, 2]))
+    assert schema_fingerprint(schema) == fingerprint
+
+
+@pytest.mark.parametrize(
+    "obj, other",
+    [
+        [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [1, 3]})],
+        [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"b": [1, 2]})],
+        [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [1.0, 2.0]})],
+        [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [1, 2]}, [1, 2])],
+        [pd.Series(["1", "2"]), pd.Series([1, "2"])],
+        [pd.Series([1, "1"]), pd.Series(["1", 1])],
+        [pd.Series(["a", "b"]), pd.Series(["a", "b"], name="a")],
+        [
+            pd.Series(pd.date_range("2021", periods=2)),
+            pd.Series(pd.date_range("2021", periods=2, tz="UTC")),
+        ],
+        [
+            pd.Series(["a", "b"], dtype=pd.CategoricalDtype(["a", "b"])),
+            pd.Series(["a", "b"], dtype=pd.CategoricalDtype(["a", "b", "c"])),
+        ],
+        [
+            pd.Series(["a", "b"], dtype=pd.CategoricalDtype(["a", "b"])),
+            pd.Series(["a", "b"], dtype=pd.CategoricalDtype(["b", "a"])),
+        ],
+        [
+            pd.Series(["a", "b"], dtype=pd.CategoricalDtype(["a", "b"])),
+            pd.Series(
+                ["a", "b"], dtype=pd.CategoricalDtype(["a", "b"], ordered=True)
+            ),
+        ],
+    ],
+)
+def test_content_fingerprint(obj, other) -> None:
+    """Test that only identical data have the same fingerprint."""
+    assert content_fingerprint(obj) == content_fingerprint(obj.copy())
+    assert content_fingerprint(obj) != content_fingerprint(other)
+
+
+def test_content_fingerprint_unhashable() -> None:
+    """Test that objects with unhashable values have no fingerprint."""
+    assert content_fingerprint(pd.Series([[1], [2]])) is None
+    assert content_fingerprint([1, 2]) is None
+    # objects that may have the same string representation
+    assert content_fingerprint(pd.Series([object()])) is None
+
+
+def test_schema_fingerprint_arrays() -> None:
+    """Test that arrays referenced by checks are fingerprinted by their
+    content."""
+
+    def in_values(values):
+        return Check(lambda s: s.isin(values))
+
+    values = np.arange(5000)
+    other_values = values.copy()
+    other_values[2500] = -1
+    assert schema_fingerprint(in_values(values)) == schema_fingerprint(
+        in_values(values.copy())
+    )
+    assert schema_fingerprint(in_values(values)) != schema_fingerprint(
+        in_values(other_values)
+    )
+    assert schema_fingerprint(in_values(pd.Series(values))) != (
+        schema_fingerprint(in_values(pd.Series(other_values)))
+    )
+
+    schema, other_schema = (
+        SeriesSchema(int, in_values(vals)) for vals in [values, other_values]
+    )
+    cache = ValidationCache()
+    series = pd.Series([2500])
+    cache.validate(schema, series)
+    with pytest.raises(errors.SchemaError):
+        cache.validate(other_schema, series)
+
+
+def test_schema_fingerprint_not_fingerprintable() -> None:
+    """Test that schemas referencing objects whose representation doesn't
+    identify them aren't cached."""
+
+    class Values:  # pylint: disable=too-few-public-methods
+        __slots__ = ["values"]
+
+        def __init__(self, values):
+            self.values = values
+
+        def __repr__(self):
+            return "Values(...)"
+
+    schema = SeriesSchema(
+        int, Check(lambda s, values=Values([1]): s.isin(values.values))
+    )
+    assert schema_fingerprint(schema) is None
+    assert schema.fingerprint is None
+    cache = ValidationCache()
+    for _ in range(2):
+        cache.validate(schema, pd.Series([1]))
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_validation_cache() -> None:
+    """Test that identical data is only validated once."""
+    cache = ValidationCache()
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    schema = _schema()
+
+    validated = cache.validate(schema, df)
+    assert validated is not df
+    pd.testing.assert_frame_equal(validated, df)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    pd.testing.assert_frame_equal(cache.validate(schema, df.copy()), df)
+    assert cache.validate(schema, df, inplace=True) is df
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    # different data, schema or validate arguments
+    cache.validate(schema, df.assign(a=[3, 4]))
+    cache.validate(_schema(1), df)
+    cache.validate(schema, df, head=1)
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    # failed validations aren't cached
+    invalid = df.assign(a=[-1, 2])
+    for _ in range(2):
+        with pytest.raises(errors.SchemaError):
+            cache.validate(schema, invalid)
+    assert (cache.hits, cache.misses) == (2, 6)
+
+
+def test_validation_cache_categories() -> None:
+    """Test that data that only differ by their categories aren't cached
+    together."""
+    cache = ValidationCache()
+    schema = DataFrameSchema({"a": Column(Category(categories=["a", "b"]))})
+    valid = pd.DataFrame({"a": pd.Categorical(["a", "b"])})
+    invalid = pd.DataFrame(
+        {"a": pd.Categorical(["a", "b"], categories=["a", "b", "c"])}
+    )
+    cache.validate(schema, valid)
+    with pytest.raises(errors.SchemaError):
+        schema.validate(invalid)
+    with pytest.raises(errors.SchemaError):
+        cache.validate(schema, invalid)
+    assert cache.hits == 0
+
+
+def test_validation_cache_coercion() -> None:
+    """Test that the validated data of coercing schemas is cached."""
+    cache = ValidationCache()
+    schema = DataFrameSchema({"a": Column(int, coerce=True)})
+    df = pd.DataFrame({"a": ["1", "2"]})
+    for _ in range(2):
+        validated = cache.validate(schema, df)
+        assert validated["a"].tolist() == [1, 2]
+        assert df["a"].tolist() == ["1", "2"]
+    assert cache.hits == 1
+    assert cache.nbytes > 0
+
+    # coercing in-place modifies the data to validate
+    cache = ValidationCache()
+    inplace_df = df.copy()
+    cache.validate(schema, inplace_df, inplace=True)
+    assert cache.validate(schema, df)["a"].tolist() == [1, 2]
+
+
+def test_validation_cache_eviction() -> None:
+    """Test that the least recently used validations are evicted."""
+    schema = SeriesSchema(int, coerce=True)
+    series = [pd.Series([str(i)] * 100) for i in range(3)]
+    cache = ValidationCache(max_entries=2)
+    for data in series + series[2:]:
+        cache.validate(schema, data)
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 3)
+    cache.validate(schema, series[0])
+    assert cache.misses == 4
+
+    max_bytes = cache.nbytes // 2 + 1
+    cache = ValidationCache(max_bytes=max_bytes)
+    for data in series:
+        cache.validate(schema, data)
+    assert len(cache) == 1
+    assert cache.nbytes <= max_bytes
+
+
+def test_validation_cache_directory(tmp_path) -> None:
+    """Test that validations are shared through the cache directory."""
+    schema = DataFrameSchema({"a": Column(int, coerce=True)})
+    df = pd.DataFrame({"a": ["1", "2"]})
+    ValidationCache(directory=tmp_path).validate(schema, df)
+
+    cache = ValidationCache(directory=tmp_path)
+    assert cache.validate(schema, df)["a"].tolist() == [1, 2]
+    assert (cache.hits, cache.misses) == (1, 0)
+
+    cache.clear()
+    assert not list(tmp_path.iterdir())
+    assert len(cache) == 0